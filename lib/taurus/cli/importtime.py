@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Import time profiler (``taurus importtime`` subcommand)"""
+
+from __future__ import print_function
+
+import sys
+import subprocess
+
+import click
+
+
+__all__ = ["ImportTimeNode", "parse_importtime", "profile_import"]
+
+__docformat__ = 'restructuredtext'
+
+
+class ImportTimeNode(object):
+    """An imported module and the modules imported by it"""
+
+    def __init__(self, name, self_us, cumulative_us, children=()):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.children = list(children)
+
+    def __repr__(self):
+        return 'ImportTimeNode(%r, %d, %d)' % (self.name, self.self_us,
+                                               self.cumulative_us)
+
+
+def parse_importtime(text):
+    """Parses the output of ``python -X importtime``
+
+    :param text: (str) the output (stderr) of python
+
+    :return: (list<ImportTimeNode>) the top level imports, in import order
+    """
+    pending = {}  # level -> nodes waiting for their parent
+    for line in text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:  # header
+            continue
+        name = fields[2].rstrip()
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        # the imports are reported after the modules they import
+        node = ImportTimeNode(name.strip(), self_us, cumulative_us,
+                              pending.pop(level + 1, ()))
+        pending.setdefault(level, []).append(node)
+    return pending.get(0, [])
+
+
+def profile_import(statement, python=None):
+    """Runs the given import statement in a new interpreter and returns the
+    import times of all the modules imported by it
+
+    :param statement: (str) python code (e.g. "import taurus")
+    :param python: (str) the python executable (the current one by default)
+
+    :return: (list<ImportTimeNode>) see :func:`parse_importtime`
+    """
+    cmd = [python or sys.executable, '-X', 'importtime', '-c', statement]
+    p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                         universal_newlines=True)
+    _, err = p.communicate()
+    if p.returncode:
+        raise RuntimeError('"%s" failed:\n%s' % (statement, err))
+    return parse_importtime(err)
+
+
+def _format_tree(nodes, min_ms, max_depth, depth=0):
+    lines = []
+    for node in sorted(nodes, key=lambda n: -n.cumulative_us):
+        if node.cumulative_us < min_ms * 1000:
+            continue
+        lines.append('%10.1f %10.1f  %s%s' % (node.cumulative_us / 1000.,
+                                              node.self_us / 1000.,
+                                              '  ' * depth, node.name))
+        if max_depth is None or depth + 1 < max_depth:
+            lines += _format_tree(node.children, min_ms, max_depth,
+                                  depth + 1)
+    return lines
+
+
+@click.command('importtime')
+@click.argument('modules', nargs=-1)
+@click.option('--min-ms', 'min_ms', type=float, default=1., show_default=True,
+              help='hide the modules whose cumulative import time is lower')
+@click.option('--depth', 'max_depth', type=int, default=None,
+              help='maximum depth of the import tree to show')
+def importtime_cmd(modules, min_ms, max_depth):
+    """Show the import time tree of taurus (or of the given MODULES)
+
+    The modules are imported in a new interpreter (python >= 3.7) and the
+    cumulative and self import times (in ms) of each imported module are
+    shown, slowest first.
+    """
+    if sys.version_info < (3, 7):
+        raise click.ClickException('importtime requires python >= 3.7')
+    statement = 'import %s' % ', '.join(modules or ['taurus'])
+    try:
+        nodes = profile_import(statement)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    total = sum(n.cumulative_us for n in nodes) / 1000.
+    click.echo('%10s %10s  %s' % ('cum [ms]', 'self [ms]', 'module'))
+    for line in _format_tree(nodes, min_ms, max_depth):
+        click.echo(line)
+    click.echo('Total: %.1f ms (%s)' % (total, statement))
+
+
+if __name__ == '__main__':
+    importtime_cmd()
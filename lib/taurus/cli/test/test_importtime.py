@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+
+"""Test for taurus.cli.importtime"""
+
+__docformat__ = 'restructuredtext'
+
+import sys
+import unittest
+
+from click.testing import CliRunner
+
+from taurus.cli.importtime import parse_importtime, importtime_cmd
+
+
+_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:        10 |         10 |     c
+import time:        20 |         30 |   b
+import time:         5 |          5 |   d
+import time:       100 |        135 | a
+import time:         7 |          7 | e
+"""
+
+
+class ImportTimeTestCase(unittest.TestCase):
+
+    def test_parse(self):
+        """Check that the import tree is rebuilt from the output"""
+        roots = parse_importtime(_OUTPUT)
+        self.assertEqual([n.name for n in roots], ['a', 'e'])
+        a = roots[0]
+        self.assertEqual((a.self_us, a.cumulative_us), (100, 135))
+        self.assertEqual([n.name for n in a.children], ['b', 'd'])
+        self.assertEqual([n.name for n in a.children[0].children], ['c'])
+
+    @unittest.skipIf(sys.version_info < (3, 7), "requires python >= 3.7")
+    def test_cmd(self):
+        """Check the importtime subcommand"""
+        result = CliRunner().invoke(importtime_cmd,
+                                    ['json', '--min-ms', '0', '--depth', '1'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn(' json\n', result.output)
+        self.assertIn('Total:', result.output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -68,20 +68,72 @@ __all__ = ["TangoAttribute", "TangoAttributeEventListener", "TangoAttrValue"]
 __docformat__ = "restructuredtext"
 
 
+class _TangoDecodePlan(object):
+    """The information needed by :class:`TangoAttrValue` to decode the
+    PyTango.DeviceAttribute objects of a given attribute.
+
+    It is computed once per attribute configuration (see
+    :meth:`TangoAttribute._getDecodePlan`) instead of once per event
+    """
+
+    __slots__ = ('numerical', 'raw', 'units', 'empty_shape', 'empty_dtype',
+                 'empty_as_list')
+
+    def __init__(self, attr):
+        tango_type = attr._tango_data_type
+        data_format = getattr(attr, 'data_format', None)
+        self.numerical = PyTango.is_numerical_type(tango_type, inc_array=True)
+        self.raw = attr.isRawNumeric()
+        self.units = attr._units
+        # spectra and images can be empty without failing
+        if data_format == DataFormat._1D:
+            self.empty_shape = (0,)
+        elif data_format == DataFormat._2D:
+            self.empty_shape = (0, 0)
+        else:
+            self.empty_shape = None
+        self.empty_dtype = FROM_TANGO_TO_NUMPY_TYPE.get(tango_type)
+        self.empty_as_list = not (self.numerical
+                                  or attr.type == DataType.Boolean)
+
+    def emptyValue(self):
+        """Returns the value to be used for an empty spectrum or image"""
+        shape = self.empty_shape
+        if self.empty_as_list:
+            # generate a nested empty list of given shape
+            value = []
+            for _ in range(len(shape) - 1):
+                value = [value]
+            return value
+        return numpy.empty(shape, dtype=self.empty_dtype)
+
+
 class TangoAttrValue(TaurusAttrValue):
     """A TaurusAttrValue specialization to decode PyTango.DeviceAttribute
-    objects
+    objects.
+
+    If the attribute is in raw numeric mode (see
+    :meth:`TangoAttribute.setRawNumeric`), the rvalue and wvalue members of
+    numerical attributes are not wrapped in Quantity objects. The units are
+    then available in the `units` member and the Quantity objects can be
+    obtained with :attr:`rquantity` and :attr:`wquantity`
     """
 
+    __slots__ = ('_attrRef', '__attrName', '__attrType', 'config',
+                 '_pytango_dev_attr', 'units', '__rquantity', '__wquantity')
+
     def __init__(self, attr=None, pytango_dev_attr=None, config=None):
         # config parameter is kept for backwards compatibility only
         TaurusAttrValue.__init__(self)
+        self.units = None
+        self.__rquantity = self.__wquantity = None
         if config is not None:
             from taurus.core.util.log import deprecated
             deprecated(dep='"config" kwarg', alt='"attr"', rel='4.0')
             attr = config
         if attr is None:
             self._attrRef = None
+            self.__attrName = None
             self.__attrType = None
         else:
             self._attrRef = weakref.proxy(attr)
@@ -98,37 +150,24 @@ class TangoAttrValue(TaurusAttrValue):
         if self._attrRef is None:
             return
 
-        numerical = PyTango.is_numerical_type(self._attrRef._tango_data_type,
-                                              inc_array=True)
+        plan = attr._getDecodePlan()
 
         if p.has_failed:
             self.error = PyTango.DevFailed(*p.get_err_stack())
-        else:
-            # spectra and images can be empty without failing
-            if p.is_empty and self._attrRef.data_format != DataFormat._0D:
-                dtype = FROM_TANGO_TO_NUMPY_TYPE.get(
-                    self._attrRef._tango_data_type)
-                if self._attrRef.data_format == DataFormat._1D:
-                    shape = (0,)
-                elif self._attrRef.data_format == DataFormat._2D:
-                    shape = (0, 0)
-                p.value = numpy.empty(shape, dtype=dtype)
-                if not (numerical or self._attrRef.type == DataType.Boolean):
-                    # generate a nested empty list of given shape
-                    p.value = []
-                    for _ in range(len(shape) - 1):
-                        p.value = [p.value]
+        elif p.is_empty and plan.empty_shape is not None:
+            p.value = plan.emptyValue()
 
         # Protect against DeviceAttribute not providing .value in some cases,
         # seen e.g. in PyTango 9.3.0
         rvalue = getattr(p, 'value', None)
         wvalue = getattr(p, 'w_value', None)
-        if numerical:
-            units = self._attrRef._units
-            if rvalue is not None:
-                rvalue = Quantity(rvalue, units=units)
-            if wvalue is not None:
-                wvalue = Quantity(wvalue, units=units)
+        if plan.numerical:
+            self.units = units = plan.units
+            if not plan.raw:
+                if rvalue is not None:
+                    rvalue = Quantity(rvalue, units=units)
+                if wvalue is not None:
+                    wvalue = Quantity(wvalue, units=units)
         elif isinstance(rvalue, PyTango._PyTango.DevState):
             rvalue = DevState[str(rvalue)]
 
@@ -137,6 +176,33 @@ class TangoAttrValue(TaurusAttrValue):
         self.time = p.time  # TODO: decode this into a TaurusTimeVal
         self.quality = quality_from_tango(p.quality)
 
+    def __toQuantity(self, value, cached):
+        """Returns value as a Quantity, reusing the cached one if it wraps
+        the same value"""
+        if value is None or self.units is None or isinstance(value, Quantity):
+            return value
+        if cached is not None and cached.magnitude is value:
+            return cached
+        return Quantity(value, units=self.units)
+
+    @property
+    def rquantity(self):
+        """The rvalue as a Quantity (for numerical attributes) even if the
+        attribute is in raw numeric mode. The Quantity is created only
+        when first requested"""
+        self.__rquantity = q = self.__toQuantity(self.rvalue,
+                                                 self.__rquantity)
+        return q
+
+    @property
+    def wquantity(self):
+        """The wvalue as a Quantity (for numerical attributes) even if the
+        attribute is in raw numeric mode. The Quantity is created only
+        when first requested"""
+        self.__wquantity = q = self.__toQuantity(self.wvalue,
+                                                 self.__wquantity)
+        return q
+
     def __getattr__(self, name):
         """
         If the member `name` is not defined in this class, try to get it
@@ -311,6 +377,8 @@ class TangoAttribute(TaurusAttribute):
         self.display_level = display_level_from_tango(dis_level)
         self.tango_writable = PyTango.AttrWriteType.READ
         self._units = self._unit_from_tango(PyTango.constants.UnitNotSpec)
+        self._decode_plan = None
+        self._raw_numeric = None
         # decode the Tango configuration attribute (adds extra members)
         self._pytango_attrinfoex = None
         self._decodeAttrInfoEx(attr_info)
@@ -318,7 +386,10 @@ class TangoAttribute(TaurusAttribute):
         # subscribe to configuration events (unsubscription done at cleanup)
         self.__cfg_evt_id = None
         if self.factory().is_tango_subscribe_enabled():
-            self._subscribeConfEvents()
+            if parent and self.factory().is_tango_batch_subscription_enabled():
+                parent.enqueueSubscription(self)
+            else:
+                self._subscribeConfEvents()
 
     def __del__(self):
         self.cleanUp()
@@ -680,6 +751,13 @@ class TangoAttribute(TaurusAttribute):
             self.enablePolling(True)
             return       
 
+        if self.factory().is_tango_batch_subscription_enabled():
+            # poll until the parent device subscribes to the events
+            self.__subscription_state = SubscriptionState.PendingSubscribe
+            self._activatePolling()
+            self.getParentObj().enqueueSubscription(self)
+            return
+
         try:
             self.__subscription_state = SubscriptionState.Subscribing
             self._call_dev_hw_subscribe_event(False)
@@ -797,6 +875,21 @@ class TangoAttribute(TaurusAttribute):
         self._subscribeConfEvents()
         self._call_dev_hw_subscribe_event(True)
 
+    def _subscribeEnqueuedEvents(self):
+        """ Execute the event subscriptions scheduled with
+        :meth:`TangoDevice.enqueueSubscription`
+        """
+        if self.__cfg_evt_id is None:
+            self._subscribeConfEvents()
+        if (self.__chg_evt_id is not None
+                or self.__subscription_state != SubscriptionState.PendingSubscribe
+                or not self.hasListeners()):
+            return
+        try:
+            self._call_dev_hw_subscribe_event(False)
+        except:
+            self._call_dev_hw_subscribe_event(True)
+
     def push_event(self, event):
         """Method invoked by the PyTango layer when an event occurs.
         It propagates the event to listeners and delegates other tasks to
@@ -814,7 +907,7 @@ class TangoAttribute(TaurusAttribute):
             if etype is None:
                 return
             manager = Manager()
-            listeners = tuple(self._listeners)
+            listeners = self._listeners.snapshot()
             sm = self._serialization_mode
             if sm == TaurusSerializationMode.TangoSerial:
                 self.fireEvent(etype, evalue, listeners=listeners)
@@ -1082,6 +1175,48 @@ class TangoAttribute(TaurusAttribute):
         # TangoAttrValue for performance reasons. Do not rely on it in other
         # code
         self._units = units
+        # the decode plan depends on the configuration: force its rebuild
+        self._decode_plan = None
+
+    def setRawNumeric(self, raw):
+        """Sets the raw numeric mode of this attribute. In raw numeric mode,
+        the read and write values of numerical attributes are not
+        wrapped in Quantity objects (see :class:`TangoAttrValue`)
+
+        :param raw: (bool or None) True to enable the raw numeric mode. None
+                    means to use the default of the factory (see
+                    :meth:`TangoFactory.set_tango_raw_numeric_enabled`)
+        """
+        self._raw_numeric = raw
+        self._decode_plan = None
+
+    def isRawNumeric(self):
+        """Returns True if the values of this attribute are decoded in raw
+        numeric mode (see :meth:`setRawNumeric`)
+
+        :return: (bool)
+        """
+        if self._raw_numeric is None:
+            return self.factory().is_tango_raw_numeric_enabled()
+        return self._raw_numeric
+
+    @property
+    def rquantity(self):
+        """The rvalue of this attribute as a Quantity, also in raw numeric
+        mode (see :attr:`TangoAttrValue.rquantity`)"""
+        valueObj = self.getValueObj()
+        if valueObj is None:
+            return None
+        return valueObj.rquantity
+
+    def _getDecodePlan(self):
+        """Returns the :class:`_TangoDecodePlan` used by
+        :class:`TangoAttrValue` to decode the values of this attribute.
+        It is cached until the attribute configuration changes"""
+        plan = self._decode_plan
+        if plan is None:
+            self._decode_plan = plan = _TangoDecodePlan(self)
+        return plan
 
     @property
     @deprecation_decorator(alt='format_spec or precision', rel='4.0.4')
@@ -28,11 +28,17 @@
 from builtins import object
 
 import time
-from PyTango import (DeviceProxy, DevFailed, LockerInfo, DevState)
+import weakref
+import threading
+from PyTango import (DeviceProxy, DevFailed, LockerInfo, DevState,
+                     NamedDevFailedList)
 
+from taurus import Manager
 from taurus.core.taurusdevice import TaurusDevice
 from taurus.core.taurusbasetypes import (TaurusDevState, TaurusLockInfo,
-                                         LockStatus, TaurusEventType)
+                                         LockStatus, TaurusEventType,
+                                         TaurusSerializationMode)
+from taurus.core.util.event import _BoundMethodWeakrefWithCall
 from taurus.core.util.log import taurus4_deprecation
 
 
@@ -70,6 +76,11 @@ class TangoDevice(TaurusDevice):
         self._deviceStateObj = None
         # TODO reimplement using the new codification
         self._deviceState = TaurusDevState.Undefined
+        # attributes (weakrefs) whose event subscription is pending
+        self._pendingSubscriptions = []
+        self._pendingSubscriptionsLock = threading.Lock()
+        self._subscribing = False
+        self._subscriptionStats = None
 
     # Export the DeviceProxy interface into this object.
     # This way we can call for example read_attribute on an object of this
@@ -143,6 +154,14 @@ class TangoDevice(TaurusDevice):
 
         :return: (TaurusDevState)
         """
+        return self.__readState(cache)
+
+    def state_async(self, cache=False):
+        """Reimplemented from :class:`TaurusDevice` to read the state
+        attribute bypassing the cache if `cache` is False"""
+        return Manager().submitJob(self.__readState, cache)
+
+    def __readState(self, cache=True):
         self._deviceState = TaurusDevState.NotReady
         try:
             taurus_tango_state = self.stateObj.read(cache).rvalue
@@ -380,6 +399,114 @@ class TangoDevice(TaurusDevice):
             result = e
         self.__pollResult(attrs, ts, result, error=error)
 
+    def writeAttributes(self, attr_values, with_read=True):
+        """Writes several attributes of this device in a single
+        `write_attributes` call (instead of one network round trip per
+        attribute) and, if `with_read` is True, reads back in a single
+        `read_attributes` call those which are read-write and not updated
+        by events.
+
+        See :meth:`TaurusDevice.writeAttributes`
+        """
+        errors = [None] * len(attr_values)
+        names, values, idxs = [], [], []
+        for i, (attr, value) in enumerate(attr_values):
+            try:
+                values.append(attr.encode(value))
+            except Exception as e:
+                attr.error("[Tango] write failed: %s" % str(e))
+                errors[i] = e
+                continue
+            names.append(attr.getSimpleName())
+            idxs.append(i)
+        if not idxs:
+            return errors
+
+        try:
+            self.write_attributes(list(zip(names, values)))
+        except NamedDevFailedList as nfl:
+            for nf in nfl.err_list:
+                errors[idxs[nf.idx_in_call]] = DevFailed(*nf.err_stack)
+        except DevFailed as df:
+            for i in idxs:
+                errors[i] = df
+        for i in idxs:
+            if errors[i] is not None:
+                attr = attr_values[i][0]
+                err = errors[i].args[0]
+                attr.error("[Tango] write failed (%s): %s" %
+                           (err.reason, err.desc))
+
+        if with_read:
+            attrs = {}
+            for i, name in zip(idxs, names):
+                attr = attr_values[i][0]
+                if (errors[i] is None and attr.isReadWrite()
+                        and not attr.isUsingEvents()):
+                    attrs[name] = attr
+            if attrs:
+                self.poll(attrs)
+        return errors
+
+    def enqueueSubscription(self, attr):
+        """Schedules the event subscription of the given attribute of this
+        device. The pending subscriptions of the device are done one after
+        the other by a worker thread of the TaurusManager (so that the
+        calling thread is not blocked by the subscription round trips).
+        At most one batch runs at a time for each device. If no worker
+        thread is available, the subscriptions are done in the calling
+        thread.
+
+        :param attr: (TangoAttribute) the attribute
+        """
+        with self._pendingSubscriptionsLock:
+            self._pendingSubscriptions.append(weakref.ref(attr))
+            schedule = not self._subscribing
+            self._subscribing = True
+        if schedule:
+            job = _BoundMethodWeakrefWithCall(self._subscribePending)
+            mode = TaurusSerializationMode.Concurrent
+            if not Manager().enqueueJob(job, serialization_mode=mode):
+                self._subscribePending()
+
+    def _subscribePending(self):
+        """Executes the pending event subscriptions of this device until
+        there are none left (including those enqueued meanwhile). Called
+        from a worker thread (see :meth:`enqueueSubscription`)"""
+        t0 = time.time()
+        n = 0
+        while True:
+            with self._pendingSubscriptionsLock:
+                refs = self._pendingSubscriptions
+                self._pendingSubscriptions = []
+                if not refs:
+                    self._subscribing = False
+                    break
+            for ref in refs:
+                attr = ref()
+                if attr is None:
+                    continue
+                try:
+                    attr._subscribeEnqueuedEvents()
+                    n += 1
+                except Exception:
+                    self.debug("Failed to subscribe to %s events", attr,
+                               exc_info=1)
+        elapsed = time.time() - t0
+        self._subscriptionStats = (n, elapsed)
+        self.debug("Subscribed to events of %d attributes in %.3f s",
+                   n, elapsed)
+
+    def getSubscriptionStats(self):
+        """Returns the statistics of the last batch of event subscriptions
+        done for this device (see :meth:`enqueueSubscription`)
+
+        :return: (tuple<int,float> or None) number of subscribed attributes
+                 and time (in s) it took to subscribe them. None if no batch
+                 has been done yet
+        """
+        return self._subscriptionStats
+
     def _repr_html_(self):
         try:
             info = self.getDeviceProxy().info()
@@ -115,6 +115,10 @@ class TangoFactory(Singleton, TaurusFactory, Logger):
         self._serialization_mode = TaurusSerializationMode.get(
             getattr(tauruscustomsettings, 'TANGO_SERIALIZATION_MODE',
                     'TangoSerial'))
+        self._tango_batch_subscription_enabled = getattr(
+            tauruscustomsettings, 'TANGO_BATCH_SUBSCRIPTION', False)
+        self._tango_raw_numeric_enabled = getattr(
+            tauruscustomsettings, 'TANGO_RAW_NUMERIC', False)
 
     def reInit(self):
         """Reinitialize the singleton"""
@@ -217,6 +221,34 @@ class TangoFactory(Singleton, TaurusFactory, Logger):
         """
         return self._tango_subscribe_enabled
 
+    def set_tango_batch_subscription_enabled(self, value):
+        """ If True, the event subscriptions of TangoAttribute objects are
+        done in batches (per device) by a worker thread instead of when the
+        attribute is created or listened. Until subscribed, the attributes
+        are polled. See :meth:`TangoDevice.enqueueSubscription`
+        """
+        self._tango_batch_subscription_enabled = value
+
+    def is_tango_batch_subscription_enabled(self):
+        """ Returns the current tango_batch_subscription_enabled status
+        """
+        return self._tango_batch_subscription_enabled
+
+    def set_tango_raw_numeric_enabled(self, value):
+        """ If True, the values of numerical attributes are not wrapped in
+        Quantity objects by default (it can be changed per attribute with
+        :meth:`TangoAttribute.setRawNumeric`).
+        The change affects the values decoded after the call only
+        """
+        self._tango_raw_numeric_enabled = value
+        for attr in list(self.tango_attrs.values()):
+            attr._decode_plan = None
+
+    def is_tango_raw_numeric_enabled(self):
+        """ Returns the current tango_raw_numeric_enabled status
+        """
+        return self._tango_raw_numeric_enabled
+
     def registerAttributeClass(self, attr_name, attr_klass):
         """Registers a new attribute class for the attribute name.
 
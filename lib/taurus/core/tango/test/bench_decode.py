@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+"""Micro-benchmark of the decoding of PyTango.DeviceAttribute objects into
+:class:`TangoAttrValue` objects. It does not need a running Tango DS.
+
+Usage::
+
+    python -m taurus.core.tango.test.bench_decode [nevents]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+
+import numpy
+import PyTango
+
+from taurus.core.units import UR
+from taurus.core.taurusbasetypes import DataFormat, DataType
+from taurus.core.tango.tangoattribute import TangoAttrValue, _TangoDecodePlan
+
+__all__ = ["FakeAttribute", "deviceAttribute", "benchDecode"]
+
+
+class FakeAttribute(object):
+    """Minimal stand-in of a :class:`TangoAttribute`, providing only what is
+    needed by :class:`TangoAttrValue` to decode a value"""
+
+    def __init__(self, tango_data_type=PyTango.CmdArgType.DevDouble,
+                 data_format=DataFormat._0D, units='mm', raw=False):
+        self._tango_data_type = tango_data_type
+        self.data_format = data_format
+        self.type = DataType.Float
+        self._units = UR.parse_units(units)
+        self._raw = raw
+        self._decode_plan = None
+
+    def isRawNumeric(self):
+        return self._raw
+
+    def getFullName(self):
+        return 'tango://fake:10000/a/b/c/attr'
+
+    def _getDecodePlan(self):
+        if self._decode_plan is None:
+            self._decode_plan = _TangoDecodePlan(self)
+        return self._decode_plan
+
+
+def deviceAttribute(value):
+    """Returns a valid PyTango.DeviceAttribute with the given read and write
+    value"""
+    p = PyTango.DeviceAttribute()
+    p.value = value
+    p.w_value = value
+    p.quality = PyTango.AttrQuality.ATTR_VALID
+    p.time = PyTango.TimeVal.fromtimestamp(time.time())
+    return p
+
+
+def benchDecode(nevents=100000, value=1.0, **kwargs):
+    """Decode `nevents` DeviceAttribute objects with the given value and
+    return the number of decoded events per second.
+
+    :param nevents: (int) number of events to decode
+    :param value: the read and write value of the events
+    :param kwargs: keyword arguments passed to :class:`FakeAttribute`
+
+    :return: (float) decoded events per second
+    """
+    attr = FakeAttribute(**kwargs)
+    p = deviceAttribute(value)
+    t0 = time.time()
+    for _ in range(nevents):
+        TangoAttrValue(attr=attr, pytango_dev_attr=p)
+    return nevents / (time.time() - t0)
+
+
+def main():
+    nevents = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    spectrum = dict(value=numpy.arange(1024.), data_format=DataFormat._1D)
+    for raw in (False, True):
+        mode = 'raw' if raw else 'quantity'
+        print("scalar (%s): %10.0f events/s"
+              % (mode, benchDecode(nevents, raw=raw)))
+        print("spectrum (%s): %8.0f events/s"
+              % (mode, benchDecode(nevents, raw=raw, **spectrum)))
+
+
+if __name__ == "__main__":
+    main()
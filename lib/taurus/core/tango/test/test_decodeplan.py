@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+"""Tests for the decoding plans of Tango attributes"""
+
+__docformat__ = 'restructuredtext'
+
+import unittest
+
+import PyTango
+
+from taurus.core.taurusattribute import TaurusAttribute
+from taurus.core.taurusbasetypes import DataFormat
+from taurus.core.units import Quantity, UR
+from taurus.core.tango.tangoattribute import TangoAttribute, TangoAttrValue
+from taurus.core.tango.test.bench_decode import FakeAttribute, deviceAttribute
+
+
+def _infoEx(unit='mm', fmt='%6.2f', data_format=PyTango.AttrDataFormat.SCALAR):
+    i = PyTango.AttributeInfoEx()
+    i.data_type = PyTango.CmdArgType.DevDouble
+    i.data_format = data_format
+    i.unit = unit
+    i.format = fmt
+    return i
+
+
+class _ConfigAttribute(FakeAttribute):
+    """A FakeAttribute whose configuration is decoded with the code of
+    TangoAttribute"""
+
+    _decodeAttrInfoEx = TangoAttribute.__dict__['_decodeAttrInfoEx']
+    _unit_from_tango = TangoAttribute.__dict__['_unit_from_tango']
+    isNumeric = TaurusAttribute.__dict__['isNumeric']
+
+    def setConfig(self, infoex):
+        """Simulates a configuration event"""
+        self._tango_data_type = infoex.data_type
+        self._decodeAttrInfoEx(infoex)
+
+
+class DecodePlanTestCase(unittest.TestCase):
+    """TestCase for the caching of the decoding plan of an attribute and
+    its rebuild on configuration changes"""
+
+    def setUp(self):
+        self.attr = _ConfigAttribute()
+        self.attr.setConfig(_infoEx())
+
+    def _decode(self, value=1.5):
+        return TangoAttrValue(attr=self.attr,
+                              pytango_dev_attr=deviceAttribute(value))
+
+    def test_plan(self):
+        """check that the plan matches the configuration and is cached"""
+        plan = self.attr._getDecodePlan()
+        self.assertTrue(plan.numerical)
+        self.assertFalse(plan.raw)
+        self.assertEqual(plan.units, UR.parse_units('mm'))
+        self.assertIsNone(plan.empty_shape)
+        self.assertIs(self.attr._getDecodePlan(), plan)
+        self.assertEqual(self._decode().rvalue, Quantity(1.5, 'mm'))
+
+    def test_unitsChange(self):
+        """check that the decoded values follow a change of units"""
+        plan = self.attr._getDecodePlan()
+        self.attr.setConfig(_infoEx(unit='V'))
+        self.assertIsNot(self.attr._getDecodePlan(), plan)
+        v = self._decode()
+        self.assertEqual(v.rvalue, Quantity(1.5, 'V'))
+        self.assertEqual(v.wvalue.units, UR.parse_units('V'))
+
+    def test_formatChange(self):
+        """check that the plan is rebuilt when the format changes"""
+        plan = self.attr._getDecodePlan()
+        self.attr.setConfig(_infoEx(fmt='%6.3f'))
+        self.assertEqual(self.attr.format_spec, '6.3f')
+        self.assertIsNot(self.attr._getDecodePlan(), plan)
+        self.assertEqual(self._decode().rvalue, Quantity(1.5, 'mm'))
+
+    def test_dataFormatChange(self):
+        """check that the plan follows a change of data format"""
+        self.attr.setConfig(
+            _infoEx(data_format=PyTango.AttrDataFormat.SPECTRUM))
+        self.assertEqual(self.attr.data_format, DataFormat._1D)
+        self.assertEqual(self.attr._getDecodePlan().empty_shape, (0,))
+
+    def test_unitless(self):
+        """check that an unspecified unit gives unitless values"""
+        self.attr.setConfig(_infoEx(unit=PyTango.constants.UnitNotSpec))
+        self.assertEqual(self._decode().rvalue, Quantity(1.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -29,6 +29,7 @@
 
 __docformat__ = 'restructuredtext'
 
+import time
 import numpy
 import PyTango
 import unittest
@@ -40,7 +41,7 @@ from taurus.core import DataType, DataFormat
 from taurus.core.tango.tangoattribute import TangoAttrValue
 from taurus.core.tango.test import TangoSchemeTestLauncher
 from taurus.test import insertTest
-from taurus.core.taurusbasetypes import AttrQuality
+from taurus.core.taurusbasetypes import AttrQuality, SubscriptionState
 
 _INT_IMG = numpy.arange(2 * 3, dtype='int16').reshape((2, 3))
 _INT_SPE = _INT_IMG[1, :]
@@ -829,6 +830,20 @@ class AttributeTestCase(TangoSchemeTestLauncher, unittest.TestCase):
                    (attrname, expectedshape, read_value.rvalue.shape))
             self.assertEqual(read_value.rvalue.shape, expectedshape, msg)
 
+    def test_raw_numeric(self):
+        """check the values read from an attribute in raw numeric mode"""
+        a = taurus.Attribute('%s/short_scalar_ro' % self.DEV_NAME)
+        a.setRawNumeric(True)
+        try:
+            read_value = a.read(cache=False)
+        finally:
+            a.setRawNumeric(None)
+        self.assertFalse(isinstance(read_value.rvalue, Quantity))
+        self.assertEqual(read_value.rvalue, 123)
+        self.assertEqual(read_value.units, UR.parse_units('mm'))
+        self.assertEqual(read_value.rquantity, Quantity(123, 'mm'))
+        self.assertTrue(read_value.rquantity is read_value.rquantity)
+
     def __assertValidValue(self, exp, got, msg):
         # if we are dealing with quantities, use the magnitude for comparing
         if isinstance(got, Quantity):
@@ -849,5 +864,55 @@ class AttributeTestCase(TangoSchemeTestLauncher, unittest.TestCase):
 
         self.assertTrue(chk, msg)
 
+
+class _Listener(object):
+
+    def __init__(self):
+        self.events = []
+
+    def eventReceived(self, src, evt_type, evt_value):
+        self.events.append((src, evt_type))
+
+
+class BatchSubscriptionTestCase(TangoSchemeTestLauncher, unittest.TestCase):
+    """TestCase for the batched event subscriptions of Tango attributes"""
+
+    ATTR_NAMES = ('short_scalar_ro', 'float_scalar_ro', 'double_scalar')
+
+    def setUp(self):
+        self.factory = taurus.Factory('tango')
+        self._enabled = self.factory.is_tango_batch_subscription_enabled()
+        self.factory.set_tango_batch_subscription_enabled(True)
+        self.listener = _Listener()
+        self.attrs = []
+
+    def tearDown(self):
+        for a in self.attrs:
+            a.removeListener(self.listener)
+        self.factory.set_tango_batch_subscription_enabled(self._enabled)
+        TangoSchemeTestLauncher.tearDown(self)
+
+    def test_batch(self):
+        """check that the subscriptions of the attributes of a device are
+        done in background and that the attributes get events"""
+        for name in self.ATTR_NAMES:
+            a = taurus.Attribute('%s/%s' % (self.DEV_NAME, name))
+            self.attrs.append(a)
+            a.addListener(self.listener)
+            self.assertIn(a.getSubscriptionState(),
+                          (SubscriptionState.PendingSubscribe,
+                           SubscriptionState.Subscribed))
+        t0 = time.time()
+        while (not all(a.isUsingEvents() for a in self.attrs)
+               and time.time() - t0 < 10):
+            time.sleep(.05)
+        self.assertTrue(all(a.isUsingEvents() for a in self.attrs))
+        stats = self.attrs[0].getParentObj().getSubscriptionStats()
+        self.assertIsNotNone(stats)
+        self.assertGreaterEqual(stats[0], 1)
+        sources = set(src for src, _ in self.listener.events)
+        self.assertEqual(sources, set(self.attrs))
+
+
 if __name__ == '__main__':
     pass
@@ -26,5 +26,6 @@
 """The sardana package. It contains specific part of sardana"""
 from __future__ import absolute_import
 from .formatter import tangoFormatter
+from .modelresolver import TangoModelResolver
 
 __docformat__ = 'restructuredtext'
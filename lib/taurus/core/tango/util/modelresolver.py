@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##
+# This file is part of Taurus, a Tango User Interface Library
+##
+# http://www.tango-controls.org/static/taurus/latest/doc/html/index.html
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module provides a resolver of (wildcard) Tango model expressions
+(e.g. ``sys/tg_test/*/double_*``) into attribute names"""
+
+__all__ = ["TangoModelResolver"]
+
+__docformat__ = "restructuredtext"
+
+import re
+import time
+import threading
+
+from future.utils import string_types
+from queue import Queue
+
+import taurus
+from taurus import tauruscustomsettings
+from taurus.core.util.log import Logger
+from taurus.core.util.singleton import Singleton
+from taurus.core.util.containers import CaselessDict
+
+_PATTERN_CHARS = '.*[]()+?'
+
+
+def _isPattern(expr):
+    return any(c in expr for c in _PATTERN_CHARS)
+
+
+class TangoModelResolver(Singleton, Logger):
+    """Singleton that expands model expressions containing wildcards or
+    regular expressions (for the device and/or attribute parts) into the
+    list of matching attribute names.
+
+    The exported device list of the Tango database and the attribute lists
+    of the devices are cached for :meth:`getTTL` seconds, the patterns are
+    compiled only once and the attribute lists of different devices are
+    queried concurrently. It is meant to be shared by all the widgets that
+    accept model patterns (e.g. :class:`TaurusGrid`)::
+
+        >>> resolver = TangoModelResolver()
+        >>> resolver.resolve('sys/tg_test/*/double_*')
+        ['sys/tg_test/1/double_scalar', 'sys/tg_test/1/double_spectrum', ...]
+    """
+
+    #: maximum number of threads used for querying the attribute lists
+    MAX_WORKERS = 10
+
+    def __init__(self):
+        """ Initialization. Nothing to be done here for now."""
+        pass
+
+    def init(self, *args, **kwargs):
+        """Singleton instance initialization."""
+        self.call__init__(Logger, self.__class__.__name__)
+        self._ttl = getattr(tauruscustomsettings,
+                            'TANGO_MODEL_RESOLVER_TTL', 60)
+        self._lock = threading.Lock()
+        self._patterns = {}
+        self.clearCache()
+
+    def getTTL(self):
+        """Returns the time (in s) that device and attribute lists are cached
+
+        :return: (float)
+        """
+        return self._ttl
+
+    def setTTL(self, ttl):
+        """Sets the time (in s) that device and attribute lists are cached
+
+        :param ttl: (float) time to live of the cached lists. Use 0 to
+                    disable the cache
+        """
+        self._ttl = ttl
+
+    def clearCache(self):
+        """Discards all cached device and attribute lists"""
+        with self._lock:
+            self._exported = CaselessDict()
+            self._attrinfos = CaselessDict()
+
+    def _getCached(self, cache, key):
+        with self._lock:
+            entry = cache.get(key)
+        if entry is None or time.time() - entry[0] > self._ttl:
+            return None
+        return entry[1]
+
+    def _setCached(self, cache, key, value):
+        with self._lock:
+            cache[key] = (time.time(), value)
+
+    def getPattern(self, expr):
+        """Returns a compiled (case insensitive) regular expression for the
+        given expression. "*" is accepted as a shortcut for ".*"
+
+        :param expr: (str) the expression
+
+        :return: (re.RegexObject)
+        """
+        try:
+            return self._patterns[expr]
+        except KeyError:
+            regexp = expr
+            if '*' in regexp and '.*' not in regexp:
+                regexp = regexp.replace('*', '.*')
+            pattern = self._patterns[expr] = re.compile(regexp, re.I)
+            return pattern
+
+    def getExportedDevices(self, authority=None, cache=True):
+        """Returns the names of the devices exported in a Tango database
+
+        :param authority: (TangoAuthority) the database. If None, the
+                          default authority is used
+        :param cache: (bool) if False, the cached list is not used
+
+        :return: (list<str>)
+        """
+        if authority is None:
+            authority = taurus.Authority()
+        key = authority.getFullName()
+        devs = self._getCached(self._exported, key) if cache else None
+        if devs is None:
+            devs = list(authority.get_device_exported('*'))
+            self._setCached(self._exported, key, devs)
+        return devs
+
+    def getAttributeInfos(self, device, cache=True):
+        """Returns the attribute information list of a device (as returned by
+        `attribute_list_query`)
+
+        :param device: (str) the device name
+        :param cache: (bool) if False, the cached list is not used
+
+        :return: (list<PyTango.AttributeInfo>)
+        """
+        infos = self._getCached(self._attrinfos, device) if cache else None
+        if infos is None:
+            dev = taurus.Factory('tango').getDevice(device)
+            infos = list(dev.attribute_list_query())
+            self._setCached(self._attrinfos, device, infos)
+        return infos
+
+    def _queryAttributeInfos(self, devices):
+        """Returns a dictionary with the attribute lists of the given devices
+        (None for the devices that cannot be queried). The devices whose
+        list is not cached are queried concurrently"""
+        result = {}
+        queue = Queue()
+        for d in devices:
+            result[d] = self._getCached(self._attrinfos, d)
+            if result[d] is None:
+                queue.put(d)
+        if queue.empty():
+            return result
+
+        def work():
+            while True:
+                try:
+                    d = queue.get_nowait()
+                except Exception:
+                    return
+                try:
+                    result[d] = self.getAttributeInfos(d, cache=False)
+                except Exception as e:
+                    self.debug('Unable to get attributes for %s: %r', d, e)
+
+        nworkers = min(self.MAX_WORKERS, queue.qsize())
+        workers = [threading.Thread(target=work) for _ in range(nworkers)]
+        for w in workers:
+            w.daemon = True
+            w.start()
+        for w in workers:
+            w.join()
+        return result
+
+    def resolve(self, expressions, limit=None, attr_filter=None):
+        """Returns the attribute names matching the given expressions.
+
+        Each expression is of the form `device[/attribute]` (`State` is used
+        if the attribute is not given) where both the device and the
+        attribute part may contain wildcards or regular expressions.
+
+        :param expressions: (str or sequence<str>) model expressions (a
+                            string is split by commas)
+        :param limit: (int or None) maximum number of models to return
+        :param attr_filter: (callable or None) if given, only the attributes
+                            for whose info (as returned by
+                            :meth:`getAttributeInfos`) it returns True are
+                            included when the attribute part is a pattern
+
+        :return: (list<str>) matching attribute names
+        """
+        if isinstance(expressions, string_types):
+            expressions = expressions.split(',')
+        expressions = [str(e) for e in expressions]
+
+        targets = []
+        to_query = set()
+        all_devs = None
+        for exp in expressions:
+            if exp.count('/') == 3:
+                device, attribute = exp.rsplit('/', 1)
+            else:
+                device, attribute = exp, 'State'
+            if _isPattern(device):
+                if all_devs is None:
+                    all_devs = self.getExportedDevices()
+                pattern = self.getPattern(device)
+                devs = [d for d in all_devs if pattern.match(d)]
+            else:
+                devs = [device]
+            if _isPattern(attribute):
+                to_query.update(devs)
+            targets.append((devs, attribute))
+
+        attrinfos = self._queryAttributeInfos(to_query)
+
+        models = []
+        for devs, attribute in targets:
+            if not _isPattern(attribute):
+                models.extend(dev + '/' + attribute for dev in devs)
+                continue
+            pattern = self.getPattern(attribute)
+            for dev in devs:
+                infos = attrinfos.get(dev)
+                if infos is None:
+                    continue
+                try:
+                    models.extend(dev + '/' + a.name for a in infos
+                                  if pattern.match(a.name)
+                                  and (attr_filter is None or attr_filter(a)))
+                except Exception as e:
+                    self.debug('Unable to get attributes for %s: %r', dev, e)
+        if limit is not None:
+            models = models[:limit]
+        return models
@@ -145,8 +145,15 @@ def display_level_from_tango(disp_level):
     return DisplayLevel(disp_level)
 
 
+__QUALITIES = {}
+
+
 def quality_from_tango(quality):
-    return AttrQuality(int(quality))
+    try:
+        return __QUALITIES[quality]
+    except KeyError:
+        ret = __QUALITIES[quality] = AttrQuality(int(quality))
+        return ret
 
 
 __NULL_DESC = PyTango.constants.DescNotSet, PyTango.constants.DescNotSpec
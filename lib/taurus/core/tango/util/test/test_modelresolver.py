@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Test for taurus.core.tango.util.modelresolver"""
+
+__docformat__ = 'restructuredtext'
+
+import time
+import unittest
+
+from taurus.core.tango.util import modelresolver
+from taurus.core.tango.util.modelresolver import TangoModelResolver
+
+
+class _AttrInfo(object):
+    """Stand-in for the PyTango.AttributeInfo objects"""
+
+    def __init__(self, name, writable=False):
+        self.name = name
+        self.writable = writable
+
+
+_DEVICES = {
+    'test/dev/1': [_AttrInfo('State'), _AttrInfo('double_scalar', True),
+                   _AttrInfo('double_spectrum'), _AttrInfo('short_scalar')],
+    'test/dev/2': [_AttrInfo('State'), _AttrInfo('double_scalar')],
+    'other/dev/1': [_AttrInfo('State'), _AttrInfo('double_image', True)],
+    'test/broken/1': None,
+}
+
+
+class _FakeTango(object):
+    """Stand-in for the taurus module used by the resolver. It plays the
+    roles of the Tango authority, factory and devices, and records the
+    queries done to them"""
+
+    def __init__(self):
+        self.queries = []
+
+    def Authority(self):
+        return self
+
+    def Factory(self, scheme):
+        return self
+
+    def getFullName(self):
+        return 'tango://fake:10000'
+
+    def get_device_exported(self, pattern):
+        self.queries.append('*')
+        return sorted(_DEVICES)
+
+    def getDevice(self, name):
+        return _FakeDevice(self, name)
+
+
+class _FakeDevice(object):
+
+    def __init__(self, fake, name):
+        self._fake = fake
+        self._name = name
+
+    def attribute_list_query(self):
+        self._fake.queries.append(self._name)
+        infos = _DEVICES[self._name]
+        if infos is None:
+            raise RuntimeError('%s is not running' % self._name)
+        return infos
+
+
+class TangoModelResolverTestCase(unittest.TestCase):
+    """TestCase for the TangoModelResolver (with a stubbed Tango
+    database and devices)"""
+
+    def setUp(self):
+        self._taurus = modelresolver.taurus
+        self.fake = modelresolver.taurus = _FakeTango()
+        self.resolver = TangoModelResolver()
+        self._ttl = self.resolver.getTTL()
+        self.resolver.setTTL(60)
+        self.resolver.clearCache()
+
+    def tearDown(self):
+        modelresolver.taurus = self._taurus
+        self.resolver.setTTL(self._ttl)
+        self.resolver.clearCache()
+
+    def test_noPattern(self):
+        """check that expressions without patterns are not queried"""
+        models = self.resolver.resolve('a/b/c,a/b/c/attr')
+        self.assertEqual(models, ['a/b/c/State', 'a/b/c/attr'])
+        self.assertEqual(self.fake.queries, [])
+
+    def test_devicePattern(self):
+        models = self.resolver.resolve('test/dev/*/double_scalar')
+        self.assertEqual(models, ['test/dev/1/double_scalar',
+                                  'test/dev/2/double_scalar'])
+        self.assertEqual(self.fake.queries, ['*'])
+
+    def test_attributePattern(self):
+        models = self.resolver.resolve(['test/dev/1/double_*',
+                                        'test/dev/[12]/state'])
+        self.assertEqual(models, ['test/dev/1/double_scalar',
+                                  'test/dev/1/double_spectrum',
+                                  'test/dev/1/state',
+                                  'test/dev/2/state'])
+
+    def test_bothPatterns(self):
+        models = self.resolver.resolve('*/dev/*/double_.*')
+        self.assertEqual(models, ['other/dev/1/double_image',
+                                  'test/dev/1/double_scalar',
+                                  'test/dev/1/double_spectrum',
+                                  'test/dev/2/double_scalar'])
+        # only the matching devices are queried (once)
+        self.assertEqual(sorted(self.fake.queries),
+                         ['*', 'other/dev/1', 'test/dev/1', 'test/dev/2'])
+
+    def test_unreachable(self):
+        """check that the devices that cannot be queried are skipped"""
+        models = self.resolver.resolve('test/*/*/s.*')
+        self.assertEqual(models, ['test/dev/1/State',
+                                  'test/dev/1/short_scalar',
+                                  'test/dev/2/State'])
+        self.assertIn('test/broken/1', self.fake.queries)
+
+    def test_limit(self):
+        models = self.resolver.resolve('test/dev/1/*', limit=2)
+        self.assertEqual(models, ['test/dev/1/State',
+                                  'test/dev/1/double_scalar'])
+
+    def test_attrFilter(self):
+        """check that attr_filter selects among the attributes matching a
+        pattern (but not among the explicitly given ones)"""
+        models = self.resolver.resolve(
+            ['*/dev/*/*', 'test/dev/2/double_scalar'],
+            attr_filter=lambda info: info.writable)
+        self.assertEqual(models, ['other/dev/1/double_image',
+                                  'test/dev/1/double_scalar',
+                                  'test/dev/2/double_scalar'])
+
+    def test_cache(self):
+        """check that the lists are cached and that clearCache discards
+        them"""
+        expected = ['test/dev/1/double_scalar', 'test/dev/1/double_spectrum',
+                    'test/dev/2/double_scalar']
+        for _ in range(3):
+            models = self.resolver.resolve('test/dev/*/double_*')
+            self.assertEqual(models, expected)
+        self.assertEqual(sorted(self.fake.queries),
+                         ['*', 'test/dev/1', 'test/dev/2'])
+        self.resolver.clearCache()
+        self.resolver.resolve('test/dev/*/double_*')
+        self.assertEqual(sorted(self.fake.queries),
+                         ['*', '*', 'test/dev/1', 'test/dev/1',
+                          'test/dev/2', 'test/dev/2'])
+
+    def test_ttl(self):
+        """check that the cached lists expire after the TTL"""
+        self.resolver.setTTL(.05)
+        self.resolver.resolve('test/dev/1/double_*')
+        self.resolver.resolve('test/dev/1/double_*')
+        self.assertEqual(self.fake.queries, ['test/dev/1'])
+        time.sleep(.1)
+        self.resolver.resolve('test/dev/1/double_*')
+        self.assertEqual(self.fake.queries, ['test/dev/1', 'test/dev/1'])
+
+    def test_noCache(self):
+        """check that the cache can be bypassed"""
+        self.resolver.getExportedDevices()
+        self.resolver.getExportedDevices()
+        self.resolver.getExportedDevices(cache=False)
+        self.assertEqual(self.fake.queries, ['*', '*'])
+
+    def test_getPattern(self):
+        """check that the patterns are compiled once and case
+        insensitive"""
+        p = self.resolver.getPattern('test/*/1')
+        self.assertIs(self.resolver.getPattern('test/*/1'), p)
+        self.assertTrue(p.match('TEST/dev/1'))
+        self.assertFalse(p.match('other/dev/1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
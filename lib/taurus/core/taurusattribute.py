@@ -146,6 +146,21 @@ class TaurusAttribute(TaurusModel):
         raise NotImplementedError("Not allowed to call AbstractClass" +
                                   " TaurusAttribute.read")
 
+    def read_async(self, cache=False):
+        """Reads the attribute without blocking the calling thread.
+
+        The read is done by a worker thread of the
+        :class:`TaurusManager`. Use :func:`taurus.gather` to wait for the
+        reads of several attributes.
+
+        :param cache: (bool) passed to :meth:`read` (False by default)
+
+        :return: (concurrent.futures.Future) future for the
+                 :class:`TaurusAttrValue` returned by :meth:`read`
+        """
+        from .taurusmanager import TaurusManager
+        return TaurusManager().submitJob(self.read, cache=cache)
+
     def poll(self):
         raise NotImplementedError("Not allowed to call AbstractClass" +
                                   " TaurusAttribute.poll")
@@ -27,6 +27,7 @@ a misc collection of basic types
 """
 
 import datetime
+import time
 
 from .util.enumeration import Enumeration
 from .util.log import taurus4_deprecation
@@ -237,12 +238,22 @@ TaurusSWDevState = DeprecatedEnum('TaurusSWDevState', 'TaurusDevState')
 TaurusSWDevHealth = DeprecatedEnum('TaurusSWDevHealth', 'TaurusDevState')
 
 
+try:
+    _time_ns = time.time_ns  # py >= 3.7
+except AttributeError:
+    def _time_ns():
+        return int(round(time.time() * 1e9))
+
+
 class TaurusTimeVal(object):
+    """A timestamp. It is stored as an integer number of nanoseconds since the
+    epoch, and the (tv_sec, tv_usec, tv_nsec) fields, the datetime and the
+    iso format representations are computed only when requested"""
 
-    def __init__(self):
-        self.tv_sec = 0
-        self.tv_usec = 0
-        self.tv_nsec = 0
+    __slots__ = ('_ns', '__weakref__')
+
+    def __init__(self, ns=0):
+        self._ns = int(ns)
 
     def __repr__(self):
         return "%s(tv_sec=%i, tv_usec=%i, tv_nsec=%i)" % (self.__class__.__name__, self.tv_sec, self.tv_usec, self.tv_nsec)
@@ -250,8 +261,42 @@ class TaurusTimeVal(object):
     def __float__(self):
         return self.totime()
 
+    def __getstate__(self):
+        return self._ns
+
+    def __setstate__(self, state):
+        self._ns = state
+
+    def _get_tv_sec(self):
+        return self._ns // 1000000000
+
+    def _set_tv_sec(self, v):
+        self._ns += (int(v) - self.tv_sec) * 1000000000
+
+    tv_sec = property(_get_tv_sec, _set_tv_sec)
+
+    def _get_tv_usec(self):
+        return self._ns // 1000 % 1000000
+
+    def _set_tv_usec(self, v):
+        self._ns += (int(v) - self.tv_usec) * 1000
+
+    tv_usec = property(_get_tv_usec, _set_tv_usec)
+
+    def _get_tv_nsec(self):
+        return self._ns % 1000
+
+    def _set_tv_nsec(self, v):
+        self._ns += int(v) - self.tv_nsec
+
+    tv_nsec = property(_get_tv_nsec, _set_tv_nsec)
+
     def totime(self):
-        return self.tv_nsec * 1e-9 + self.tv_usec * 1e-6 + self.tv_sec
+        return self._ns / 1e9
+
+    def tons(self):
+        """Returns the timestamp as an integer number of ns since the epoch"""
+        return self._ns
 
     def todatetime(self):
         return datetime.datetime.fromtimestamp(self.totime())
@@ -261,38 +306,81 @@ class TaurusTimeVal(object):
 
     @staticmethod
     def fromtimestamp(v):
-        tv = TaurusTimeVal()
-        tv.tv_sec = int(v)
-        usec = (v - tv.tv_sec) * 1000000
-        tv.tv_usec = int(usec)
-        tv.tv_nsec = int((usec - tv.tv_usec) * 1000)
-        return tv
+        return TaurusTimeVal(round(v * 1e9))
 
     @staticmethod
     def fromdatetime(v):
-        import time
-        tv = TaurusTimeVal()
-        tv.tv_sec = int(time.mktime(v.timetuple()))
-        tv.tv_usec = v.microsecond
-        tv.tv_nsec = 0  # datetime does not provide ns info
-        return tv
+        sec = int(time.mktime(v.timetuple()))
+        # datetime does not provide ns info
+        return TaurusTimeVal(sec * 1000000000 + v.microsecond * 1000)
 
     @staticmethod
     def now():
-        return TaurusTimeVal.fromdatetime(datetime.datetime.now())
+        return TaurusTimeVal(_time_ns())
+
+    @staticmethod
+    def toarray(timevals):
+        """Converts a sequence of timestamps (TaurusTimeVal objects or any
+        other object providing totime(), such as PyTango TimeVal objects)
+        into a numpy array of floats (seconds since the epoch)
+
+        :param timevals: (seq<TaurusTimeVal>) the timestamps
+
+        :return: (numpy.ndarray) array of dtype float64
+        """
+        import numpy
+        return numpy.fromiter((t.totime() for t in timevals),
+                              dtype='float64')
+
+    @staticmethod
+    def todatetime64(timestamps):
+        """Converts an array of timestamps (as floats of seconds since the
+        epoch, as returned by :meth:`toarray` or stored in the trend
+        buffers) into a numpy array of datetime64[ns] (UTC)
+
+        :param timestamps: (numpy.ndarray) the timestamps
+
+        :return: (numpy.ndarray) array of dtype datetime64[ns]
+        """
+        import numpy
+        ns = numpy.round(numpy.asarray(timestamps, dtype='float64') * 1e9)
+        return ns.astype('int64').view('datetime64[ns]')
 
 
 class TaurusModelValue(object):
 
+    # The members are stored in slots. Other members can still be set, but
+    # the instance __dict__ is only created when it happens
+    __slots__ = ('rvalue', '__dict__', '__weakref__')
+
     def __init__(self):
         self.rvalue = None
 
+    def _members(self):
+        """Returns a dict with the members of the value (the ones stored in
+        slots and in the instance __dict__)"""
+        ret = {}
+        for klass in type(self).__mro__:
+            for name in klass.__dict__.get('__slots__', ()):
+                if name in ('__dict__', '__weakref__'):
+                    continue
+                if name.startswith('__'):  # private (name mangled) slot
+                    name = '_%s%s' % (klass.__name__.lstrip('_'), name)
+                try:
+                    ret[name] = klass.__dict__[name].__get__(self, klass)
+                except AttributeError:
+                    pass
+        ret.update(self.__dict__)
+        return ret
+
     def __repr__(self):
-        return "%s%s" % (self.__class__.__name__, repr(self.__dict__))
+        return "%s%s" % (self.__class__.__name__, repr(self._members()))
 
 
 class TaurusAttrValue(TaurusModelValue):
 
+    __slots__ = ('wvalue', 'time', 'quality', 'error')
+
     def __init__(self):
         TaurusModelValue.__init__(self)
         self.wvalue = None
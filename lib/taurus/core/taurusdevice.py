@@ -71,6 +71,19 @@ class TaurusDevice(TaurusModel):
         """
         return TaurusDevState.Ready
 
+    def state_async(self):
+        """Returns a future for :attr:`state`, which is obtained without
+        blocking the calling thread (by a worker thread of the
+        :class:`TaurusManager`)
+
+        Subclasses may reimplement it to accept extra arguments (e.g.,
+        :meth:`TangoDevice.state_async` accepts a `cache` kwarg)
+
+        :return: (concurrent.futures.Future) future for the TaurusDevState
+        """
+        from .taurusmanager import TaurusManager
+        return TaurusManager().submitJob(lambda: self.state)
+
     #-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-
     # TaurusModel implementation
     #-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-
@@ -129,6 +142,32 @@ class TaurusDevice(TaurusModel):
         for attr in attrs.values():
             attr.poll()
 
+    def writeAttributes(self, attr_values, with_read=True):
+        """Writes several attributes of this device.
+
+        This default implementation simply writes each attribute one by one.
+        Schemes able to write several attributes in a single request should
+        reimplement it.
+
+        :param attr_values: sequence of (attribute, value) pairs. The
+                            attributes must be children of this device
+        :type attr_values: sequence<(TaurusAttribute, object)>
+        :param with_read: whether the written attributes should be read back
+        :type with_read: bool
+
+        :return: a list (in the same order as `attr_values`) containing None
+                 for each successful write or the raised exception otherwise
+        :rtype: list<Exception or None>
+        """
+        errors = []
+        for attr, value in attr_values:
+            try:
+                attr.write(value, with_read=with_read)
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
+
     @property
     def description(self):
         return self._description
@@ -44,7 +44,7 @@ __all__ = ['check_dependencies', 'log_dependencies', 'getSchemeFromName',
            'enableLogOutput', 'disableLogOutput',
            'log', 'trace', 'debug', 'info', 'warning', 'error', 'fatal',
            'critical', 'deprecated', 'changeDefaultPollingPeriod',
-           'getValidatorFromName']
+           'getValidatorFromName', 'gather']
 
 __docformat__ = "restructuredtext"
 
@@ -454,5 +454,36 @@ deprecated = __log_mod.deprecated
 def changeDefaultPollingPeriod(period):
     Manager().changeDefaultPollingPeriod(period)
 
+
+def gather(futures, timeout=None):
+    """Waits for the given futures (e.g. those returned by
+    :meth:`TaurusAttribute.read_async`) and returns their results.
+
+    Example: read several attributes concurrently::
+
+        values = taurus.gather([a.read_async() for a in attrs])
+
+    :param futures: (sequence<concurrent.futures.Future>) futures to wait for
+    :param timeout: (float or None) maximum time (in s) to wait for all the
+                    futures. None (default) means no limit
+
+    :return: (list) the results, in the same order as the futures. For the
+             futures that failed, the raised exception is returned instead
+             of the result
+
+    :raises: concurrent.futures.TimeoutError if the timeout expires
+    """
+    from concurrent.futures import wait, TimeoutError
+    futures = list(futures)
+    _, not_done = wait(futures, timeout=timeout)
+    if not_done:
+        raise TimeoutError('%d of %d futures not done' %
+                           (len(not_done), len(futures)))
+    results = []
+    for f in futures:
+        e = f.exception()
+        results.append(f.result() if e is None else e)
+    return results
+
 #del __log_mod
 #del __translate_version_str2int
@@ -30,6 +30,7 @@ from builtins import range
 
 import os
 import atexit
+from concurrent.futures import Future
 import pkg_resources
 
 from .util.singleton import Singleton
@@ -42,6 +43,7 @@ from .taurusdevice import TaurusDevice
 from .taurusattribute import TaurusAttribute
 from .taurusexception import TaurusException
 from .taurusfactory import TaurusFactory
+from .taurusoperation import TaurusOperation, WriteAttrOperation
 from .taurushelper import getSchemeFromName
 import taurus
 from taurus import tauruscustomsettings
@@ -122,6 +124,37 @@ class TaurusManager(Singleton, Logger):
 
         self._state = ManagerState.CLEANED
 
+    def submitJob(self, job, *args, **kwargs):
+        """Enqueues a job (callable) to be processed concurrently by a
+        separate thread and returns a future for its result.
+
+        If the manager is not initialized, the job is processed
+        synchronously (and the returned future is already done).
+
+        :param job: (callable) a callable object
+        :param args: positional arguments passed to the job
+        :param kwargs: keyword arguments passed to the job
+
+        :return: (concurrent.futures.Future) future for the job result
+        """
+        future = Future()
+
+        def _run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = job(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        if getattr(self, "_thread_pool", None) is None:
+            _run()
+        else:
+            self._thread_pool.add(_run)
+        return future
+
     def addJob(self, job, callback=None, *args, **kw):
         """ Deprecated. Wrapper of enqueueJob. See enqueueJob documentation.
         """
@@ -138,6 +171,9 @@ class TaurusManager(Singleton, Logger):
         :param job_kwargs: (dict) keyword arguments passed to the job
         :param serialization_mode: (TaurusSerializationMode) serialization
         mode
+
+        :return: (bool) True if the job was enqueued. False if it cannot be
+                 processed (e.g. if the manager has been cleaned up)
         """
         if job_kwargs is None:
             job_kwargs = {}
@@ -151,7 +187,7 @@ class TaurusManager(Singleton, Logger):
                 self.debug(
                     "The requested job cannot be processed. "
                     + "Make sure this manager is initialized")
-                return
+                return False
             self._thread_pool.add(job, callback, *job_args, **job_kwargs)
         elif serialization_mode == TaurusSerializationMode.Serial:
             if (not hasattr(self, "_sthread_pool")
@@ -160,12 +196,13 @@ class TaurusManager(Singleton, Logger):
                 self.debug(
                     "The requested job cannot be processed. "
                     + "Make sure this manager is initialized")
-                return
+                return False
 
             self._sthread_pool.add(job, callback, *job_args, **job_kwargs)
         else:
             raise TaurusException("{} serialization mode not supported".format(
                 serialization_mode))
+        return True
 
     def setSerializationMode(self, mode):
         """Sets the serialization mode for the system.
@@ -426,10 +463,45 @@ class TaurusManager(Singleton, Logger):
     def applyPendingOperations(self, ops):
         """Executes the given operations
 
+        Write operations on several attributes of the same device are
+        grouped and done with a single call to
+        :meth:`TaurusDevice.writeAttributes` (which allows the scheme to
+        write them in one request). The callbacks of each operation are
+        executed only if its write succeeded. If any operation fails, the
+        remaining ones are still executed and the first error is raised at
+        the end.
+
         :param ops: the sequence of operations
         :type ops: sequence<taurus.core.taurusoperation.TaurusOperation>"""
+        batches = {}
+        for o in ops:
+            if isinstance(o, WriteAttrOperation):
+                dev = o.getDevice()
+                if dev is not None:
+                    batches.setdefault(id(dev), (dev, []))[1].append(o)
+        first_error = None
         for o in ops:
-            o.execute()
+            dev = o.getDevice() if isinstance(o, WriteAttrOperation) else None
+            batch = batches.get(id(dev)) if dev is not None else None
+            if batch is None or len(batch[1]) < 2:
+                try:
+                    o.execute()
+                except Exception as e:
+                    if first_error is None:
+                        first_error = e
+                continue
+            if batch[1][0] is not o:
+                continue  # already written with the first op of its batch
+            batch_ops = batch[1]
+            errors = dev.writeAttributes([(op.attr, op.value)
+                                          for op in batch_ops])
+            for op, err in zip(batch_ops, errors):
+                if err is None:
+                    TaurusOperation.execute(op)
+                elif first_error is None:
+                    first_error = err
+        if first_error is not None:
+            raise first_error
 
     def changeDefaultPollingPeriod(self, period):
         plugin_classes = self._get_plugin_classes()
@@ -28,11 +28,16 @@
 from builtins import object
 
 import weakref
-import collections
+
+try:
+    from collections.abc import Sequence
+except ImportError:  # Python 2
+    from collections import Sequence
 
 from .util.log import Logger
 from .util.event import (CallableRef,
                          BoundMethodWeakref,
+                         ListenerSet,
                          _BoundMethodWeakrefWithCall)
 from .taurusbasetypes import TaurusEventType, MatchLevel
 from .taurushelper import Factory
@@ -67,7 +72,7 @@ class TaurusModel(Logger):
         self._serialization_mode = serializationMode
 
         self._parentObj = parent
-        self._listeners = []
+        self._listeners = ListenerSet()
 
     def __str__name__(self, name):
         return '{0}({1})'.format(self.__class__.__name__, name)
@@ -207,10 +212,7 @@ class TaurusModel(Logger):
     def _listenerDied(self, weak_listener):
         if self._listeners is None:
             return
-        try:
-            self._listeners.remove(weak_listener)
-        except Exception as e:
-            self.debug("Problem removing listener: %r", e)
+        self._listeners.removeDead(weak_listener)
 
     def _getCallableRef(self, listener, cb=None):
         # return weakref.ref(listener, self._listenerDied)
@@ -229,20 +231,13 @@ class TaurusModel(Logger):
         weak_listener = self._getCallableRef(
             listener, _BoundMethodWeakrefWithCall(self._listenerDied))
             # listener, self._listenerDied)
-        if weak_listener in self._listeners:
-            return False
-        self._listeners.append(weak_listener)
-        return True
+        return self._listeners.add(weak_listener)
 
     def removeListener(self, listener):
         if self._listeners is None:
             return
         weak_listener = self._getCallableRef(listener)
-        try:
-            self._listeners.remove(weak_listener)
-        except Exception as e:
-            return False
-        return True
+        return self._listeners.remove(weak_listener)
 
     def forceListening(self):
         class __DummyListener(object):
@@ -272,12 +267,11 @@ class TaurusModel(Logger):
         """sends an event to all listeners or a specific one"""
 
         if listeners is None:
-            listeners = self._listeners
-
-        if listeners is None:
-            return
+            if self._listeners is None:
+                return
+            listeners = self._listeners.snapshot()
 
-        if not isinstance(listeners, collections.Sequence):
+        if not isinstance(listeners, Sequence):
             listeners = listeners,
 
         for listener in listeners:
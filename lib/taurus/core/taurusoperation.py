@@ -78,6 +78,9 @@ class WriteAttrOperation(TaurusOperation):
         self.attr = attr
         self.value = value
 
+    def getDevice(self):
+        return self.attr.getParentObj()
+
     def execute(self):
         self.attr.write(self.value)
         TaurusOperation.execute(self)
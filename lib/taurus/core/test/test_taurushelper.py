@@ -480,5 +480,32 @@ class ValidatorFromName(unittest.TestCase):
         self.assertIsNone(taurus.getValidatorFromName('unsupported:scheme'))
 
 
+class GatherTestCase(unittest.TestCase):
+    """TestCase for the taurus.gather helper and the async reads"""
+
+    def test_gather(self):
+        """check that gather returns the results of read_async in order"""
+        attrs = [taurus.Attribute('eval:%d' % i) for i in range(5)]
+        futures = [a.read_async() for a in attrs]
+        values = taurus.gather(futures, timeout=10)
+        self.assertEqual([v.rvalue for v in values],
+                         [Quantity(i) for i in range(5)])
+
+    def test_gather_exception(self):
+        """check that gather returns the exceptions of failed futures"""
+        a = taurus.Attribute('eval:@taurus.core.evaluation.test.res.mymod'
+                             '.MyClass()/self.float_ro')
+        futures = [a.read_async(), taurus.Manager().submitJob(divmod, 1, 0)]
+        value, err = taurus.gather(futures, timeout=10)
+        self.assertEqual(value.rvalue, Quantity(1.234))
+        self.assertIsInstance(err, ZeroDivisionError)
+
+    def test_state_async(self):
+        """check that state_async returns a future for the device state"""
+        dev = taurus.Device('eval:@foo')
+        state = dev.state_async().result(timeout=10)
+        self.assertEqual(state, dev.state)
+
+
 if __name__ == '__main__':
     pass
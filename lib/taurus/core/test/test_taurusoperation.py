@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Test for the execution of taurus.core.taurusoperation operations"""
+
+__docformat__ = 'restructuredtext'
+
+import unittest
+
+import taurus
+from taurus.core.taurusmanager import TaurusManager
+from taurus.core.taurusoperation import WriteAttrOperation
+from taurus.core.units import Quantity
+
+
+_DEV = 'eval:@taurus.core.evaluation.test.res.mymod.MyClass()/'
+
+
+class WriteAttrOperationTestCase(unittest.TestCase):
+    """TestCase for the batched execution of WriteAttrOperation"""
+
+    def setUp(self):
+        self.foo = taurus.Attribute(_DEV + 'self.foo')
+        self.bar = taurus.Attribute(_DEV + 'self.bar')
+        self.ro = taurus.Attribute(_DEV + 'self.float_ro')
+        self.done = []
+        self.nbatches = 0
+        dev = self.foo.getParentObj()
+        writeAttributes = dev.writeAttributes
+
+        def _writeAttributes(*args, **kwargs):
+            self.nbatches += 1
+            return writeAttributes(*args, **kwargs)
+
+        dev.writeAttributes = _writeAttributes
+        self.addCleanup(delattr, dev, 'writeAttributes')
+
+    def _callback(self, operation=None):
+        self.done.append(operation.attr)
+
+    def _op(self, attr, value):
+        return WriteAttrOperation(attr, value, callbacks=[self._callback])
+
+    def test_batch(self):
+        """check that writes on the same device are done in one batch"""
+        ops = [self._op(self.foo, Quantity(5, 'm')), self._op(self.bar, 'x')]
+        TaurusManager().applyPendingOperations(ops)
+        self.assertEqual(self.nbatches, 1)
+        self.assertEqual(self.done, [self.foo, self.bar])
+        self.assertEqual(self.foo.read(cache=False).rvalue, Quantity(5, 'm'))
+        self.assertEqual(self.bar.read(cache=False).rvalue, 'x')
+
+    def test_single(self):
+        """check that a single write is not batched"""
+        TaurusManager().applyPendingOperations([self._op(self.bar, 'y')])
+        self.assertEqual(self.nbatches, 0)
+        self.assertEqual(self.done, [self.bar])
+
+    def test_error(self):
+        """check that a failed write does not prevent the others"""
+        ops = [self._op(self.ro, 1.), self._op(self.bar, 'z')]
+        self.assertRaises(Exception,
+                          TaurusManager().applyPendingOperations, ops)
+        self.assertEqual(self.done, [self.bar])
+        self.assertEqual(self.bar.read(cache=False).rvalue, 'z')
+
+    def test_singleError(self):
+        """check that a failed single (non batched) write does not prevent
+        the later operations and that its error is raised at the end"""
+        ro = taurus.Attribute('eval:1')
+        ops = [self._op(ro, 2), self._op(self.bar, 'w')]
+        self.assertRaises(Exception,
+                          TaurusManager().applyPendingOperations, ops)
+        self.assertEqual(self.done, [self.bar])
+        self.assertEqual(self.bar.read(cache=False).rvalue, 'w')
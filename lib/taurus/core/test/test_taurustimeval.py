@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+"""Test for taurus.core.taurusbasetypes.TaurusTimeVal"""
+
+__docformat__ = 'restructuredtext'
+
+import datetime
+import unittest
+
+import numpy
+
+from taurus.test import insertTest
+from taurus.core import TaurusTimeVal
+
+
+@insertTest(helper_name='fields', ts=0, expected=(0, 0, 0))
+@insertTest(helper_name='fields', ts=1.5, expected=(1, 500000, 0))
+@insertTest(helper_name='fields', ts=12.000001002,
+            expected=(12, 1, 2))
+class TaurusTimeValTestCase(unittest.TestCase):
+    """TestCase for TaurusTimeVal"""
+
+    def fields(self, ts, expected):
+        """check the tv_* fields of a TaurusTimeVal created from a float"""
+        tv = TaurusTimeVal.fromtimestamp(ts)
+        self.assertEqual((tv.tv_sec, tv.tv_usec, tv.tv_nsec), expected)
+        self.assertAlmostEqual(tv.totime(), ts, places=6)
+        self.assertAlmostEqual(float(tv), ts, places=6)
+
+    def test_setFields(self):
+        """check that the tv_* fields can be set"""
+        tv = TaurusTimeVal()
+        tv.tv_sec = 3
+        tv.tv_usec = 4
+        tv.tv_nsec = 5
+        self.assertEqual(tv.tons(), 3000004005)
+        tv.tv_usec = 1
+        self.assertEqual((tv.tv_sec, tv.tv_usec, tv.tv_nsec), (3, 1, 5))
+
+    def test_datetime(self):
+        """check the conversions from/to datetime"""
+        dt = datetime.datetime(2019, 10, 1, 12, 30, 15, 123456)
+        tv = TaurusTimeVal.fromdatetime(dt)
+        self.assertEqual(tv.todatetime(), dt)
+        self.assertEqual(tv.isoformat(), dt.isoformat())
+
+    def test_now(self):
+        """check that now() is close to the current datetime"""
+        now = datetime.datetime.now()
+        delta = TaurusTimeVal.now().todatetime() - now
+        self.assertLess(abs(delta.total_seconds()), 1)
+
+    def test_arrays(self):
+        """check the conversion of timestamps into numpy arrays"""
+        tvs = [TaurusTimeVal.fromtimestamp(t) for t in (1.5, 2.25)]
+        a = TaurusTimeVal.toarray(tvs)
+        self.assertEqual(a.dtype, numpy.float64)
+        self.assertTrue(numpy.allclose(a, [1.5, 2.25]))
+        d = TaurusTimeVal.todatetime64(a)
+        expected = numpy.array(['1970-01-01T00:00:01.5',
+                                '1970-01-01T00:00:02.25'],
+                               dtype='datetime64[ns]')
+        self.assertTrue((d == expected).all())
@@ -27,7 +27,7 @@ This module provides a pint unit registry instance (`UR`) to be used by all
 taurus objects. It also provides the `Quantity` factory from that registry
 (also aliased as `Q_`).
 """
-__all__ = ['UR', 'Quantity', 'Q_']
+__all__ = ['UR', 'Quantity', 'Q_', 'magnitude']
 
 from pint import UnitRegistry
 
@@ -35,3 +35,11 @@ from pint import UnitRegistry
 UR = UnitRegistry()
 UR.default_format = '~'  # use abbreviated units
 Q_ = Quantity = UR.Quantity
+
+
+def magnitude(value):
+    """Returns the magnitude of value if it is a Quantity or value itself
+    otherwise (e.g. for the values of attributes in raw numeric mode)"""
+    if isinstance(value, Quantity):
+        return value.magnitude
+    return value
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+"""asyncio integration for taurus models (requires Python >= 3.4).
+
+It allows asyncio based applications to iterate asynchronously over the
+events of taurus attributes and to await reads and writes::
+
+    import asyncio
+    import taurus
+    from taurus.core.util.aio import AsyncAttributeEventIterator, read
+
+    async def monitor(names):
+        attrs = [taurus.Attribute(n) for n in names]
+        print(await read(attrs[0]))
+        async with AsyncAttributeEventIterator(attrs, maxsize=10) as events:
+            async for attr, value in events:
+                print(attr.getSimpleName(), value.rvalue)
+
+The events are delivered to the event loop with
+:meth:`asyncio.AbstractEventLoop.call_soon_threadsafe` (no thread is
+created per subscription) and the reads and writes are done by the worker
+threads of the :class:`TaurusManager`.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import threading
+from collections import deque, OrderedDict
+
+from future.utils import string_types
+
+import taurus
+from taurus.core.taurusbasetypes import TaurusEventType
+from .event import AttributeEventIterator
+
+
+__all__ = ["DropPolicy", "AsyncAttributeEventIterator", "read", "write",
+           "gather"]
+
+__docformat__ = "restructuredtext"
+
+try:
+    _running_loop = asyncio.get_running_loop
+except AttributeError:  # Python < 3.7
+    _running_loop = asyncio.get_event_loop
+
+
+def _attribute(attr):
+    if isinstance(attr, string_types):
+        return taurus.Attribute(attr)
+    return attr
+
+
+class DropPolicy(object):
+    """Policies for the events received when the queue of an
+    :class:`AsyncAttributeEventIterator` is full"""
+
+    #: discard the oldest queued event
+    DropOldest = 'oldest'
+    #: discard the received event
+    DropNewest = 'newest'
+    #: keep only the latest event of each attribute (the queue size is then
+    #: bounded by the number of attributes)
+    KeepLatest = 'latest'
+
+
+class AsyncAttributeEventIterator(AttributeEventIterator):
+    """Asynchronous iterator over the (attribute, value) pairs of the change
+    and periodic events of the given attributes (and of their error events,
+    with the exception as value, if `errors` is True).
+
+    The events are queued in a bounded queue until consumed. When the queue
+    is full, events are discarded according to the given
+    :class:`DropPolicy` and counted in :attr:`dropped`.
+
+    The attributes can be given as objects or as names.
+
+    The iteration ends when :meth:`close` is called (which is done on exit
+    if it is used as an asynchronous context manager).
+
+    Unless a `loop` is given, the events are delivered to the running event
+    loop of the first coroutine that uses the iterator (the events received
+    before are queued directly).
+    """
+
+    def __init__(self, attrs=(), maxsize=100, policy=DropPolicy.DropOldest,
+                 errors=False, loop=None):
+        if policy not in (DropPolicy.DropOldest, DropPolicy.DropNewest,
+                          DropPolicy.KeepLatest):
+            raise ValueError('Unknown drop policy %r' % policy)
+        self._loop = loop
+        self._loopLock = threading.Lock()
+        self._maxsize = maxsize
+        self._policy = policy
+        self._errors = errors
+        self._queue = deque()
+        self._latest = OrderedDict()
+        self._waiter = None
+        self._closed = False
+        self.dropped = 0
+        AttributeEventIterator.__init__(self)
+        if isinstance(attrs, string_types):
+            attrs = (attrs,)
+        attrs = [_attribute(a) for a in attrs]
+        if attrs:
+            self.connect(attrs)
+
+    def eventReceived(self, s, t, v):
+        if t == TaurusEventType.Error:
+            if not self._errors:
+                return
+        elif t not in (TaurusEventType.Change, TaurusEventType.Periodic):
+            return
+        self.fireEvent(s, v)
+
+    def _getLoop(self):
+        """Returns the event loop of the iterator, resolving it (as the
+        running loop) the first time it is needed"""
+        if self._loop is None:
+            loop = _running_loop()
+            with self._loopLock:
+                if self._loop is None:
+                    self._loop = loop
+        return self._loop
+
+    def fireEvent(self, s, v):
+        """Called (from any thread) for each event. Schedules the queuing of
+        the event in the event loop"""
+        loop = self._loop
+        if loop is None:
+            with self._loopLock:
+                loop = self._loop
+                if loop is None:
+                    # nothing is waiting for the events yet
+                    self._put((s, v))
+                    return
+        try:
+            loop.call_soon_threadsafe(self._put, (s, v))
+        except RuntimeError:
+            pass  # the loop is closed
+
+    def _put(self, item):
+        if self._closed:
+            return
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(item)
+            self._waiter = None
+            return
+        if self._policy == DropPolicy.KeepLatest:
+            key = id(item[0])
+            if self._latest.pop(key, None) is not None:
+                self.dropped += 1
+            self._latest[key] = item
+        elif len(self._queue) < self._maxsize:
+            self._queue.append(item)
+        elif self._policy == DropPolicy.DropOldest:
+            self._queue.popleft()
+            self._queue.append(item)
+            self.dropped += 1
+        else:
+            self.dropped += 1
+
+    def qsize(self):
+        """Returns the number of queued events"""
+        return len(self._queue) + len(self._latest)
+
+    def close(self):
+        """Disconnects from the attributes and ends the iteration (once the
+        queued events are consumed)"""
+        self.disconnect()
+        self._closed = True
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_exception(StopAsyncIteration())
+        self._waiter = None
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        fut = self._getLoop().create_future()
+        if self._queue:
+            fut.set_result(self._queue.popleft())
+        elif self._latest:
+            fut.set_result(self._latest.popitem(last=False)[1])
+        elif self._closed:
+            fut.set_exception(StopAsyncIteration())
+        else:
+            self._waiter = fut
+        return fut
+
+    def __aenter__(self):
+        fut = self._getLoop().create_future()
+        fut.set_result(self)
+        return fut
+
+    def __aexit__(self, exc_type, exc_value, tb):
+        self.close()
+        fut = self._getLoop().create_future()
+        fut.set_result(False)
+        return fut
+
+
+def read(attr, cache=False, loop=None):
+    """Returns an awaitable for the value of the given attribute, which is
+    read by a worker thread of the :class:`TaurusManager` (see
+    :meth:`TaurusAttribute.read_async`)
+
+    :param attr: (TaurusAttribute or str) the attribute or its name
+    :param cache: (bool) passed to :meth:`TaurusAttribute.read`
+    :param loop: (asyncio.AbstractEventLoop) the event loop (the current
+                 one if None)
+
+    :return: (asyncio.Future)
+    """
+    return asyncio.wrap_future(_attribute(attr).read_async(cache=cache),
+                               loop=loop)
+
+
+def write(attr, value, with_read=True, loop=None):
+    """Returns an awaitable for the write of the given value to the given
+    attribute, which is done by a worker thread of the
+    :class:`TaurusManager`
+
+    :param attr: (TaurusAttribute or str) the attribute or its name
+    :param value: the value to be written
+    :param with_read: (bool) passed to :meth:`TaurusAttribute.write`
+    :param loop: (asyncio.AbstractEventLoop) the event loop (the current
+                 one if None)
+
+    :return: (asyncio.Future)
+    """
+    attr = _attribute(attr)
+    future = taurus.Manager().submitJob(attr.write, value,
+                                        with_read=with_read)
+    return asyncio.wrap_future(future, loop=loop)
+
+
+def gather(attrs, cache=False, loop=None):
+    """Returns an awaitable for the values of the given attributes, which
+    are read concurrently. The exceptions raised by the failed reads are
+    returned instead of their values
+
+    :param attrs: (sequence<TaurusAttribute or str>) the attributes
+    :param cache: (bool) passed to :meth:`TaurusAttribute.read`
+    :param loop: (asyncio.AbstractEventLoop) the event loop (the current
+                 one if None)
+
+    :return: (asyncio.Future) future for the list of values
+    """
+    return asyncio.gather(*[read(a, cache=cache, loop=loop) for a in attrs],
+                          return_exceptions=True)
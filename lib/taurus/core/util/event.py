@@ -37,8 +37,13 @@ import time
 import collections
 import taurus.core
 
+try:
+    from collections.abc import Sequence
+except ImportError:  # Python 2
+    from collections import Sequence
 
-__all__ = ["BoundMethodWeakref", "CallableRef", "EventGenerator",
+
+__all__ = ["BoundMethodWeakref", "CallableRef", "ListenerSet", "EventGenerator",
            "ConfigEventGenerator", "ListEventGenerator", "EventListener",
            "AttributeEventWait", "AttributeEventIterator"]
 
@@ -141,6 +146,120 @@ class _BoundMethodWeakrefWithCall(BoundMethodWeakref):
                 return func(obj, *args, **kwargs)
 
 
+class ListenerSet(object):
+    """Insertion-ordered set of weak references to listeners (as returned by
+    :func:`CallableRef`).
+
+    Adding and removing are O(1): the references are indexed by the identity
+    of their referent (of the object and the function for bound methods).
+    Iterating uses an immutable snapshot (see :meth:`snapshot`) which is
+    only rebuilt after the membership changes, so that the listeners can
+    be safely notified while others are added or removed.
+    """
+
+    def __init__(self):
+        self._refs = collections.OrderedDict()  # key -> weak reference
+        self._keys = {}  # id(weak reference) -> key
+        self._snapshot = ()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(ref):
+        if isinstance(ref, BoundMethodWeakref):
+            obj, func = ref.obj_ref(), ref.func_ref()
+            if obj is None or func is None:
+                return None
+            return id(obj), id(func)
+        obj = ref()
+        if obj is None:
+            return None
+        return id(obj)
+
+    def _hasLive(self, key):
+        """Returns True if the set has a reference with the given key whose
+        referent is alive. A dead reference under that key (whose callback
+        did not remove it, e.g. because the del_cb of a BoundMethodWeakref
+        died first) is dropped, since the id in the key may be reused by a
+        new object. Must be called with the lock held"""
+        stored = self._refs.get(key)
+        if stored is None:
+            return False
+        if self._key(stored) is not None:
+            return True
+        del self._refs[key]
+        del self._keys[id(stored)]
+        self._snapshot = None
+        return False
+
+    def add(self, ref):
+        """Adds the given weak reference unless its referent is already in
+        the set.
+
+        :return: (bool) True if added
+        """
+        key = self._key(ref)
+        if key is None:
+            return False
+        with self._lock:
+            if self._hasLive(key):
+                return False
+            self._refs[key] = ref
+            self._keys[id(ref)] = key
+            self._snapshot = None
+        return True
+
+    def remove(self, ref):
+        """Removes the reference to the referent of the given weak reference
+
+        :return: (bool) True if removed
+        """
+        key = self._key(ref)
+        with self._lock:
+            stored = self._refs.pop(key, None)
+            if stored is None:
+                return False
+            del self._keys[id(stored)]
+            self._snapshot = None
+        return True
+
+    def removeDead(self, ref):
+        """Removes the given weak reference (which is identified by itself
+        since its referent may no longer exist, e.g. when called from the
+        weak reference callback)
+
+        :return: (bool) True if removed
+        """
+        with self._lock:
+            key = self._keys.pop(id(ref), None)
+            if key is None:
+                return False
+            del self._refs[key]
+            self._snapshot = None
+        return True
+
+    def snapshot(self):
+        """Returns a tuple with the weak references currently in the set.
+        The same tuple is returned until the membership changes"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot = tuple(self._refs.values())
+        return snapshot
+
+    def __len__(self):
+        return len(self._refs)
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __contains__(self, ref):
+        key = self._key(ref)
+        if key is None:
+            return False
+        with self._lock:
+            return self._hasLive(key)
+
+
 class EventStack(object):
     "internal usage event stack"
 
@@ -695,7 +814,7 @@ class AttributeEventIterator(object):
             self.connect(attrs)
 
     def connect(self, attrs):
-        if not isinstance(attrs, collections.Sequence):
+        if not isinstance(attrs, Sequence):
             attrs = (attrs,)
         self.disconnect()
         self._attrs = attrs
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Lazy import of the public names of the modules of a package.
+
+Packages whose ``__init__`` just does ``from .module import *`` for each of
+their modules can call :func:`lazyExports` instead, so that each module is
+only imported when one of its names is accessed (using module level
+``__getattr__``, see :pep:`562`)."""
+
+from __future__ import absolute_import
+
+import os
+import ast
+import sys
+import importlib
+
+import taurus.tauruscustomsettings
+
+
+__all__ = ["lazyExports", "getExportedNames"]
+
+__docformat__ = "restructuredtext"
+
+
+def getExportedNames(filename):
+    """Returns the names in the ``__all__`` of the given python source file
+    without importing it
+
+    :param filename: (str) path of the python source file
+
+    :return: (list<str> or None) the names in ``__all__`` or None if it is not
+             defined as a literal list or tuple of strings
+    """
+    with open(filename, 'rb') as f:
+        tree = ast.parse(f.read(), filename)
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        if any(getattr(t, 'id', None) == '__all__' for t in node.targets):
+            try:
+                return [str(n) for n in ast.literal_eval(node.value)]
+            except ValueError:
+                return None
+    return None
+
+
+def _publicNames(module):
+    names = getattr(module, '__all__', None)
+    if names is None:
+        names = [n for n in vars(module) if not n.startswith('_')]
+    return names
+
+
+def _importAll(package, submodule):
+    # equivalent to "from .submodule import *" in the package
+    module = importlib.import_module('.' + submodule, package.__name__)
+    for n in _publicNames(module):
+        setattr(package, n, getattr(module, n))
+
+
+def _sourceFile(package, submodule):
+    path = os.path.join(os.path.dirname(package.__file__), submodule)
+    if os.path.isdir(path):
+        path = os.path.join(path, '__init__')
+    path += '.py'
+    if os.path.isfile(path):
+        return path
+    return None
+
+
+def lazyExports(name, submodules, lazy=None):
+    """Exports the public names of the given modules of a package as if the
+    package did ``from .submodule import *`` for each of them.
+
+    If lazy, the modules are imported when one of their names (or the module
+    itself) is first accessed as an attribute of the package. The names of
+    each module are taken from the ``__all__`` in its source file (the
+    modules without a literal ``__all__`` are imported when the first name
+    of the package is accessed).
+
+    :param name: (str) the name of the package (i.e. its ``__name__``)
+    :param submodules: (sequence<str>) names of the modules, in the order in
+                       which they would be imported
+    :param lazy: (bool or None) whether to import the modules lazily. If
+                 None, the LIGHTWEIGHT_IMPORTS custom setting is used. The
+                 modules are always imported immediately on python < 3.7
+    """
+    package = sys.modules[name]
+    if lazy is None:
+        lazy = getattr(taurus.tauruscustomsettings, 'LIGHTWEIGHT_IMPORTS',
+                       False)
+    if not lazy or sys.version_info < (3, 7):
+        for submodule in submodules:
+            _importAll(package, submodule)
+        return
+
+    index = {}  # exported name -> (submodule, name or None for the module)
+
+    def getIndex():
+        if index:
+            return index
+        for submodule in submodules:
+            index[submodule] = submodule, None
+        for submodule in submodules:
+            filename = _sourceFile(package, submodule)
+            names = filename and getExportedNames(filename)
+            if names is None:
+                _importAll(package, submodule)
+                continue
+            for n in names:
+                index[n] = submodule, n
+        return index
+
+    def __getattr__(attr):
+        if attr == '__all__':
+            return [n for n in __dir__() if not n.startswith('_')]
+        try:
+            submodule, n = getIndex()[attr]
+        except KeyError:
+            # it may have been set by a module imported by getIndex
+            if attr in vars(package):
+                return vars(package)[attr]
+            raise AttributeError("module '%s' has no attribute '%s'"
+                                 % (name, attr))
+        module = importlib.import_module('.' + submodule, name)
+        value = module if n is None else getattr(module, n)
+        setattr(package, attr, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(package)) | set(getIndex()))
+
+    package.__getattr__ = __getattr__
+    package.__dir__ = __dir__
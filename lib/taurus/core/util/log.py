@@ -464,6 +464,13 @@ class Logger(Object):
     #: the main stream handler
     stream_handler = None
 
+    #: Internal usage: the logging.Logger of the object (bound on first use)
+    _log_obj = None
+
+    #: Internal usage: whether objects share the logger of their class
+    #: (see the LOG_PER_CLASS custom setting). None means not read yet
+    _log_per_class = None
+
     def __init__(self, name='', parent=None, format=None):
         """The Logger constructor
 
@@ -475,7 +482,8 @@ class Logger(Object):
 
         if format:
             self.log_format = format
-        Logger.initRoot()
+        if not Logger.root_inited:
+            Logger.initRoot()
 
         if name is None or len(name) == 0:
             name = self.__class__.__name__
@@ -485,11 +493,12 @@ class Logger(Object):
         else:
             self.log_full_name = name
 
-        self.log_obj = self._getLogger(self.log_full_name)
+        # the logging.Logger is bound on first use (see log_obj)
+        self._log_obj = None
         self.log_handlers = []
 
         self.log_parent = None
-        self.log_children = {}
+        self.log_children = None
         if parent is not None:
             self.log_parent = weakref.ref(parent)
             parent.addChild(self)
@@ -638,6 +647,52 @@ class Logger(Object):
         cls.initRoot()
         return cls._getLogger(name=name)
 
+    @property
+    def log_obj(self):
+        """The logging.Logger of this object. It is obtained the first time it
+        is needed: objects which never log do not register a logger in the
+        logging module.
+
+        If the `LOG_PER_CLASS` custom setting is True, all the objects of the
+        same class (without log handlers of their own) share the logger
+        named after the class instead of having one per object.
+        """
+        log_obj = self._log_obj
+        if log_obj is None:
+            log_obj = self._log_obj = self._bindLogger()
+        return log_obj
+
+    @log_obj.setter
+    def log_obj(self, log_obj):
+        self._log_obj = log_obj
+
+    @staticmethod
+    def _isLogPerClass():
+        """Returns the value of the LOG_PER_CLASS custom setting (which is
+        read only once)"""
+        per_class = Logger._log_per_class
+        if per_class is None:
+            from taurus import tauruscustomsettings
+            per_class = getattr(tauruscustomsettings, 'LOG_PER_CLASS', False)
+            Logger._log_per_class = per_class
+        return per_class
+
+    def _bindLogger(self):
+        if self._isLogPerClass() and not self.log_handlers:
+            return self._getLogger(self.__class__.__name__)
+        return self._getLogger(self.log_full_name)
+
+    def _isLogDiscarded(self, level):
+        """Cheap check done before logging a message: if the logger of this
+        object is not bound yet, messages below the level of the root logger
+        are discarded without binding it.
+
+        Note: levels set explicitly on non-root loggers are only taken into
+        account once the logger of the object is bound (e.g. by
+        :meth:`getLogObj`)
+        """
+        return self._log_obj is None and level < logging.root.level
+
     def getLogObj(self):
         """Returns the log object for this object
 
@@ -659,26 +714,28 @@ class Logger(Object):
 
            :return: (sequence<logging.Logger) the list of log children
         """
-        children = []
-        for _, ref in self.log_children.items():
-            child = ref()
-            if child is not None:
-                children.append(child)
-        return children
+        if self.log_children is None:
+            return []
+        return list(self.log_children.values())
 
     def addChild(self, child):
         """Adds a new logging child
 
            :param child: (logging.Logger) the new child
         """
-        if not self.log_children.get(id(child)):
-            self.log_children[id(child)] = weakref.ref(child)
+        if self.log_children is None:
+            # (the children which no longer exist are removed automatically)
+            self.log_children = weakref.WeakValueDictionary()
+        self.log_children[id(child)] = child
 
     def addLogHandler(self, handler):
         """Registers a new handler in this object's logger
 
            :param handler: (logging.Handler) the new handler to be added
         """
+        if not self.log_handlers and self._isLogPerClass():
+            # do not add the handler to the logger shared by the class
+            self._log_obj = self._getLogger(self.log_full_name)
         self.log_obj.addHandler(handler)
         self.log_handlers.append(handler)
 
@@ -706,6 +763,8 @@ class Logger(Object):
            :param args: list of arguments
            :param kw: list of keyword arguments
         """
+        if self._isLogDiscarded(self.Trace):
+            return
         self.log_obj.log(self.Trace, msg, *args, **kw)
 
     def traceback(self, level=Trace, extended=True):
@@ -792,6 +851,8 @@ class Logger(Object):
            :param args: list of arguments
            :param kw: list of keyword arguments
         """
+        if self._isLogDiscarded(level):
+            return
         self.log_obj.log(level, msg, *args, **kw)
 
     def debug(self, msg, *args, **kw):
@@ -802,6 +863,8 @@ class Logger(Object):
            :param args: list of arguments
            :param kw: list of keyword arguments
         """
+        if self._isLogDiscarded(self.Debug):
+            return
         self.log_obj.debug(msg, *args, **kw)
 
     def info(self, msg, *args, **kw):
@@ -812,6 +875,8 @@ class Logger(Object):
            :param args: list of arguments
            :param kw: list of keyword arguments
         """
+        if self._isLogDiscarded(self.Info):
+            return
         self.log_obj.info(msg, *args, **kw)
 
     def warning(self, msg, *args, **kw):
@@ -822,6 +887,8 @@ class Logger(Object):
            :param args: list of arguments
            :param kw: list of keyword arguments
         """
+        if self._isLogDiscarded(self.Warning):
+            return
         self.log_obj.warning(msg, *args, **kw)
 
     def deprecated(self, msg=None, dep=None, alt=None, rel=None, dbg_msg=None,
@@ -883,6 +950,8 @@ class Logger(Object):
            :param args: list of arguments
            :param kw: list of keyword arguments
         """
+        if self._isLogDiscarded(self.Error):
+            return
         self.log_obj.error(msg, *args, **kw)
 
     def fatal(self, msg, *args, **kw):
@@ -893,6 +962,8 @@ class Logger(Object):
            :param args: list of arguments
            :param kw: list of keyword arguments
         """
+        if self._isLogDiscarded(self.Fatal):
+            return
         self.log_obj.fatal(msg, *args, **kw)
 
     def critical(self, msg, *args, **kw):
@@ -903,6 +974,8 @@ class Logger(Object):
            :param args: list of arguments
            :param kw: list of keyword arguments
         """
+        if self._isLogDiscarded(self.Critical):
+            return
         self.log_obj.critical(msg, *args, **kw)
 
     def exception(self, msg, *args):
@@ -961,7 +1034,8 @@ class Logger(Object):
         else:
             self.log_full_name = name
 
-        self.log_obj = logging.getLogger(self.log_full_name)
+        # rebind the logger (on first use)
+        self._log_obj = None
         for handler in self.log_handlers:
             self.log_obj.addHandler(handler)
 
@@ -31,19 +31,42 @@ from __future__ import with_statement
 from future import standard_library
 standard_library.install_aliases()
 
+import re
+import sys
+import errno
+import json
 import time
+import zlib
 import socket
 import pickle
 import logging
 import logging.handlers
 import struct
+import threading
 import weakref
 import click
 
 import socketserver
 
+try:
+    import selectors
+except ImportError:  # python 2
+    selectors = None
 
-_all__ = ["LogRecordStreamHandler", "LogRecordSocketReceiver", "log"]
+
+_all__ = ["LogRecordStreamHandler", "LogRecordSocketReceiver",
+          "BatchedSocketHandler", "LogRecordSelectorReceiver",
+          "LogReceiverStats", "log"]
+
+
+# Frames are prefixed by a 4 byte big endian word containing the length of
+# the payload and, in the most significant bits, the flags below. A word
+# without flags is a frame of logging.handlers.SocketHandler (a pickled
+# record dict), so both kinds of senders can talk to the same receiver.
+BATCH_FLAG = 0x80000000  # payload is a pickled list of record dicts
+ZLIB_FLAG = 0x40000000  # payload is zlib compressed
+CONTROL_FLAG = 0x20000000  # json payload sent from the receiver to the sender
+LENGTH_MASK = 0x1FFFFFFF
 
 
 class LogRecordStreamHandler(socketserver.StreamRequestHandler):
@@ -147,6 +170,397 @@ class LogRecordSocketReceiver(socketserver.ThreadingTCPServer):
         self.socket.close()
 
 
+def _makeFrame(payload, flags=0):
+    return struct.pack('>L', flags | len(payload)) + payload
+
+
+class BatchedSocketHandler(logging.handlers.SocketHandler):
+    """A :class:`logging.handlers.SocketHandler` which sends the records in
+    (optionally compressed) batches to a :class:`LogRecordSelectorReceiver`.
+
+    The records are sent when `capacity` records are buffered or `interval`
+    seconds after the first buffered record. The receiver may ask the
+    handler to discard the records below a level or whose name does not
+    match a pattern (see :meth:`LogRecordSelectorReceiver.setFilter`)
+    """
+
+    def __init__(self, host, port=logging.handlers.DEFAULT_TCP_LOGGING_PORT,
+                 capacity=100, interval=0.5, compress=True, compresslevel=1):
+        logging.handlers.SocketHandler.__init__(self, host, port)
+        self.capacity = capacity
+        self.interval = interval
+        self.compress = compress
+        self.compresslevel = compresslevel
+        self._buffer = []
+        self._timer = None
+        self._control = b''
+        self._filterLevel = logging.NOTSET
+        self._filterName = None
+
+    def emit(self, record):
+        if record.levelno < self._filterLevel:
+            return
+        if (self._filterName is not None
+                and self._filterName.search(record.name) is None):
+            return
+        try:
+            d = self._recordDict(record)
+        except Exception:
+            self.handleError(record)
+            return
+        # emit is called with the handler lock acquired
+        self._buffer.append(d)
+        if len(self._buffer) >= self.capacity:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _recordDict(self, record):
+        # same transformations as logging.handlers.SocketHandler.makePickle
+        if record.exc_info:
+            self.format(record)  # caches the traceback in record.exc_text
+        d = dict(record.__dict__)
+        d['msg'] = record.getMessage()
+        d['args'] = None
+        d['exc_info'] = None
+        d.pop('message', None)
+        return d
+
+    def makeBatchFrame(self, records):
+        """Returns the frame (bytes) for the given list of record dicts"""
+        payload = pickle.dumps(records, 1)
+        flags = BATCH_FLAG
+        if self.compress:
+            payload = zlib.compress(payload, self.compresslevel)
+            flags |= ZLIB_FLAG
+        return _makeFrame(payload, flags)
+
+    def flush(self):
+        self.acquire()
+        try:
+            records, self._buffer = self._buffer, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not records:
+                return
+            try:
+                self.send(self.makeBatchFrame(records))
+                self._readControl()
+            except Exception:
+                self.handleError(logging.makeLogRecord(records[-1]))
+        finally:
+            self.release()
+
+    def _readControl(self):
+        """Applies the filters requested by the receiver (if any)"""
+        sock = self.sock
+        if sock is None:
+            return
+        import select
+        while select.select([sock], [], [], 0)[0]:
+            chunk = sock.recv(4096)
+            if not chunk:
+                return
+            self._control += chunk
+        while len(self._control) >= 4:
+            word = struct.unpack('>L', self._control[:4])[0]
+            slen = word & LENGTH_MASK
+            if len(self._control) < 4 + slen:
+                break
+            payload = self._control[4:4 + slen]
+            self._control = self._control[4 + slen:]
+            if word & CONTROL_FLAG:
+                self.setFilter(**json.loads(payload.decode('utf-8')))
+
+    def setFilter(self, level=None, name=None):
+        """Discards the records below the given level and those whose name
+        does not match (case insensitively) the given regular expression"""
+        self._filterLevel = level or logging.NOTSET
+        if name:
+            self._filterName = re.compile(name, re.IGNORECASE)
+        else:
+            self._filterName = None
+
+    def close(self):
+        self.flush()
+        logging.handlers.SocketHandler.close(self)
+
+
+class LogReceiverStats(object):
+    """Throughput and lag statistics of a log receiver.
+
+    The lag of a record is the time between its creation and its reception
+    (it includes the clock offset between the hosts)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = 0
+        self.frames = 0
+        self.bytes = 0
+        self._reset(time.time())
+
+    def _reset(self, t):
+        self._t0 = t
+        self._records = 0
+        self._bytes = 0
+        self._lag = 0.
+        self._maxLag = 0.
+
+    def update(self, records, nbytes, frames=1):
+        """Accounts for the given received records"""
+        now = time.time()
+        with self._lock:
+            self.records += len(records)
+            self.frames += frames
+            self.bytes += nbytes
+            self._records += len(records)
+            self._bytes += nbytes
+            for record in records:
+                lag = now - record.created
+                self._lag += lag
+                if lag > self._maxLag:
+                    self._maxLag = lag
+
+    def snapshot(self):
+        """Returns a dict with the rates and lags since the previous call and
+        the total counters"""
+        now = time.time()
+        with self._lock:
+            dt = max(now - self._t0, 1e-9)
+            n = self._records
+            ret = dict(records=self.records, frames=self.frames,
+                       bytes=self.bytes, rate=n / dt,
+                       byte_rate=self._bytes / dt,
+                       lag=self._lag / n if n else 0., max_lag=self._maxLag)
+            self._reset(now)
+        return ret
+
+    @staticmethod
+    def format(snapshot):
+        return ("{rate:.0f} records/s, {kbs:.1f} kB/s, lag {lag:.3f} s "
+                "(max {max_lag:.3f} s), {records} records"
+                .format(kbs=snapshot['byte_rate'] / 1024., **snapshot))
+
+
+class _LogConnection(object):
+
+    def __init__(self, sock, address):
+        self.sock = sock
+        self.address = address
+        self.buffer = bytearray()
+        # data pending to be sent to the client
+        self.outbuffer = bytearray()
+        self.events = selectors.EVENT_READ
+
+
+class LogRecordSelectorReceiver(object):
+    """
+    TCP socket-based logging receiver which serves all the clients from a
+    single thread using :mod:`selectors`.
+
+    It accepts the frames of :class:`logging.handlers.SocketHandler` and the
+    batches of :class:`BatchedSocketHandler` and passes the records of each
+    read to :meth:`handleLogRecords`. It has the same interface than
+    :class:`LogRecordSocketReceiver`.
+    """
+
+    def __init__(self, host='localhost',
+                 port=logging.handlers.DEFAULT_TCP_LOGGING_PORT,
+                 level=None, name=None, **kwargs):
+        if selectors is None:
+            raise ImportError("LogRecordSelectorReceiver requires selectors")
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((host, port))
+        self.socket.listen(16)
+        self.socket.setblocking(False)
+        self.hostName = socket.gethostbyaddr(host)[0]
+        self.port = self.socket.getsockname()[1]
+        self.timeout = 1
+        self.data = kwargs
+        self.stats = LogReceiverStats()
+        self.statsInterval = 5
+        self.onStats = None
+        self._filter = dict(level=level, name=name)
+        self._filterChanged = False
+        self._connections = {}
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.socket, selectors.EVENT_READ)
+        # used by other threads to wake up the serving loop
+        self._wakeupReader, self._wakeupWriter = socket.socketpair()
+        self._wakeupReader.setblocking(False)
+        self._wakeupWriter.setblocking(False)
+        self._selector.register(self._wakeupReader, selectors.EVENT_READ)
+        self._stop = False
+        self._running = False
+        self._stopped = threading.Event()
+
+    def setFilter(self, level=None, name=None):
+        """Asks the clients to send only the records of the given level or
+        above and whose name matches the given regular expression. Only
+        :class:`BatchedSocketHandler` clients honour it.
+
+        It can be called from any thread: the filter is sent by the serving
+        loop"""
+        self._filter = dict(level=level, name=name)
+        self._filterChanged = True
+        self._wakeup()
+
+    def _wakeup(self):
+        try:
+            self._wakeupWriter.send(b'\0')
+        except socket.error:
+            pass  # the buffer is full: a wake up is already pending
+
+    def _onWakeup(self):
+        try:
+            while self._wakeupReader.recv(4096):
+                pass
+        except socket.error:
+            pass
+        if self._filterChanged:
+            self._filterChanged = False
+            for conn in list(self._connections.values()):
+                self._sendFilter(conn)
+
+    def _sendFilter(self, conn):
+        payload = json.dumps(self._filter).encode('utf-8')
+        conn.outbuffer.extend(_makeFrame(payload, CONTROL_FLAG))
+        self._write(conn)
+
+    def _write(self, conn):
+        """Sends as much of the pending output of conn as possible (the
+        rest is sent when the socket becomes writable)"""
+        try:
+            n = conn.sock.send(conn.outbuffer)
+        except socket.error as e:
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                self._close(conn)
+                return
+            n = 0
+        del conn.outbuffer[:n]
+        events = selectors.EVENT_READ
+        if conn.outbuffer:
+            events |= selectors.EVENT_WRITE
+        if events != conn.events:
+            conn.events = events
+            self._selector.modify(conn.sock, events, conn)
+
+    def _accept(self):
+        try:
+            sock, address = self.socket.accept()
+        except socket.error:
+            return
+        conn = _LogConnection(sock, address)
+        self._connections[sock] = conn
+        sock.setblocking(False)
+        self._selector.register(sock, selectors.EVENT_READ, conn)
+        if any(self._filter.values()):
+            self._sendFilter(conn)
+
+    def _close(self, conn):
+        self._connections.pop(conn.sock, None)
+        try:
+            self._selector.unregister(conn.sock)
+        except (KeyError, ValueError):
+            pass
+        conn.sock.close()
+
+    def _read(self, conn):
+        try:
+            chunk = conn.sock.recv(1 << 16)
+        except socket.error:
+            chunk = b''
+        if not chunk:
+            self._close(conn)
+            return
+        buf = conn.buffer
+        buf.extend(chunk)
+        records, frames, pos = [], 0, 0
+        while len(buf) - pos >= 4:
+            word = struct.unpack_from('>L', buf, pos)[0]
+            slen = word & LENGTH_MASK
+            if len(buf) - pos - 4 < slen:
+                break
+            payload = bytes(buf[pos + 4:pos + 4 + slen])
+            pos += 4 + slen
+            frames += 1
+            try:
+                records.extend(self.decodeFrame(word, payload))
+            except Exception:
+                self._close(conn)
+                return
+        del buf[:pos]
+        if records:
+            self.stats.update(records, pos, frames)
+            self.handleLogRecords(records)
+
+    def decodeFrame(self, word, payload):
+        """Returns the list of log records in the given frame"""
+        if word & ZLIB_FLAG:
+            payload = zlib.decompress(payload)
+        obj = pickle.loads(payload)
+        if not word & BATCH_FLAG:
+            obj = [obj]
+        return [self.makeLogRecord(d) for d in obj]
+
+    def makeLogRecord(self, obj):
+        record = logging.makeLogRecord(obj)
+        if not hasattr(record, 'hostName'):
+            record.hostName = self.hostName
+        return record
+
+    def handleLogRecords(self, records):
+        logger = self.data.get("logger")
+        for record in records:
+            if logger is None:
+                _logger = logging.getLogger(record.name)
+            else:
+                _logger = logger
+            if _logger.isEnabledFor(record.levelno):
+                _logger.handle(record)
+
+    def serve_until_stopped(self):
+        nextStats = time.time() + self.statsInterval
+        self._running = True
+        try:
+            while not self._stop:
+                for key, events in self._selector.select(self.timeout):
+                    conn = key.data
+                    if key.fileobj is self.socket:
+                        self._accept()
+                    elif key.fileobj is self._wakeupReader:
+                        self._onWakeup()
+                    else:
+                        if events & selectors.EVENT_WRITE:
+                            self._write(conn)
+                        if (events & selectors.EVENT_READ
+                                and conn.sock in self._connections):
+                            self._read(conn)
+                if self.onStats is not None and time.time() >= nextStats:
+                    nextStats = time.time() + self.statsInterval
+                    self.onStats(self.stats.snapshot())
+        finally:
+            self._running = False
+            self._stopped.set()
+
+    def stop(self):
+        self._stop = True
+        if self._running:
+            self._wakeup()
+            # wait for the current select (of at most timeout s) to end
+            self._stopped.wait(self.timeout + 1)
+        for conn in list(self._connections.values()):
+            self._close(conn)
+        self._selector.close()
+        self.socket.close()
+        self._wakeupReader.close()
+        self._wakeupWriter.close()
+
+
 class LogNameFilter(logging.Filter):
 
     def __init__(self, name=None):
@@ -159,7 +573,7 @@ class LogNameFilter(logging.Filter):
         return record.name == name
 
 
-def log(host, port, name=None, level=None):
+def log(host, port, name=None, level=None, stats=False):
     local_logger_name = "RemoteLogger.%s.%d" % (host, port)
     local_logger = logging.getLogger(local_logger_name)
 
@@ -169,8 +583,19 @@ def log(host, port, name=None, level=None):
     if level is not None:
         local_logger.setLevel(level)
 
-    tcpserver = LogRecordSocketReceiver(host=host, port=port,
-                                        logger=local_logger)
+    if selectors is None:
+        tcpserver = LogRecordSocketReceiver(host=host, port=port,
+                                            logger=local_logger)
+    else:
+        if name is not None:
+            name = "^%s$" % re.escape(name)
+        tcpserver = LogRecordSelectorReceiver(host=host, port=port,
+                                              logger=local_logger,
+                                              level=level, name=name)
+        if stats:
+            def printStats(snapshot):
+                print(LogReceiverStats.format(snapshot), file=sys.stderr)
+            tcpserver.onStats = printStats
     msg = "logging for '%s' on port %d" % (host, port)
     if name is not None:
         msg += " for " + name
@@ -194,13 +619,15 @@ def log(host, port, name=None, level=None):
                                  'debug', 'trace']),
               default='debug', show_default=True,
               help='filter specific log level')
-def logmon_cmd(port, log_name, log_level):
+@click.option('--stats', 'stats', is_flag=True, default=False,
+              help='periodically print throughput and lag statistics')
+def logmon_cmd(port, log_name, log_level, stats):
     """Show the console-based Taurus Remote Log Monitor"""
     import taurus
     host = socket.gethostname()
     level = getattr(taurus, log_level.capitalize(), taurus.Trace)
 
-    log(host=host, port=port, name=log_name, level=level)
+    log(host=host, port=port, name=log_name, level=level, stats=stats)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Test for taurus.core.util.aio"""
+
+__docformat__ = 'restructuredtext'
+
+import unittest
+
+from taurus.test import insertTest
+
+try:
+    import asyncio
+    from taurus.core.util import aio
+except ImportError:
+    aio = None
+
+
+_FOO = 'eval:@taurus.core.evaluation.test.res.mymod.MyClass()/self.foo'
+
+
+@insertTest(helper_name='dropPolicy', policy='oldest',
+            expected=[('a', 4), ('b', 3)], dropped=3)
+@insertTest(helper_name='dropPolicy', policy='newest',
+            expected=[('a', 0), ('b', 1)], dropped=3)
+@insertTest(helper_name='dropPolicy', policy='latest',
+            expected=[('a', 4), ('b', 3)], dropped=3)
+@unittest.skipIf(aio is None, 'asyncio not available')
+class AsyncAttributeEventIteratorTestCase(unittest.TestCase):
+    """TestCase for AsyncAttributeEventIterator"""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def _next(self, it):
+        return self.loop.run_until_complete(it.__anext__())
+
+    def dropPolicy(self, policy, expected, dropped):
+        """check the events kept when the queue is full"""
+        it = aio.AsyncAttributeEventIterator(maxsize=2, policy=policy,
+                                             loop=self.loop)
+        for i, src in enumerate('ababa'):
+            it.fireEvent(src, i)
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertEqual(it.qsize(), 2)
+        self.assertEqual(it.dropped, dropped)
+        self.assertEqual(sorted([self._next(it), self._next(it)]), expected)
+
+    def test_waiter(self):
+        """check that a pending __anext__ gets the next event"""
+        it = aio.AsyncAttributeEventIterator(loop=self.loop)
+        fut = it.__anext__()
+        self.loop.call_soon(it.fireEvent, 'a', 1)
+        self.assertEqual(self.loop.run_until_complete(fut), ('a', 1))
+
+    def test_runningLoop(self):
+        """check that the loop is the running loop of the first user"""
+        it = aio.AsyncAttributeEventIterator()
+        it.fireEvent('a', 1)  # received before the loop is known
+        futs = []
+        self.loop.call_soon(lambda: futs.append(it.__anext__()))
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertIs(it._loop, self.loop)
+        self.assertEqual(self.loop.run_until_complete(futs[0]), ('a', 1))
+        it.fireEvent('b', 2)
+        self.assertEqual(self._next(it), ('b', 2))
+
+    def test_close(self):
+        """check that the iteration stops after close"""
+        it = aio.AsyncAttributeEventIterator(loop=self.loop)
+        fut = it.__anext__()
+        it.close()
+        self.assertRaises(StopAsyncIteration,
+                          self.loop.run_until_complete, fut)
+        it.fireEvent('a', 1)
+        self.assertRaises(StopAsyncIteration, self._next, it)
+
+    def test_readWrite(self):
+        """check the awaitable reads and writes"""
+        from taurus.core.units import Quantity
+        it = aio.AsyncAttributeEventIterator(_FOO, loop=self.loop)
+        self.addCleanup(it.close)
+        self.loop.run_until_complete(aio.write(_FOO, Quantity(5, 'm'),
+                                               loop=self.loop))
+        value = self.loop.run_until_complete(aio.read(_FOO, loop=self.loop))
+        self.assertEqual(value.rvalue, Quantity(5, 'm'))
+        values = self.loop.run_until_complete(
+            aio.gather([_FOO, 'eval:2'], loop=self.loop))
+        self.assertEqual([v.rvalue for v in values],
+                         [Quantity(5, 'm'), Quantity(2)])
+        attr, value = self.loop.run_until_complete(
+            asyncio.wait_for(it.__anext__(), 10))
+        self.assertEqual(attr.getSimpleName(), 'self.foo')
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Test for taurus.core.util.event"""
+
+__docformat__ = 'restructuredtext'
+
+import gc
+import unittest
+
+import taurus
+from taurus.core.util.event import CallableRef, ListenerSet
+
+
+class _Listener(object):
+
+    def eventReceived(self, *args):
+        pass
+
+
+class ListenerSetTestCase(unittest.TestCase):
+    """TestCase for ListenerSet"""
+
+    def test_addRemove(self):
+        """check that listeners are added once and removed in O(1)"""
+        listeners = [_Listener() for _ in range(3)]
+        s = ListenerSet()
+        for l in listeners:
+            self.assertTrue(s.add(CallableRef(l)))
+        self.assertFalse(s.add(CallableRef(listeners[0])))
+        self.assertEqual(len(s), 3)
+        self.assertTrue(CallableRef(listeners[1]) in s)
+        self.assertTrue(s.remove(CallableRef(listeners[1])))
+        self.assertFalse(s.remove(CallableRef(listeners[1])))
+        self.assertFalse(CallableRef(listeners[1]) in s)
+        self.assertEqual([r() for r in s], [listeners[0], listeners[2]])
+
+    def test_boundMethods(self):
+        """check that bound methods are identified by object and function"""
+        l1, l2 = _Listener(), _Listener()
+        s = ListenerSet()
+        self.assertTrue(s.add(CallableRef(l1.eventReceived)))
+        self.assertFalse(s.add(CallableRef(l1.eventReceived)))
+        self.assertTrue(s.add(CallableRef(l2.eventReceived)))
+        self.assertTrue(s.remove(CallableRef(l1.eventReceived)))
+        self.assertEqual(len(s), 1)
+
+    def test_snapshot(self):
+        """check that the snapshot is only rebuilt on membership changes"""
+        l1, l2 = _Listener(), _Listener()
+        s = ListenerSet()
+        s.add(CallableRef(l1))
+        snapshot = s.snapshot()
+        self.assertIs(s.snapshot(), snapshot)
+        s.add(CallableRef(l1))
+        self.assertIs(s.snapshot(), snapshot)
+        s.add(CallableRef(l2))
+        self.assertIsNot(s.snapshot(), snapshot)
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(len(s.snapshot()), 2)
+
+    def test_dead(self):
+        """check the removal of the references from their callback"""
+        s = ListenerSet()
+        l = _Listener()
+        s.add(CallableRef(l, s.removeDead))
+        del l
+        gc.collect()
+        self.assertEqual(len(s), 0)
+        self.assertEqual(s.snapshot(), ())
+
+    def test_deadNotRemoved(self):
+        """check that a dead reference left in the set (e.g. a bound method
+        whose del_cb died) does not prevent adding a new listener which
+        reuses its id"""
+        s = ListenerSet()
+        l1 = _Listener()
+        s.add(CallableRef(l1.eventReceived))
+        key = s._key(CallableRef(l1.eventReceived))
+        del l1
+        gc.collect()
+        self.assertEqual(len(s), 1)  # not removed: no callback was given
+        # simulate a new object with the same id as the dead one
+        l2 = _Listener()
+        ref = CallableRef(l2.eventReceived)
+        dead = s._refs.pop(key)
+        s._refs[s._key(ref)] = dead
+        s._keys[id(dead)] = s._key(ref)
+        self.assertFalse(ref in s)
+        self.assertTrue(s.add(ref))
+        self.assertEqual([r() for r in s], [l2.eventReceived])
+
+    def test_boundMethodListeners(self):
+        """check that bound method listeners are always added to a model
+        even if the ids of the previous (dead) listeners are reused"""
+        attr = taurus.Attribute('eval:1')
+        listener = None
+        for _ in range(50):
+            del listener
+            listener = _Listener()
+            self.assertTrue(attr.addListener(listener.eventReceived))
+        attr.removeListener(listener.eventReceived)
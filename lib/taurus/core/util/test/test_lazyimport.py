@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+
+"""Test for taurus.core.util.lazyimport"""
+
+__docformat__ = 'restructuredtext'
+
+import os
+import sys
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+from taurus.core.util.lazyimport import getExportedNames
+
+
+_INIT = """
+from taurus.core.util.lazyimport import lazyExports
+lazyExports(__name__, ['mod_a', 'mod_b', 'mod_c'], lazy=%s)
+"""
+
+_MODULES = {
+    'mod_a': "__all__ = ['A', 'Common']\nA = 'a'\nCommon = 'a'\n",
+    'mod_b': "__all__ = ['B', 'Common']\nB = 'b'\nCommon = 'b'\n",
+    # without literal __all__
+    'mod_c': "C = 'c'\n_hidden = 'c'\n",
+}
+
+
+class LazyExportsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        sys.path.insert(0, self.dirname)
+        self.packages = []
+
+    def tearDown(self):
+        sys.path.remove(self.dirname)
+        for name in list(sys.modules):
+            if name.split('.')[0] in self.packages:
+                del sys.modules[name]
+        shutil.rmtree(self.dirname)
+
+    def _makePackage(self, name, lazy):
+        path = os.path.join(self.dirname, name)
+        os.mkdir(path)
+        with open(os.path.join(path, '__init__.py'), 'w') as f:
+            f.write(textwrap.dedent(_INIT % lazy))
+        for modname, src in _MODULES.items():
+            with open(os.path.join(path, modname + '.py'), 'w') as f:
+                f.write(src)
+        self.packages.append(name)
+        return __import__(name)
+
+    def test_getExportedNames(self):
+        """Check that __all__ is read without importing the module"""
+        path = os.path.join(self.dirname, 'm.py')
+        with open(path, 'w') as f:
+            f.write("raise ImportError\n__all__ = ('x', 'y')\n")
+        self.assertEqual(getExportedNames(path), ['x', 'y'])
+        with open(path, 'w') as f:
+            f.write("__all__ = ['x'] + []\n")
+        self.assertIsNone(getExportedNames(path))
+
+    def test_eager(self):
+        """Check that the names are exported as with import *"""
+        pkg = self._makePackage('_lazytest_eager', False)
+        self.assertIn('_lazytest_eager.mod_a', sys.modules)
+        self.assertEqual((pkg.A, pkg.B, pkg.C, pkg.Common),
+                         ('a', 'b', 'c', 'b'))
+        self.assertFalse(hasattr(pkg, '_hidden'))
+
+    @unittest.skipIf(sys.version_info < (3, 7), "requires PEP 562")
+    def test_lazy(self):
+        """Check that the modules are imported on first access"""
+        pkg = self._makePackage('_lazytest_lazy', True)
+        self.assertNotIn('_lazytest_lazy.mod_a', sys.modules)
+        self.assertEqual(pkg.A, 'a')
+        self.assertIn('_lazytest_lazy.mod_a', sys.modules)
+        self.assertNotIn('_lazytest_lazy.mod_b', sys.modules)
+        self.assertEqual((pkg.B, pkg.C, pkg.Common), ('b', 'c', 'b'))
+        self.assertIs(pkg.mod_b, sys.modules['_lazytest_lazy.mod_b'])
+        self.assertRaises(AttributeError, getattr, pkg, 'D')
+        self.assertEqual(set(pkg.__all__) & set('ABC'), set('ABC'))
+        ns = {}
+        exec('from _lazytest_lazy import *', ns)
+        self.assertEqual(ns['Common'], 'b')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Test for taurus.core.util.log"""
+
+__docformat__ = 'restructuredtext'
+
+import gc
+import logging
+import unittest
+
+from taurus import tauruscustomsettings
+from taurus.core.util.log import Logger
+
+
+class _Handler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class LoggerTestCase(unittest.TestCase):
+    """TestCase for the binding of the loggers of Logger objects"""
+
+    def setUp(self):
+        self._level = Logger.getLogLevel()
+        Logger.setLogLevel(Logger.Info)
+
+    def tearDown(self):
+        Logger.setLogLevel(self._level)
+        Logger._log_per_class = None
+
+    def test_lazyBinding(self):
+        """check that the logger is only bound when needed"""
+        name = 'test_lazyBinding_%d' % id(self)
+        l = Logger(name)
+        l.debug('discarded')
+        self.assertIsNone(l._log_obj)
+        self.assertNotIn(name, logging.Logger.manager.loggerDict)
+        h = _Handler()
+        l.addLogHandler(h)
+        l.info('recorded')
+        l.debug('discarded')
+        self.assertEqual([r.getMessage() for r in h.records], ['recorded'])
+        self.assertIs(l.getLogObj(), logging.getLogger(name))
+
+    def test_perClass(self):
+        """check that loggers are shared by class if LOG_PER_CLASS is set"""
+        Logger._log_per_class = True
+        l1, l2 = Logger('a'), Logger('b')
+        self.assertIs(l1.getLogObj(), l2.getLogObj())
+        self.assertEqual(l1.getLogObj().name, 'Logger')
+        l2.addLogHandler(_Handler())
+        self.assertEqual(l2.getLogObj().name, 'b')
+
+    def test_perClassFirstHandler(self):
+        """check that a handler added before any logger is bound (with
+        LOG_PER_CLASS set) is not added to the logger of the class"""
+        Logger._log_per_class = None
+        old = getattr(tauruscustomsettings, 'LOG_PER_CLASS', False)
+        tauruscustomsettings.LOG_PER_CLASS = True
+        try:
+            l = Logger('c')
+            l.addLogHandler(_Handler())
+            self.assertEqual(l.getLogObj().name, 'c')
+            self.assertEqual(logging.getLogger('Logger').handlers, [])
+        finally:
+            tauruscustomsettings.LOG_PER_CLASS = old
+
+    def test_children(self):
+        """check that children which no longer exist are forgotten"""
+        parent = Logger('parent')
+        child = Logger('child', parent)
+        self.assertEqual(parent.getChildren(), [child])
+        self.assertEqual(child.getLogFullName(), 'parent.child')
+        del child
+        gc.collect()
+        self.assertEqual(parent.getChildren(), [])
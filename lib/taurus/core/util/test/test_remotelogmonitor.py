@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Test for taurus.core.util.remotelogmonitor"""
+
+__docformat__ = 'restructuredtext'
+
+import time
+import logging
+import logging.handlers
+import threading
+import unittest
+
+from taurus.core.util.remotelogmonitor import (BatchedSocketHandler,
+                                               LogRecordSelectorReceiver,
+                                               selectors)
+
+
+class _Receiver(LogRecordSelectorReceiver):
+
+    def __init__(self, *args, **kwargs):
+        LogRecordSelectorReceiver.__init__(self, *args, **kwargs)
+        self.received = []
+
+    def handleLogRecords(self, records):
+        self.received.extend(records)
+
+
+@unittest.skipIf(selectors is None, "selectors not available")
+class LogRecordSelectorReceiverTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.receiver = _Receiver(host='localhost', port=0)
+        self.thread = threading.Thread(
+            target=self.receiver.serve_until_stopped)
+        self.thread.daemon = True
+        self.thread.start()
+        self.logger = logging.getLogger("RemoteLogMonitorTest")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.handlers = []
+
+    def tearDown(self):
+        for h in self.handlers:
+            self.logger.removeHandler(h)
+            h.close()
+        self.receiver.stop()
+        self.thread.join()
+
+    def _addHandler(self, klass, *args, **kwargs):
+        h = klass('localhost', self.receiver.port, *args, **kwargs)
+        self.logger.addHandler(h)
+        self.handlers.append(h)
+        return h
+
+    def _waitFor(self, n, timeout=5):
+        t0 = time.time()
+        while len(self.receiver.received) < n and time.time() - t0 < timeout:
+            time.sleep(0.01)
+        return [r.getMessage() for r in self.receiver.received]
+
+    def test_batches(self):
+        """Check that batched (compressed) records are received in order"""
+        self._addHandler(BatchedSocketHandler, capacity=50)
+        for i in range(120):
+            self.logger.info("message %d", i)
+        got = self._waitFor(120)
+        self.assertEqual(got, ["message %d" % i for i in range(120)])
+        stats = self.receiver.stats.snapshot()
+        self.assertEqual(stats['records'], 120)
+        self.assertEqual(stats['frames'], 3)
+
+    def test_socket_handler(self):
+        """Check that standard SocketHandler frames are also accepted"""
+        self._addHandler(logging.handlers.SocketHandler)
+        for i in range(3):
+            self.logger.warning("message %d", i)
+        got = self._waitFor(3)
+        self.assertEqual(got, ["message %d" % i for i in range(3)])
+
+    def test_filter(self):
+        """Check that the filter set in the receiver is applied by the
+        handler"""
+        h = self._addHandler(BatchedSocketHandler)
+        self.logger.info("first")
+        h.flush()
+        self._waitFor(1)
+        self.receiver.setFilter(level=logging.WARNING)
+        time.sleep(0.1)
+        self.logger.info("second")
+        h.flush()  # sends "second" and reads the filter
+        self.logger.info("third")
+        self.logger.warning("fourth")
+        h.flush()
+        got = self._waitFor(3)
+        self.assertEqual(got, ["first", "second", "fourth"])
+
+    def test_filter_partial_write(self):
+        """Check that control frames larger than the socket buffers are
+        sent completely (so that the last filter is applied)"""
+        h = self._addHandler(BatchedSocketHandler)
+        self.logger.info("first")
+        h.flush()
+        self._waitFor(1)
+        # a (huge) name filter which lets the records of the test pass
+        self.receiver.setFilter(name='RemoteLogMonitorTest|' + 'x' * (1 << 22))
+        self.receiver.setFilter(level=logging.WARNING)
+        t0 = time.time()
+        while h._filterLevel != logging.WARNING and time.time() - t0 < 10:
+            self.logger.error("flush")
+            h.flush()  # reads the available control frames
+            time.sleep(0.01)
+        self.assertEqual(h._filterLevel, logging.WARNING)
+        self.assertIsNone(h._filterName)
+
+    def test_large_frame(self):
+        """Check that frames larger than a read are reassembled"""
+        self._addHandler(logging.handlers.SocketHandler)
+        big = 'x' * (1 << 21)
+        self.logger.info(big)
+        self.logger.info("after")
+        got = self._waitFor(2)
+        self.assertEqual(got, [big, "after"])
+
+    def test_stop_not_started(self):
+        """Check that a receiver which was never served can be stopped"""
+        receiver = _Receiver(host='localhost', port=0)
+        t0 = time.time()
+        receiver.stop()
+        self.assertLess(time.time() - t0, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
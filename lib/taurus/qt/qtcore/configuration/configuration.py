@@ -33,11 +33,142 @@ from builtins import str
 from builtins import object
 from future.utils import string_types
 
-__all__ = ["configurableProperty", "BaseConfigurableClass"]
+import zlib
+import struct
+import pickle
+import hashlib
+
+__all__ = ["configurableProperty", "BaseConfigurableClass", "encodeConfig",
+           "decodeConfig"]
 
 __docformat__ = 'restructuredtext'
 
 
+# Binary configuration format:
+#   _CONFIG_MAGIC, format version (uint8), zlib compressed root node
+# where each node is:
+#   shell length (uint32), number of delegates (uint32), shell,
+#   and for each delegate:
+#     name length (uint16), utf-8 name, sha1 digest of the node (20 bytes),
+#     node length (uint32), node
+# The shell is the pickled configdict in which the configdicts of the
+# delegates are replaced by None.
+_CONFIG_MAGIC = b'TAURUSCFG'
+_CONFIG_FORMAT_VERSION = 1
+
+
+def _encodeNode(configdict):
+    delegates = []
+    if BaseConfigurableClass.isTaurusConfig(configdict):
+        itemcfgs = dict(configdict["__itemConfigurations__"])
+        for k in configdict["__orderedConfigNames__"]:
+            v = itemcfgs.get(k)
+            if BaseConfigurableClass.isTaurusConfig(v):
+                delegates.append((k, _encodeNode(v)))
+                itemcfgs[k] = None
+        configdict = dict(configdict, __itemConfigurations__=itemcfgs)
+    shell = pickle.dumps(configdict, 2)
+    chunks = [struct.pack('>LL', len(shell), len(delegates)), shell]
+    for name, node in delegates:
+        name = name.encode('utf-8')
+        chunks += [struct.pack('>H', len(name)), name,
+                   hashlib.sha1(node).digest(), struct.pack('>L', len(node)),
+                   node]
+    return b''.join(chunks)
+
+
+def _decodeNode(data, lazy):
+    shell_len, n = struct.unpack_from('>LL', data, 0)
+    pos = 8
+    configdict = pickle.loads(data[pos:pos + shell_len])
+    pos += shell_len
+    for _ in range(n):
+        name_len, = struct.unpack_from('>H', data, pos)
+        pos += 2
+        name = data[pos:pos + name_len].decode('utf-8')
+        pos += name_len
+        digest = data[pos:pos + 20]
+        node_len, = struct.unpack_from('>L', data, pos + 20)
+        pos += 24
+        node = data[pos:pos + node_len]
+        pos += node_len
+        if lazy:
+            node = _EncodedConfig(node, digest)
+        else:
+            node = _decodeNode(node, False)
+        configdict["__itemConfigurations__"][name] = node
+    return configdict
+
+
+class _EncodedConfig(object):
+    """The (not yet decoded) configdict of a delegate in a configdict
+    returned by :func:`decodeConfig` with lazy=True"""
+
+    __slots__ = ('data', 'digest')
+
+    def __init__(self, data, digest):
+        self.data = data
+        self.digest = digest
+
+    def decode(self, lazy=True):
+        return _decodeNode(self.data, lazy)
+
+    def matches(self, item):
+        """Returns True if this is the current configuration of item"""
+        try:
+            current = _encodeNode(item.createConfig(allowUnpickable=False))
+        except Exception:
+            return False
+        return hashlib.sha1(current).digest() == self.digest
+
+
+def encodeConfig(configdict):
+    """Encodes a configdict in the binary configuration format.
+
+    Compared to pickling the configdict, the configuration of each delegate
+    is stored separately (along with its hash) so that it can be decoded
+    only when it is applied, and skipped if it is the current one (see
+    :func:`decodeConfig`)
+
+    :param configdict: (dict) configdict (see
+                       :meth:`BaseConfigurableClass.createConfig`)
+
+    :return: (bytes) the encoded configuration
+    """
+    return (_CONFIG_MAGIC + struct.pack('>B', _CONFIG_FORMAT_VERSION)
+            + zlib.compress(_encodeNode(configdict), 1))
+
+
+def decodeConfig(data, lazy=False):
+    """Decodes a configuration encoded with :func:`encodeConfig` or pickled.
+
+    :param data: (bytes) the encoded configuration
+    :param lazy: (bool) if True, the configdicts of the delegates are only
+                 decoded by :meth:`BaseConfigurableClass.applyConfig` when
+                 they differ from the current configuration of the
+                 delegate. Use it only for passing the result to
+                 :meth:`BaseConfigurableClass.applyConfig`
+
+    :return: (dict) the configdict
+    """
+    data = bytes(data)
+    if not data.startswith(_CONFIG_MAGIC):
+        return pickle.loads(data)
+    pos = len(_CONFIG_MAGIC)
+    version, = struct.unpack_from('>B', data, pos)
+    if version > _CONFIG_FORMAT_VERSION:
+        raise ValueError(
+            'Unsupported configuration format version %d' % version)
+    return _decodeNode(zlib.decompress(data[pos + 1:]), lazy)
+
+
+def _dumpConfig(configdict):
+    from taurus import tauruscustomsettings
+    if getattr(tauruscustomsettings, 'CONFIG_BINARY_FORMAT', False):
+        return encodeConfig(configdict)
+    return pickle.dumps(configdict)
+
+
 class configurableProperty(object):
     '''A dummy class used to handle properties with the configuration API
 
@@ -237,8 +368,17 @@ class BaseConfigurableClass(object):
             # we use the sorted item names that was stored in the configdict
             for key in configdict["__orderedConfigNames__"]:
                 if key in self.__configurableItems:
-                    self.__configurableItems[key].applyConfig(
-                        itemcfgs[key], depth=depth - 1)
+                    item = self.__configurableItems[key]
+                    cfg = itemcfgs[key]
+                    if isinstance(cfg, _EncodedConfig):
+                        if isinstance(item, configurableProperty):
+                            cfg = cfg.decode(lazy=False)
+                        elif cfg.matches(item):
+                            # skip the delegates which are already configured
+                            continue
+                        else:
+                            cfg = cfg.decode()
+                    item.applyConfig(cfg, depth=depth - 1)
 
     def getConfigurableItemNames(self):
         '''returns an ordered list of the names of currently registered
@@ -403,15 +543,15 @@ class BaseConfigurableClass(object):
         returns the current configuration status encoded as a QByteArray. This
         state can therefore be easily stored using QSettings
 
-        :return: (QByteArray) (in the current implementation this is just a
-                 pickled configdict encoded as a QByteArray
+        :return: (QByteArray) (a pickled configdict or, if the
+                 CONFIG_BINARY_FORMAT custom setting is True, a configdict
+                 encoded with :func:`encodeConfig`, as a QByteArray)
 
         .. seealso:: :meth:`restoreQConfig`
         '''
         from taurus.external.qt import Qt
-        import pickle
         configdict = self.createConfig(allowUnpickable=False)
-        return Qt.QByteArray(pickle.dumps(configdict))
+        return Qt.QByteArray(_dumpConfig(configdict))
 
     def applyQConfig(self, qstate):
         '''
@@ -423,8 +563,7 @@ class BaseConfigurableClass(object):
         '''
         if qstate.isNull():
             return
-        import pickle
-        configdict = pickle.loads(qstate.data())
+        configdict = decodeConfig(qstate.data(), lazy=True)
         self.applyConfig(configdict)
 
     def saveConfigFile(self, ofile=None):
@@ -434,7 +573,6 @@ class BaseConfigurableClass(object):
 
         :return: (str) file name used
         """
-        import pickle
         if ofile is None:
             from taurus.external.qt import compat
             ofile, _ = compat.getSaveFileName(
@@ -448,7 +586,7 @@ class BaseConfigurableClass(object):
             ofile = open(ofile, 'wb')
         configdict = self.createConfig(allowUnpickable=False)
         self.info("Saving current settings in '%s'" % ofile.name)
-        pickle.dump(configdict, ofile)
+        ofile.write(_dumpConfig(configdict))
         return ofile.name
 
     def loadConfigFile(self, ifile=None):
@@ -458,7 +596,6 @@ class BaseConfigurableClass(object):
 
         :return: (str) file name used
         """
-        import pickle
         if ifile is None:
             from taurus.external.qt import compat
             ifile, _ = compat.getOpenFileName(
@@ -468,6 +605,6 @@ class BaseConfigurableClass(object):
         if isinstance(ifile, string_types):
             ifile = open(ifile, 'rb')
 
-        configdict = pickle.load(ifile)
+        configdict = decodeConfig(ifile.read(), lazy=True)
         self.applyConfig(configdict)
         return ifile.name
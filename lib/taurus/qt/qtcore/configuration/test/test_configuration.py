@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+
+"""Test for taurus.qt.qtcore.configuration"""
+
+__docformat__ = 'restructuredtext'
+
+import pickle
+import unittest
+
+from taurus.qt.qtcore.configuration import (BaseConfigurableClass,
+                                            encodeConfig, decodeConfig)
+
+
+class _Configurable(BaseConfigurableClass):
+
+    def __init__(self, name, delegates=()):
+        BaseConfigurableClass.__init__(self)
+        self._name = name
+        self.value = 0
+        self.applied = 0
+        self.registerConfigProperty(self.getValue, self.setValue, 'value')
+        for d in delegates:
+            self.registerConfigDelegate(d)
+
+    def objectName(self):
+        return self._name
+
+    def getValue(self):
+        return self.value
+
+    def setValue(self, value):
+        self.value = value
+        self.applied += 1
+
+
+class EncodeConfigTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.leaves = [_Configurable('leaf%d' % i) for i in range(3)]
+        self.root = _Configurable(
+            'root', [_Configurable('panel', self.leaves)])
+        for i, leaf in enumerate(self.leaves):
+            leaf.value = [i] * 10
+        self.configdict = self.root.createConfig()
+
+    def test_roundtrip(self):
+        """Check that encoded and pickled configdicts are decoded"""
+        data = encodeConfig(self.configdict)
+        self.assertEqual(decodeConfig(data), self.configdict)
+        data = pickle.dumps(self.configdict)
+        self.assertEqual(decodeConfig(data), self.configdict)
+
+    def test_unsupported_version(self):
+        """Check that newer format versions are rejected"""
+        data = bytearray(encodeConfig(self.configdict))
+        data[len(b'TAURUSCFG')] += 1
+        self.assertRaises(ValueError, decodeConfig, bytes(data))
+
+    def test_skip_unchanged(self):
+        """Check that only the changed delegates are applied"""
+        data = encodeConfig(self.configdict)
+        self.leaves[1].value = None
+        self.root.applyConfig(decodeConfig(data, lazy=True))
+        self.assertEqual(self.leaves[1].value, [1] * 10)
+        self.assertEqual([leaf.applied for leaf in self.leaves], [0, 1, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
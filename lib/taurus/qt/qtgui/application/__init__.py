@@ -28,4 +28,8 @@ class."""
 
 __docformat__ = 'restructuredtext'
 
-from .taurusapplication import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, ['taurusapplication'])
+
+del __lazyExports
@@ -28,5 +28,9 @@ should inherit to be considered valid taurus widgets."""
 
 __docformat__ = 'restructuredtext'
 
-from .taurusbase import *
-from .tauruscontroller import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, [
+    'taurusbase', 'tauruscontroller', 'formatter', 'dispatcher'])
+
+del __lazyExports
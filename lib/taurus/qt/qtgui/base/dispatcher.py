@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+# -*- coding: utf-8 -*-
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+
+"""This module provides a dispatcher of taurus events to the Qt thread.
+
+Without it, each :class:`TaurusBaseComponent` emits its own queued
+`taurusEvent` signal from the thread where the event was received, so one
+event of an attribute shown by N widgets causes N cross-thread signals.
+With the dispatcher (enabled with the `T_EVENT_DISPATCHER` custom
+setting), the events are queued and a single cross-thread notification is
+done for all the events received until the Qt thread processes them. The
+`taurusEvent` signals of the components are then emitted in the Qt thread
+(where they are delivered directly).
+"""
+
+__all__ = ["TaurusEventDispatcher", "getEventDispatcher"]
+
+__docformat__ = 'restructuredtext'
+
+import threading
+
+from taurus.external.qt import Qt
+
+
+class TaurusEventDispatcher(Qt.QObject):
+    """Delivers the events posted (from any thread) for taurus components
+    by emitting their `taurusEvent` signal in the thread of the dispatcher
+    (the Qt main thread).
+    """
+
+    _dispatchRequested = Qt.pyqtSignal()
+
+    def __init__(self, parent=None):
+        Qt.QObject.__init__(self, parent)
+        self._lock = threading.Lock()
+        self._pending = []
+        self.postedEvents = 0
+        self.dispatchedBatches = 0
+        self._dispatchRequested.connect(self._dispatch,
+                                        Qt.Qt.QueuedConnection)
+
+    def post(self, component, evt):
+        """Posts an event for the given component. If called from the
+        dispatcher thread while no other events are pending, the
+        `taurusEvent` signal is emitted immediately
+
+        :param component: (TaurusBaseComponent) the component
+        :param evt: (tuple) (evt_src, evt_type, evt_value)
+        """
+        if not self._pending and Qt.QThread.currentThread() == self.thread():
+            component.taurusEvent.emit(*evt)
+            return
+        self.postMany(component, (evt,))
+
+    def postMany(self, component, evts):
+        """Posts several events for the given component (see :meth:`post`),
+        without emitting them immediately"""
+        if not evts:
+            return
+        with self._lock:
+            schedule = not self._pending
+            self._pending.extend((component, evt) for evt in evts)
+            self.postedEvents += len(evts)
+        if schedule:
+            self._dispatchRequested.emit()
+
+    def _dispatch(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self.dispatchedBatches += 1
+        for component, evt in pending:
+            try:
+                component.taurusEvent.emit(*evt)
+            except Exception:
+                pass  # e.g. the underlying C++ object has been deleted
+
+
+_DISPATCHER = None
+_DISPATCHER_LOCK = threading.Lock()
+
+
+def getEventDispatcher():
+    """Returns the TaurusEventDispatcher singleton (it is created, and moved
+    to the thread of the QApplication, the first time)
+
+    :return: (TaurusEventDispatcher)
+    """
+    global _DISPATCHER
+    with _DISPATCHER_LOCK:
+        if _DISPATCHER is None:
+            _DISPATCHER = TaurusEventDispatcher()
+            app = Qt.QCoreApplication.instance()
+            if app is not None:
+                _DISPATCHER.moveToThread(app.thread())
+    return _DISPATCHER
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+
+# -*- coding: utf-8 -*-
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+"""This module provides a cache of compiled format strings, used by
+:meth:`TaurusBaseComponent.displayValue` for formatting values.
+
+A format string (e.g. ``"{:~.{bc.modelObj.precision}f}"``) is parsed once
+per value type into a callable that does not need to parse it again.
+Quantity values with scalar magnitudes are formatted by formatting the
+magnitude and appending a cached units string (this is only done if it gives
+the same result as pint for the given format spec and units).
+"""
+
+__all__ = ["compileFormat", "formatValue", "formatArray"]
+
+__docformat__ = 'restructuredtext'
+
+import re
+import numbers
+from operator import attrgetter
+from string import Formatter
+
+import numpy
+from future.utils import string_types
+
+from taurus.core.units import Quantity
+
+
+_COMPILED = {}
+_MAX_COMPILED = 1000
+_FORMATTER = Formatter()
+_CONVERSIONS = {None: None, 'r': repr, 's': str}
+# flags of the pint format spec that apply to the units (not the magnitude)
+_UNIT_FLAGS = re.compile('[~PLHCD]')
+# format specs that can be applied with printf-style (%) formatting
+_PRINTF_SPEC = re.compile(r'^[-+ 0#]*\d*(\.\d+)?[eEfFgGd]$')
+# (spec, units) --> (magnitude spec, units suffix) or None if not possible
+_QUANTITY_SPECS = {}
+
+
+def _compileSpec(spec):
+    """Returns a callable that returns the format spec for a given `bc`
+    (the spec may contain nested fields such as ``{bc.modelObj.precision}``)
+    or None if the spec uses anything else than bc attributes"""
+    parts = []
+    for literal, field, subspec, conversion in _FORMATTER.parse(spec):
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        if subspec or conversion or not field.startswith('bc.'):
+            return None
+        getter = attrgetter(field[3:])
+        parts.append(getter)
+    if all(isinstance(p, string_types) for p in parts):
+        spec = ''.join(parts)
+        return lambda bc: spec
+
+    def getspec(bc):
+        return ''.join([p if isinstance(p, string_types) else str(p(bc))
+                        for p in parts])
+    return getspec
+
+
+def _quantitySpec(spec, q):
+    """Returns a tuple of (magnitude spec, units suffix) to format a scalar
+    Quantity with the given spec, or None if it cannot be done without pint.
+    The result is cached and checked against the pint formatting"""
+    units = q.units
+    key = (spec, units)
+    try:
+        return _QUANTITY_SPECS[key]
+    except KeyError:
+        pass
+    mspec = _UNIT_FLAGS.sub('', spec)
+    try:
+        suffix = format(units, '~' if '~' in spec else '')
+        if suffix:
+            suffix = ' ' + suffix
+        ret = mspec, suffix
+        if format(q.magnitude, mspec) + suffix != format(q, spec):
+            ret = None
+    except Exception:
+        ret = None
+    _QUANTITY_SPECS[key] = ret
+    return ret
+
+
+def compileFormat(fmt, vtype=object):
+    """Returns a callable (`f(value, bc)`) equivalent to
+    ``fmt.format(value, bc=bc)`` for values of the given type. The compiled
+    callables are cached.
+
+    :param fmt: (str) a python format string with a single replacement
+                field for the value. Nested fields in the format spec may
+                refer to attributes of `bc`
+    :param vtype: (type) type of the values to be formatted
+
+    :return: (callable)
+    """
+    key = (fmt, vtype)
+    try:
+        return _COMPILED[key]
+    except KeyError:
+        pass
+    f = _compile(fmt, vtype)
+    if len(_COMPILED) >= _MAX_COMPILED:
+        _COMPILED.clear()
+    _COMPILED[key] = f
+    return f
+
+
+def _compile(fmt, vtype):
+    def generic(v, bc):
+        return fmt.format(v, bc=bc)
+
+    try:
+        parsed = list(_FORMATTER.parse(fmt))
+    except ValueError:
+        return generic
+    fields = [i for i, p in enumerate(parsed) if p[1] is not None]
+    if len(fields) != 1 or parsed[fields[0]][1] not in ('', '0'):
+        return generic
+    # the literal text (with the escaped braces already unescaped) may be
+    # split in several chunks before and after the field
+    idx = fields[0]
+    prefix = ''.join(p[0] for p in parsed[:idx + 1])
+    suffix = ''.join(p[0] for p in parsed[idx + 1:])
+    _, _, spec, conversion = parsed[idx]
+    getspec = _compileSpec(spec or '')
+    try:
+        conv = _CONVERSIONS[conversion]
+    except KeyError:
+        return generic
+    if getspec is None:
+        return generic
+
+    if conv is not None:
+        def compiled(v, bc):
+            return prefix + format(conv(v), getspec(bc)) + suffix
+    elif issubclass(vtype, Quantity):
+        def compiled(v, bc):
+            spec = getspec(bc)
+            if isinstance(v.magnitude, (numbers.Number, numpy.number)):
+                qspec = _quantitySpec(spec, v)
+                if qspec is not None:
+                    return (prefix + format(v.magnitude, qspec[0]) +
+                            qspec[1] + suffix)
+            return prefix + format(v, spec) + suffix
+    else:
+        def compiled(v, bc):
+            return prefix + format(v, getspec(bc)) + suffix
+    return compiled
+
+
+def formatValue(fmt, value, bc=None):
+    """Formats a value with the given format string. It is equivalent to
+    ``fmt.format(value, bc=bc)`` but faster (see :func:`compileFormat`)
+
+    :param fmt: (str) a python format string
+    :param value: (object) the value to be formatted
+    :param bc: (object) object referred by the ``bc`` fields of the format
+
+    :return: (str)
+    """
+    return compileFormat(fmt, type(value))(value, bc)
+
+
+def formatArray(fmt, values, bc=None):
+    """Formats all the elements of an array with the given format string.
+    Simple numeric format specs (e.g. ``"{:.3f}"``) are applied in a
+    vectorised way (without calling the formatter once per element).
+
+    :param fmt: (str) a python format string
+    :param values: (numpy.ndarray or Quantity) the values to be formatted.
+                   Only the magnitudes of the Quantity values are formatted
+    :param bc: (object) object referred by the ``bc`` fields of the format
+
+    :return: (numpy.ndarray) array of str with the same shape as values
+    """
+    isquantity = isinstance(values, Quantity)
+    if isquantity:
+        values = values.magnitude
+    values = numpy.asarray(values)
+    try:
+        parsed = list(_FORMATTER.parse(fmt))
+    except ValueError:
+        parsed = []
+    if (len(parsed) == 1 and parsed[0][0] == '' and parsed[0][1] in ('', '0')
+            and parsed[0][3] is None and values.dtype.kind in 'biuf'):
+        spec = parsed[0][2] or ''
+        if isquantity:
+            spec = _UNIT_FLAGS.sub('', spec)
+        getspec = _compileSpec(spec)
+        spec = getspec(bc) if getspec is not None else None
+        # other specs (e.g. "d" for floats or the units flags for plain
+        # values) are left to the formatter (which raises if invalid)
+        if (spec is not None and _PRINTF_SPEC.match(spec)
+                and (not spec.endswith('d') or values.dtype.kind in 'biu')):
+            if spec.endswith('d'):
+                values = values.astype(int)
+            return numpy.char.mod('%' + spec, values)
+    if values.size:
+        f = compileFormat(fmt, type(values.flat[0]))
+    else:
+        f = None
+    ret = numpy.empty(values.shape, dtype=object)
+    for idx, v in numpy.ndenumerate(values):
+        ret[idx] = f(v, bc)
+    return ret.astype(str)
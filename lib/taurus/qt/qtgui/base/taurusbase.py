@@ -55,6 +55,8 @@ from taurus.qt.qtcore.mimetypes import TAURUS_MODEL_MIME_TYPE
 from taurus.qt.qtgui.util import ActionFactory
 
 from taurus.core.units import Quantity
+from .formatter import formatValue
+from .dispatcher import getEventDispatcher
 
 
 __all__ = ["TaurusBaseComponent", "TaurusBaseWidget",
@@ -144,6 +146,10 @@ class TaurusBaseComponent(TaurusListener, BaseConfigurableClass):
         self._modelInConfig = False
         self._autoProtectOperation = True
 
+        if getattr(taurus.tauruscustomsettings, 'T_EVENT_DISPATCHER', False):
+            self._eventDispatcher = getEventDispatcher()
+        else:
+            self._eventDispatcher = None
         self._bufferedEvents = {}
         self._bufferedEventsTimer = None
         self.setEventBufferPeriod(self._eventBufferPeriod)
@@ -335,7 +341,9 @@ class TaurusBaseComponent(TaurusListener, BaseConfigurableClass):
             self.fireEvent(*evt)
 
     def fireEvent(self, evt_src=None, evt_type=None, evt_value=None):
-        """Emits a "taurusEvent" signal.
+        """Emits a "taurusEvent" signal (through the
+        :class:`TaurusEventDispatcher` if the `T_EVENT_DISPATCHER` custom
+        setting is enabled).
         It is unlikely that you need to reimplement this method in subclasses.
         Consider reimplementing :meth:`eventReceived` or :meth:`handleEvent`
         instead depending on whether you need to execute code in the python
@@ -351,6 +359,9 @@ class TaurusBaseComponent(TaurusListener, BaseConfigurableClass):
             with self._eventsBufferLock:
                 self._bufferedEvents[(evt_src, evt_type)] = (evt_src, evt_type,
                                                              evt_value)
+        elif self._eventDispatcher is not None:
+            # let the dispatcher emit the signal in the Qt thread
+            self._eventDispatcher.post(self, (evt_src, evt_type, evt_value))
         else:
             # if we are not buffering, directly emit the signal
             try:
@@ -365,8 +376,12 @@ class TaurusBaseComponent(TaurusListener, BaseConfigurableClass):
               but it can also be called any time the buffer needs to be flushed
         '''
         with self._eventsBufferLock:
-            for evt in self._bufferedEvents.values():
-                self.taurusEvent.emit(*evt)
+            if self._eventDispatcher is not None:
+                self._eventDispatcher.postMany(self,
+                                               self._bufferedEvents.values())
+            else:
+                for evt in self._bufferedEvents.values():
+                    self.taurusEvent.emit(*evt)
             self._bufferedEvents = {}
 
     def filterEvent(self, evt_src=-1, evt_type=-1, evt_value=-1):
@@ -780,7 +795,7 @@ class TaurusBaseComponent(TaurusListener, BaseConfigurableClass):
                               ' Reason: %r'), e)
                 self.setFormat(defaultFormatter)
         try:
-            fmt_v = self._format.format(v, bc=self)
+            fmt_v = formatValue(self._format, v, self)
         except Exception:
             self.debug("Invalid format %r for %r. Using '{0}'", self._format, v)
             fmt_v = "{0}".format(v)
@@ -2112,7 +2127,9 @@ class TaurusBaseWritableWidget(TaurusBaseWidget):
         '''reimplemented from :class:`TaurusBaseWidget`'''
         model = self.getModelObj()
         try:
-            model_value = model.getValueObj().wvalue
+            value_obj = model.getValueObj()
+            # compare Quantities also for attributes in raw numeric mode
+            model_value = getattr(value_obj, 'wquantity', value_obj.wvalue)
             wigdet_value = self.getValue()
             if model.areStrValuesEqual(model_value, wigdet_value):
                 self._operations = []
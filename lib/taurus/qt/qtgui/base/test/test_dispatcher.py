@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+"""Unit tests for taurus.qt.qtgui.base.dispatcher"""
+
+import threading
+import unittest
+
+from taurus import tauruscustomsettings
+from taurus.core.taurusbasetypes import TaurusEventType
+from taurus.qt.qtgui.test import BaseWidgetTestCase
+from taurus.qt.qtgui.display import TaurusLabel
+from taurus.qt.qtgui.base.dispatcher import (TaurusEventDispatcher,
+                                             getEventDispatcher)
+
+
+class TaurusEventDispatcherTestCase(BaseWidgetTestCase, unittest.TestCase):
+    """Tests for the delivery of events through the TaurusEventDispatcher"""
+
+    def setUp(self):
+        BaseWidgetTestCase.setUp(self)
+        self.dispatcher = TaurusEventDispatcher()
+        self.widgets = [TaurusLabel() for _ in range(5)]
+        self.received = []
+        for w in self.widgets:
+            w.taurusEvent.connect(self._received)
+
+    def _received(self, evt_src, evt_type, evt_value):
+        self.received.append((evt_src, evt_value))
+
+    def test_batch(self):
+        """check that events posted from a thread are delivered in order
+        in a single batch"""
+        def post():
+            for i, w in enumerate(self.widgets):
+                self.dispatcher.post(w, (w, None, i))
+        th = threading.Thread(target=post)
+        th.start()
+        th.join()
+        self.assertEqual(self.received, [])
+        self.processEvents(repetitions=2)
+        self.assertEqual(self.received,
+                         [(w, i) for i, w in enumerate(self.widgets)])
+        self.assertEqual(self.dispatcher.postedEvents, 5)
+        self.assertEqual(self.dispatcher.dispatchedBatches, 1)
+
+    def test_sameThread(self):
+        """check that events posted from the Qt thread are emitted
+        immediately"""
+        w = self.widgets[0]
+        self.dispatcher.post(w, (w, None, 1))
+        self.assertEqual(self.received, [(w, 1)])
+        self.assertEqual(self.dispatcher.dispatchedBatches, 0)
+
+    def test_emptyBatch(self):
+        """check that posting no events does not request a dispatch"""
+        self.dispatcher.postMany(self.widgets[0], [])
+        self.processEvents(repetitions=2)
+        self.assertEqual(self.dispatcher.postedEvents, 0)
+        self.assertEqual(self.dispatcher.dispatchedBatches, 0)
+
+
+class TaurusBaseComponentDispatcherTestCase(BaseWidgetTestCase,
+                                            unittest.TestCase):
+    """Tests for the events fired by the components when the
+    T_EVENT_DISPATCHER custom setting is enabled"""
+
+    def setUp(self):
+        BaseWidgetTestCase.setUp(self)
+        self._setting = getattr(tauruscustomsettings, 'T_EVENT_DISPATCHER',
+                                False)
+        tauruscustomsettings.T_EVENT_DISPATCHER = True
+        self.dispatcher = getEventDispatcher()
+        self.widget = TaurusLabel()
+        self.received = []
+        self.widget.handleEvent = self._handled
+
+    def tearDown(self):
+        tauruscustomsettings.T_EVENT_DISPATCHER = self._setting
+        self.widget.setEventBufferPeriod(0)
+
+    def _handled(self, evt_src, evt_type, evt_value):
+        self.received.append(evt_value)
+
+    def test_fireEvent(self):
+        """check that the events received in a thread go through the
+        dispatcher to handleEvent"""
+        self.assertIs(self.widget._eventDispatcher, self.dispatcher)
+        batches = self.dispatcher.dispatchedBatches
+
+        def receive():
+            for i in range(3):
+                self.widget.eventReceived(None, TaurusEventType.Change, i)
+        th = threading.Thread(target=receive)
+        th.start()
+        th.join()
+        self.processEvents(repetitions=2)
+        self.assertEqual(self.received, [0, 1, 2])
+        self.assertEqual(self.dispatcher.dispatchedBatches, batches + 1)
+
+    def test_bufferedEvents(self):
+        """check that the buffered events are flushed through the
+        dispatcher and that flushing an empty buffer posts nothing"""
+        self.widget.setEventBufferPeriod(60)
+        posted = self.dispatcher.postedEvents
+        self.widget.fireEvent(None, TaurusEventType.Change, 1)
+        self.widget.fireEvent(None, TaurusEventType.Change, 2)
+        self.widget.fireBufferedEvents()
+        self.widget.fireBufferedEvents()
+        self.processEvents(repetitions=2)
+        self.assertEqual(self.received, [2])
+        self.assertEqual(self.dispatcher.postedEvents, posted + 1)
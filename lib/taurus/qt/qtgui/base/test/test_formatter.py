@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Unit tests for taurus.qt.qtgui.base.formatter"""
+
+import unittest
+
+import numpy
+
+from taurus.test import insertTest
+from taurus.core.units import Quantity
+from taurus.qt.qtgui.base.formatter import formatValue, formatArray
+
+
+class _Obj(object):
+    pass
+
+
+_BC = _Obj()
+_BC.modelObj = _Obj()
+_BC.modelObj.precision = 3
+
+
+@insertTest(helper_name='checkFormat', fmt='{0}', value=5)
+@insertTest(helper_name='checkFormat', fmt='a{{b}}c {} d', value=1.25)
+@insertTest(helper_name='checkFormat', fmt='{{{:.1f}}}', value=1.25)
+@insertTest(helper_name='checkFormat', fmt='val={:.1f}{{x}} end', value=1.25)
+@insertTest(helper_name='checkFormat', fmt='{{}}{!r}', value='a')
+@insertTest(helper_name='checkFormat', fmt='{{{:~.2f}}}',
+            value=Quantity(1.2, 'mm'))
+@insertTest(helper_name='checkFormat', fmt='{!r}', value='a')
+@insertTest(helper_name='checkFormat', fmt='<{:>8.2f}>', value=3.14159)
+@insertTest(helper_name='checkFormat', fmt='{0.modelObj}', value=_BC)
+@insertTest(helper_name='checkFormat', fmt='{:.{bc.modelObj.precision}f}',
+            value=1.23456)
+@insertTest(helper_name='checkFormat', fmt='{:~.{bc.modelObj.precision}f}',
+            value=Quantity(1.23456, 'mm'))
+@insertTest(helper_name='checkFormat', fmt='{:.2f}',
+            value=Quantity(1.2, 'mm'))
+@insertTest(helper_name='checkFormat', fmt='{:~.2f}', value=Quantity(2, ''))
+@insertTest(helper_name='checkFormat', fmt='{:~.2f}',
+            value=Quantity(numpy.arange(3.), 'mm'))
+class FormatValueTestCase(unittest.TestCase):
+    """Checks that formatValue is equivalent to str.format"""
+
+    def checkFormat(self, fmt, value):
+        expected = fmt.format(value, bc=_BC)
+        # twice, to use the cached compiled format too
+        for _ in range(2):
+            self.assertEqual(formatValue(fmt, value, _BC), expected)
+
+    def test_invalidFormat(self):
+        """Checks that invalid formats raise the same as str.format"""
+        self.assertRaises(ValueError, formatValue, '{:d}', 1.5)
+
+
+class FormatArrayTestCase(unittest.TestCase):
+    """Tests for formatArray"""
+
+    def test_vectorised(self):
+        a = numpy.arange(6.).reshape(2, 3)
+        got = formatArray('{:.{bc.modelObj.precision}f}', a, _BC)
+        self.assertEqual(got.shape, (2, 3))
+        self.assertEqual(got.tolist(), [['0.000', '1.000', '2.000'],
+                                        ['3.000', '4.000', '5.000']])
+
+    def test_quantity(self):
+        got = formatArray('{:~.1f}', Quantity(numpy.arange(2.), 'mm'))
+        self.assertEqual(got.tolist(), ['0.0', '1.0'])
+
+    def test_invalidFormat(self):
+        """Checks that specs which are invalid for the elements raise the
+        same as str.format"""
+        self.assertRaises(ValueError, formatArray, '{:d}', numpy.arange(2.))
+        self.assertRaises(ValueError, formatArray, '{:~.1f}',
+                          numpy.arange(2.))
+
+    def test_integer(self):
+        got = formatArray('{:3d}', numpy.arange(2))
+        self.assertEqual(got.tolist(), ['  0', '  1'])
+
+    def test_generic(self):
+        got = formatArray('<{}>', numpy.array(['a', 'b']))
+        self.assertEqual(got.tolist(), ['<a>', '<b>'])
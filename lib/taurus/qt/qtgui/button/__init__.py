@@ -27,5 +27,8 @@
 
 __docformat__ = 'restructuredtext'
 
-from .qbuttonbox import *
-from .taurusbutton import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, ['qbuttonbox', 'taurusbutton'])
+
+del __lazyExports
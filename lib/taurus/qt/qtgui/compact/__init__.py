@@ -28,5 +28,8 @@ to provide several functionalities in a reduced space"""
 
 __docformat__ = 'restructuredtext'
 
-from .abstractswitcher import *
-from .basicswitcher import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, ['abstractswitcher', 'basicswitcher'])
+
+del __lazyExports
@@ -27,11 +27,11 @@
 
 __docformat__ = 'restructuredtext'
 
-from .qcontainer import *
-from .taurusbasecontainer import *
-from .taurusframe import *
-from .tauruswidget import *
-from .taurusgroupbox import *
-from .taurusgroupwidget import *
-from .taurusscrollarea import *
-from .taurusmainwindow import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, [
+    'qcontainer', 'taurusbasecontainer', 'taurusframe', 'tauruswidget',
+    'taurusgroupbox', 'taurusgroupwidget', 'taurusscrollarea',
+    'taurusmainwindow'])
+
+del __lazyExports
@@ -28,5 +28,8 @@ panels like forms or panels to be inserted in dialogs"""
 
 __docformat__ = 'restructuredtext'
 
-from .taurusmessagebox import *
-from .taurusinputdialog import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, ['taurusmessagebox', 'taurusinputdialog'])
+
+del __lazyExports
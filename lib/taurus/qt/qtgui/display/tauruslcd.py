@@ -34,6 +34,7 @@ import collections
 
 from taurus.core.taurusbasetypes import (TaurusElementType, TaurusEventType,
                                          AttrQuality, TaurusDevState)
+from taurus.core.units import magnitude
 from taurus.external.qt import Qt
 from taurus.qt.qtgui.base import TaurusBaseWidget
 from taurus.qt.qtgui.base import TaurusBaseController
@@ -105,9 +106,9 @@ class TaurusLCDControllerAttribute(TaurusScalarAttributeControllerHelper, Taurus
     def _getDisplayValue(self, widget, valueObj, idx, write):
         try:
             if write:
-                value = valueObj.wvalue.magnitude
+                value = magnitude(valueObj.wvalue)
             else:
-                value = valueObj.rvalue.magnitude
+                value = magnitude(valueObj.rvalue)
             if idx is not None and len(idx):
                 for i in idx:
                     value = value[i]
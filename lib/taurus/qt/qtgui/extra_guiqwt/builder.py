@@ -37,7 +37,7 @@ from guiqwt.image import ImageParam, XYImageItem
 from guiqwt.styles import XYImageParam
 from guiqwt.config import _
 from guiqwt.histogram import lut_range_threshold
-from taurus.core.units import Quantity
+from taurus.core.units import magnitude
 
 __all__ = ["TaurusPlotItemBuilder", "make"]
 
@@ -126,9 +126,7 @@ class TaurusPlotItemBuilder(guiqwt.builder.PlotItemBuilder):
                 attr = Attribute(taurusmodel)
                 valueobj = attr.read()
                 data = getattr(valueobj, 'rvalue', numpy.zeros((1, 1)))
-                attrdata = data
-                if isinstance(data, Quantity):
-                    attrdata = data.magnitude
+                attrdata = magnitude(data)
                 xmin, xmax, ymin, ymax = self.compute_bounds(attrdata,
                                                              pixel_size)
 
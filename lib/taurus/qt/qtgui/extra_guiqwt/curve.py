@@ -36,6 +36,7 @@ from guiqwt.curve import CurveItem
 from taurus.qt.qtgui.extra_guiqwt.styles import TaurusCurveParam, TaurusTrendParam
 
 from taurus.core.util.containers import ArrayBuffer
+from taurus.core.units import magnitude
 import numpy
 
 __all__ = ["TaurusCurveItem"]
@@ -98,7 +99,7 @@ class TaurusCurveItem(CurveItem, TaurusBaseComponent):
         # TODO: Take units into account for displaying curves, axis, etc.
         try:
             if self._ycomp.isNumeric():
-                yvalue = self._ycomp.read().rvalue.magnitude
+                yvalue = magnitude(self._ycomp.read().rvalue)
             else:
                 yvalue = self._ycomp.read().rvalue
         except:
@@ -110,7 +111,7 @@ class TaurusCurveItem(CurveItem, TaurusBaseComponent):
         # TODO: Take units into account for displaying curves, axis, etc.
         try:
             if self._xcomp.isNumeric():
-                xvalue = self._xcomp.read().rvalue.magnitude
+                xvalue = magnitude(self._xcomp.read().rvalue)
             else:
                 xvalue = self._xcomp.read().rvalue
         except:
@@ -235,7 +236,7 @@ class TaurusTrendItem(CurveItem, TaurusBaseComponent):
         # update y
         # TODO: Take units into account for displaying curves, axis, etc.
         if self.__yBuffer.isNumeric():
-            self.__yBuffer.append(evt_value.rvalue.magnitude)
+            self.__yBuffer.append(magnitude(evt_value.rvalue))
         else:
             self.__yBuffer.append(evt_value.rvalue)
 
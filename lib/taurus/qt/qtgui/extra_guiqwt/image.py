@@ -30,7 +30,7 @@ __all__ = ["TaurusImageItem", "TaurusRGBImageItem", "TaurusTrend2DItem",
            "TaurusTrend2DScanItem", "TaurusEncodedImageItem",
            "TaurusEncodedRGBImageItem"]
 
-from taurus.core.units import Quantity
+from taurus.core.units import magnitude
 from taurus.external.qt import Qt
 from taurus.qt.qtgui.base import TaurusBaseComponent
 from taurus.qt.qtcore.util import baseSignal
@@ -63,10 +63,8 @@ class TaurusBaseImageItem(TaurusBaseComponent):
         if evt_value is None or getattr(evt_value, 'rvalue', None) is None:
             self.debug('Ignoring event from %s' % repr(evt_src))
             return
-        v = evt_value.rvalue
-        if isinstance(v, Quantity):
-            v = v.magnitude
-            # TODO: units should be used for setting some title in the colorbar
+        v = magnitude(evt_value.rvalue)
+        # TODO: units should be used for setting some title in the colorbar
         try:
             v = self.filterData(v)
         except Exception as e:
@@ -359,10 +357,8 @@ class TaurusTrend2DItem(XYImageItem, TaurusBaseComponent):
         self._xBuffer.append(x)
 
         # update z
-        rvalue = evt_value.rvalue
-        if isinstance(evt_value.rvalue, Quantity):
-            rvalue = evt_value.rvalue.magnitude
-            # TODO: units should be checked for coherence with previous values
+        rvalue = magnitude(evt_value.rvalue)
+        # TODO: units should be checked for coherence with previous values
         self._zBuffer.append(rvalue)
 
         # check if there is enough data to start plotting
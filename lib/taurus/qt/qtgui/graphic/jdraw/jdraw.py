@@ -39,6 +39,7 @@ from taurus.core.util.singleton import Singleton
 from taurus.core.util.containers import CaselessDict
 from taurus.qt.qtgui.graphic import (TaurusBaseGraphicsFactory,
                                      TaurusGraphicsScene, TaurusGraphicsItem)
+from taurus.qt.qtgui.graphic.jdraw.jdraw_parser import JDElement
 
 
 __all__ = ["TaurusJDrawGraphicsFactory"]
@@ -117,6 +118,17 @@ class TaurusJDrawGraphicsFactory(Singleton, TaurusBaseGraphicsFactory, Logger):
 
     def getSceneObj(self, items):
         scene = TaurusGraphicsScene(self.myparent)
+        self.addSceneItems(scene, items)
+        return scene
+
+    def addSceneItems(self, scene, items):
+        """Adds the given items (or widgets) to the scene
+
+        :param scene: (TaurusGraphicsScene) the scene
+        :param items: (iterable) items to be added. It can be a generator
+                      (e.g. :meth:`getElementObjs`), in which case the items
+                      are created as they are added to the scene
+        """
         for item in items:
             try:
                 if isinstance(item, Qt.QWidget):
@@ -126,7 +138,38 @@ class TaurusJDrawGraphicsFactory(Singleton, TaurusBaseGraphicsFactory, Logger):
             except:
                 self.warning("Unable to add item %s to scene" % str(item))
                 self.debug("Details:", exc_info=1)
-        return scene
+
+    def getElementObj(self, element):
+        """Creates the object corresponding to a :class:`JDElement` (as
+        returned by :func:`jdraw_parser.load`). The elements contained in
+        its parameters (e.g. group children) are created before it.
+
+        :param element: (JDElement) the element
+
+        :return: (QGraphicsItem or None) the created object
+        """
+        params = dict(element.params)
+        for k, v in list(params.items()):
+            if isinstance(v, list) and v and isinstance(v[0], JDElement):
+                params[k] = [o for o in (self.getElementObj(e) for e in v)
+                             if o is not None]
+        obj = self.getObj(element.type, params)
+        if obj is None:
+            self.info("Unable to create obj '%s'" % element.type)
+        return obj
+
+    def getElementObjs(self, elements):
+        """Generator that creates (one by one) the objects corresponding to
+        the given list of top level elements.
+
+        :param elements: (list<JDElement>) the elements
+
+        :return: (generator<QGraphicsItem>) the created objects
+        """
+        for element in elements:
+            obj = self.getElementObj(element)
+            if obj is not None:
+                yield obj
 
     def getObj(self, name, params):
         method_name = 'get' + name.lstrip('JD') + 'Obj'
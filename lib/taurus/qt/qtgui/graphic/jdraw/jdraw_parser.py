@@ -29,6 +29,8 @@ from __future__ import absolute_import
 
 import os
 import re
+import pickle
+import hashlib
 
 from ply import lex
 from ply import yacc
@@ -36,7 +38,37 @@ from ply import yacc
 from taurus.core.util.log import Logger
 
 
-__all__ = ["new_parser", "parse"]
+__all__ = ["new_parser", "parse", "load", "JDElement"]
+
+#: Version of the intermediate representation returned by :func:`load`.
+#: Increment it whenever the grammar actions change, so that previously
+#: cached parse results get discarded
+IR_VERSION = 1
+
+
+class JDElement(object):
+    """Intermediate representation of a JDraw element (as returned by the
+    parser). Elements contained in other elements (e.g. the children of a
+    JDGroup) are found as lists of JDElement in the params dictionary.
+
+    :param type: (str) JDraw element type (e.g. 'JDRectangle')
+    :param params: (dict) element parameters
+    """
+    __slots__ = ('type', 'params')
+
+    def __init__(self, type, params):
+        self.type = type
+        self.params = params
+
+    def __getstate__(self):
+        return self.type, self.params
+
+    def __setstate__(self, state):
+        self.type, self.params = state
+
+    def __repr__(self):
+        return 'JDElement(%r, name=%r)' % (self.type, self.params.get('name'))
+
 
 tokens = ('NUMBER', 'SYMBOL', 'LBRACKET', 'RBRACKET', 'TWOP', 'COMMA',
           'JDFILE', 'GLOBAL', 'JDLINE', 'JDRECTANGLE', 'JDROUNDRECTANGLE',
@@ -115,20 +147,12 @@ def p_error(p):
 
 def p_jdfile(p):
     ''' jdfile :  JDFILE SYMBOL LBRACKET global element_list RBRACKET '''
-    factory = p.parser.factory
-    p[0] = factory.getSceneObj(p[5])
-
-    if p[0] is None:
-        p.parser.log.info("[%d]: Unable to create Scene" % p.lexer.lineno)
+    p[0] = p[5]
 
 
 def p_jdfile_empty(p):
     ''' jdfile : JDFILE LBRACKET global RBRACKET '''
-    factory = p.parser.factory
-    p[0] = factory.getSceneObj([])
-
-    if p[0] is None:
-        p.parser.log.info("[%d]: Unable to create Scene" % p.lexer.lineno)
+    p[0] = []
 
 
 def p_global(p):
@@ -187,14 +211,9 @@ def p_single_element(p):
             extension.update(p.parser.modelStack2[0])
             p[3]["extensions"] = extension
 
-    # create the corresponding element
-    factory = p.parser.factory
-    #p.parser.log.debug('ret = factory.getObj(%s,%s)'% (str(p[1]),str(p[3])))
-    ret = factory.getObj(p[1], p[3])
-
-    if ret is None:
-        p.parser.log.info("[%d]: Unable to create obj '%s'" %
-                          (p.lexer.lineno, p[1]))
+    # the objects are created afterwards by the factory (see
+    # TaurusJDrawGraphicsFactory.getElementObj)
+    ret = JDElement(p[1], p[3])
 
     # clear the model stack
     # if name:
@@ -334,22 +353,98 @@ def new_parser(optimize=None, debug=0, outputdir=None):
     return l, p
 
 
-def parse(filename=None, factory=None):
+_parser = None
 
-    if filename is None or factory is None:
-        return
 
-    _, p = new_parser()
+def _get_parser():
+    """Returns a (lexer, parser) tuple, creating it only the first time"""
+    global _parser
+    if _parser is None:
+        _parser = new_parser()
+    return _parser
+
+
+def _get_cache_dir():
+    from taurus import tauruscustomsettings
+    cachedir = getattr(tauruscustomsettings, 'JDRAW_CACHE_DIR', None)
+    if cachedir is None:
+        cachedir = os.path.join(os.path.expanduser('~'), '.taurus',
+                                'jdraw_cache')
+    return cachedir
+
 
-    p.factory = factory
+def _parse_file(filename):
+    """Parses a jdraw file and returns the list of its elements"""
+    l, p = _get_parser()
     p.modelStack = []
     p.modelStack2 = []
+    with open(filename) as f:
+        return p.parse(f.read(), lexer=l)
+
+
+def load(filename, cache=None):
+    """
+    Returns the list of :class:`JDElement` described in a jdraw file.
+
+    The parse result is (optionally) cached on disk, keyed by the hash of the
+    file contents and the IR version, so that subsequent loads of an
+    unchanged file do not need to parse it again.
+
+    :param filename: (str) path to the jdraw file
+    :param cache: (bool or None) whether to use the parse cache. If None,
+                  the `JDRAW_PARSE_CACHE` taurus custom setting is used
+
+    :return: (list<JDElement>) the top level elements
+    """
+    if cache is None:
+        from taurus import tauruscustomsettings
+        cache = getattr(tauruscustomsettings, 'JDRAW_PARSE_CACHE', True)
+
+    filename = os.path.realpath(filename)
+    if not cache:
+        return _parse_file(filename)
+
+    log = Logger('JDraw Parser')
+    with open(filename, 'rb') as f:
+        key = hashlib.sha1(f.read()).hexdigest()
+    cachedir = _get_cache_dir()
+    cachefile = os.path.join(cachedir, '%s-v%d.pck' % (key, IR_VERSION))
+    try:
+        with open(cachefile, 'rb') as f:
+            elements = pickle.load(f)
+        log.debug("Using cached parse of %s (%s)", filename, cachefile)
+        return elements
+    except Exception:
+        pass
+
+    elements = _parse_file(filename)
+    if elements is None:
+        return None
+    try:
+        if not os.path.exists(cachedir):
+            os.makedirs(cachedir)
+        # write to a temporary file first to avoid leaving half-written
+        # files in the cache
+        tmpfile = '%s.%d.tmp' % (cachefile, os.getpid())
+        with open(tmpfile, 'wb') as f:
+            pickle.dump(elements, f, 2)
+        os.rename(tmpfile, cachefile)
+    except Exception:
+        log.debug("Cannot write jdraw parse cache %s", cachefile,
+                  exc_info=1)
+    return elements
+
+
+def parse(filename=None, factory=None):
+
+    if filename is None or factory is None:
+        return
 
     res = None
     try:
-        filename = os.path.realpath(filename)
-        f = open(filename)
-        res = yacc.parse(f.read())
+        elements = load(filename)
+        if elements is not None:
+            res = factory.getSceneObj(factory.getElementObjs(elements))
     except:
         log = Logger('JDraw Parser')
         log.warning("Failed to parse %s" % filename)
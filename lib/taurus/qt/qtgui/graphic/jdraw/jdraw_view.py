@@ -29,6 +29,7 @@ from __future__ import absolute_import
 from builtins import str
 
 import os
+import itertools
 import traceback
 
 from future.utils import string_types
@@ -41,7 +42,7 @@ from taurus.qt.qtgui.graphic.taurusgraphic import parseTangoUri, TaurusGraphicsI
 from taurus.qt.qtcore.mimetypes import TAURUS_ATTR_MIME_TYPE, TAURUS_DEV_MIME_TYPE, TAURUS_MODEL_MIME_TYPE
 from taurus.qt.qtgui.base import TaurusBaseWidget
 
-from taurus.qt.qtgui.graphic.jdraw.jdraw_parser import parse
+from taurus.qt.qtgui.graphic.jdraw.jdraw_parser import parse, load
 
 __all__ = ["TaurusJDrawSynopticsView"]
 
@@ -85,6 +86,10 @@ class TaurusJDrawSynopticsView(Qt.QGraphicsView, TaurusBaseWidget):
     graphicItemSelected = Qt.pyqtSignal('QString')
     graphicSceneClicked = Qt.pyqtSignal('QPoint')
 
+    #: number of items added to the scene per event loop iteration when
+    #: loading a synoptic progressively (see :meth:`setModel`)
+    PROGRESSIVE_CHUNK_SIZE = 200
+
     def __init__(self, parent=None, designMode=False, updateMode=None, alias=None, resizable=True, panelClass=None):
         name = self.__class__.__name__
         self.call__init__wo_kw(Qt.QGraphicsView, parent)
@@ -96,6 +101,7 @@ class TaurusJDrawSynopticsView(Qt.QGraphicsView, TaurusBaseWidget):
         self._fileName = "Root"
         self._mousePos = (0, 0)
         self._selectionStyle = SynopticSelectionStyle.OUTLINE
+        self._pendingItems = None
         self.setResizable(resizable)
         self.setInteractive(True)
         self.setAlias(alias)
@@ -371,9 +377,24 @@ class TaurusJDrawSynopticsView(Qt.QGraphicsView, TaurusBaseWidget):
             return self._panelClass
 
     @Qt.pyqtSlot('QString')
-    def setModel(self, model, alias=None, delayed=False, trace=False):
+    def setModel(self, model, alias=None, delayed=False, trace=False,
+                 progressive=False):
+        """Parses the given jdraw file and shows it.
+
+        :param model: (str) path to the jdraw file
+        :param alias: (dict) name replacements (see :meth:`setAlias`)
+        :param delayed: (bool) if True, the models of the items are not set
+                        (see :meth:`setModels`)
+        :param trace: (bool) if True, the debug log level is used while
+                      parsing
+        :param progressive: (bool) if True, the scene is shown immediately
+                            and the items are created and added to it in
+                            chunks of :attr:`PROGRESSIVE_CHUNK_SIZE` items
+                            from the event loop.
+        """
         self.modelName = str(model)
         self._currF = str(model)
+        self._pendingItems = None
         if alias is not None:
             self.setAlias(alias)
         ll = taurus.getLogLevel()
@@ -388,33 +409,75 @@ class TaurusJDrawSynopticsView(Qt.QGraphicsView, TaurusBaseWidget):
                 self.debug("Starting to parse %s" % filename)
                 self.path = os.path.dirname(filename)
                 factory = self.getGraphicsFactory(delayed=delayed)
-                scene = parse(filename, factory)
+                if progressive:
+                    scene = factory.getSceneObj([])
+                    elements = load(filename) or []
+                    self._pendingItems = (factory, scene,
+                                          factory.getElementObjs(elements))
+                else:
+                    scene = parse(filename, factory)
                 scene.setSelectionStyle(self._selectionStyle)
                 self.debug("Obtained %s(%s)", type(scene).__name__, filename)
                 if not scene:
                     self.warning("TaurusJDrawSynopticsView.setModel(%s): Unable to parse %s!!!" % (
                         model, filename))
-                elif self.w_scene is None and scene.sceneRect():
-                    self.w_scene = scene.sceneRect().width()
-                    self.h_scene = scene.sceneRect().height()
-                else:
-                    self.debug('JDrawView.sceneRect() is NONE!!!')
                 self.setScene(scene)
                 self.scene().graphicItemSelected.connect(self._graphicItemSelected)
                 self.scene().graphicSceneClicked.connect(self._graphicSceneClicked)
                 # Qt.QApplication.instance().lastWindowClosed.connect(self.close) #It caused a
                 # segfault!
-                self.__modelsChanged()
                 self.setWindowTitle(self.modelName)
-                # The emitted signal contains the filename and a dictionary
-                # with the name of items and its color
-                self.emitColors()  # get_item_colors(emit=True)
-                self.fitting()
+                if progressive:
+                    Qt.QTimer.singleShot(0, self._addPendingItems)
+                else:
+                    self._sceneLoaded()
             else:
                 self.setScene(None)
         #self.debug('out of setModel()')
         taurus.setLogLevel(ll)
 
+    def _addPendingItems(self):
+        """adds the next chunk of items to the scene being progressively
+        loaded (and reschedules itself until all items are added)"""
+        if self._pendingItems is None:
+            return
+        factory, scene, items = self._pendingItems
+        if scene is not self.scene():
+            # another model was set in the meantime
+            return
+        chunk = []
+        failed = False
+        try:
+            for item in itertools.islice(items, self.PROGRESSIVE_CHUNK_SIZE):
+                chunk.append(item)
+        except Exception:
+            # finish the load with the items created so far instead of
+            # leaving the scene half-built
+            self.warning('Error creating the items of %s: %s' %
+                         (self.modelName, traceback.format_exc()))
+            failed = True
+        factory.addSceneItems(scene, chunk)
+        self.viewport().update()
+        if failed or len(chunk) < self.PROGRESSIVE_CHUNK_SIZE:
+            self._pendingItems = None
+            self._sceneLoaded()
+        else:
+            Qt.QTimer.singleShot(0, self._addPendingItems)
+
+    def _sceneLoaded(self):
+        """called once all the items have been added to the scene"""
+        scene = self.scene()
+        if scene and self.w_scene is None and scene.sceneRect():
+            self.w_scene = scene.sceneRect().width()
+            self.h_scene = scene.sceneRect().height()
+        else:
+            self.debug('JDrawView.sceneRect() is NONE!!!')
+        self.__modelsChanged()
+        # The emitted signal contains the filename and a dictionary
+        # with the name of items and its color
+        self.emitColors()  # get_item_colors(emit=True)
+        self.fitting()
+
     def closeEvent(self, event=None):
         if self.scene():
             self.scene().closeAllPanels()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+"""Unit tests for jdraw_parser"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from taurus import tauruscustomsettings
+from taurus.qt.qtgui.graphic.jdraw import jdraw_parser
+from taurus.qt.qtgui.graphic.jdraw.jdraw_parser import load, JDElement
+
+_RES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'res')
+
+
+class JDrawLoadTestCase(unittest.TestCase):
+    """Tests the parsing of jdraw files into JDElement lists"""
+
+    def setUp(self):
+        self._cachedir = tempfile.mkdtemp()
+        self._orig = getattr(tauruscustomsettings, 'JDRAW_CACHE_DIR', None)
+        tauruscustomsettings.JDRAW_CACHE_DIR = self._cachedir
+
+    def tearDown(self):
+        tauruscustomsettings.JDRAW_CACHE_DIR = self._orig
+        shutil.rmtree(self._cachedir)
+
+    def test_load(self):
+        fname = os.path.join(_RES_DIR, 'SimpleScalarViewer.jdw')
+        elements = load(fname, cache=False)
+        self.assertEqual(len(elements), 16)
+        for e in elements:
+            self.assertIsInstance(e, JDElement)
+        names = [e.params.get('name') for e in elements]
+        self.assertIn('sys/tg_test/1/float_scalar', names)
+        self.assertEqual(os.listdir(self._cachedir), [])
+
+    def test_cache(self):
+        fname = os.path.join(_RES_DIR, 'styles.jdw')
+        elements = load(fname, cache=True)
+        files = os.listdir(self._cachedir)
+        self.assertEqual(len(files), 1)
+        suffix = '-v%d.pck' % jdraw_parser.IR_VERSION
+        self.assertTrue(files[0].endswith(suffix))
+        cached = load(fname, cache=True)
+        self.assertEqual([(e.type, e.params) for e in elements],
+                         [(e.type, e.params) for e in cached])
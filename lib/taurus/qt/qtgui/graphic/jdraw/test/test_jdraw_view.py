@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+"""Unit tests for the progressive loading of TaurusJDrawSynopticsView"""
+
+import os
+import unittest
+
+from taurus.external.qt import Qt
+from taurus.qt.qtgui.test import BaseWidgetTestCase
+from taurus.qt.qtgui.graphic.jdraw import TaurusJDrawSynopticsView
+
+_RES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'res')
+
+
+class ProgressiveLoadTestCase(BaseWidgetTestCase, unittest.TestCase):
+    """Tests for TaurusJDrawSynopticsView.setModel(..., progressive=True)"""
+
+    _klass = TaurusJDrawSynopticsView
+
+    def test_progressive(self):
+        """check that all the items are added to the scene"""
+        fname = os.path.join(_RES_DIR, 'styles.jdw')
+        ref = TaurusJDrawSynopticsView()
+        ref.setModel(fname)
+        self._widget.PROGRESSIVE_CHUNK_SIZE = 2
+        self._widget.setModel(fname, progressive=True)
+        self.processEvents(repetitions=50)
+        self.assertIsNone(self._widget._pendingItems)
+        self.assertEqual(len(self._widget.scene().items()),
+                         len(ref.scene().items()))
+
+    def test_error(self):
+        """check that an error while creating the items finishes the load
+        with the items created so far"""
+        fname = os.path.join(_RES_DIR, 'styles.jdw')
+        self._widget.setModel(fname, progressive=True)
+        factory, scene, _ = self._widget._pendingItems
+        item = Qt.QGraphicsRectItem(0, 0, 10, 10)
+
+        def items():
+            yield item
+            raise RuntimeError('broken item')
+
+        self._widget._pendingItems = (factory, scene, items())
+        self.processEvents(repetitions=5)
+        self.assertIsNone(self._widget._pendingItems)
+        self.assertEqual(scene.items(), [item])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -46,6 +46,7 @@ from queue import Queue
 
 from taurus import Manager
 from taurus.core import AttrQuality, DataType
+from taurus.core.units import Quantity, magnitude
 from taurus.core.util.containers import CaselessDefaultDict
 from taurus.core.util.log import Logger, deprecation_decorator
 from taurus.core.taurusdevice import TaurusDevice
@@ -191,6 +192,10 @@ class TaurusGraphicsScene(Qt.QGraphicsScene):
     ANY_ATTRIBUTE_SELECTS_DEVICE = True
     TRACE_ALL = False
 
+    _ALNUM = r'(?:[a-zA-Z0-9-_\*]|(?:\.\*))(?:[a-zA-Z0-9-_\*]|(?:\.\*))*'
+    _RE_SPECIAL = re.compile(r'[\\.^$*+?{}\[\]|()]')
+    _PATTERN_CACHE_SIZE = 1000
+
     refreshTree2 = Qt.pyqtSignal()
     graphicItemSelected = Qt.pyqtSignal('QString')
     graphicSceneClicked = Qt.pyqtSignal('QPoint')
@@ -203,6 +208,9 @@ class TaurusGraphicsScene(Qt.QGraphicsScene):
         self.updateQueue = None
         self.updateThread = None
         self._itemnames = CaselessDefaultDict(lambda k: set())
+        # index of item names by their parent name (i.e. device -> attrs)
+        self._itemchildren = CaselessDefaultDict(lambda k: set())
+        self._patterns = {}  # cache of compiled getItemByName patterns
         self._selection = []
         self._selectedItems = []
         self._selectionStyle = SynopticSelectionStyle.OUTLINE
@@ -327,33 +335,82 @@ class TaurusGraphicsScene(Qt.QGraphicsScene):
         except:
             self.warning(traceback.format_exc())
 
+    def _indexItem(self, item):
+        name = str(getattr(item, '_name', '')).lower()
+        if name:
+            self._itemnames[name].add(item)
+            if '/' in name:
+                self._itemchildren[name.rsplit('/', 1)[0]].add(name)
+            #self.debug('addItem(%s): %s'%(name,item))
+
+    def _unindexItem(self, item):
+        name = str(getattr(item, '_name', '')).lower()
+        items = self._itemnames.get(name)
+        if items is None:
+            return
+        items.discard(item)
+        if not items:
+            del self._itemnames[name]
+            if '/' in name:
+                parent = name.rsplit('/', 1)[0]
+                children = self._itemchildren.get(parent)
+                if children is not None:
+                    children.discard(name)
+                    if not children:
+                        del self._itemchildren[parent]
+
+    def _expandItem(self, item):
+        """Returns a list with the item and (recursively) all its children
+        if it is a QGraphicsItemGroup"""
+        result = [item]
+        if isinstance(item, Qt.QGraphicsItemGroup):
+            for i in item.childItems():
+                result.extend(self._expandItem(i))
+        return result
+
     def addItem(self, item):
         # self.debug('addItem(%s)'%item)
-        def expand(i):
-            name = str(getattr(i, '_name', '')).lower()
-            if name:
-                self._itemnames[name].add(i)
-                #self.debug('addItem(%s): %s'%(name,i))
-            if isinstance(i, Qt.QGraphicsItemGroup):
-                for j in i.childItems():
-                    expand(j)
-        expand(item)
+        for i in self._expandItem(item):
+            self._indexItem(i)
         Qt.QGraphicsScene.addItem(self, item)
 
+    def removeItem(self, item):
+        for i in self._expandItem(item):
+            self._unindexItem(i)
+        Qt.QGraphicsScene.removeItem(self, item)
+
+    def clear(self):
+        self._itemnames.clear()
+        self._itemchildren.clear()
+        Qt.QGraphicsScene.clear(self)
+
     def addWidget(self, item, flags=None):
         self.debug('addWidget(%s)' % item)
-        name = str(getattr(item, '_name', '')).lower()
-        if name:
-            self._itemnames[name].add(item)
+        self._indexItem(item)
         if flags is None:
             Qt.QGraphicsScene.addWidget(self, item)
         else:
             Qt.QGraphicsScene.addWidget(self, item, flags)
 
+    def _getPattern(self, target):
+        """Returns a compiled (and cached) case-insensitive regexp for the
+        given target"""
+        try:
+            return self._patterns[target]
+        except KeyError:
+            if len(self._patterns) > self._PATTERN_CACHE_SIZE:
+                self._patterns.clear()
+            pattern = self._patterns[target] = re.compile(target, re.I)
+            return pattern
+
     def getItemByName(self, item_name, strict=None):
         """
         Returns a list with all items matching a given name.
 
+        Exact names are looked up directly in the scene index of item names.
+        Names containing regexp special characters are matched against all
+        the indexed names.
+
         :param strict: (bool or None) controls whether full_name (strict=True) or only device name (False) must match
 
         :return: (list) items
@@ -365,24 +422,40 @@ class TaurusGraphicsScene(Qt.QGraphicsScene):
 
         strict = (
             not self.ANY_ATTRIBUTE_SELECTS_DEVICE) if strict is None else strict
-        alnum = '(?:[a-zA-Z0-9-_\*]|(?:\.\*))(?:[a-zA-Z0-9-_\*]|(?:\.\*))*'
         target = str(item_name).strip().split()[0].lower().replace(
             '/state', '')  # If it has spaces only the first word is used
         # Device names should match also its attributes or only state?
         if not strict and TangoAttributeNameValidator().getUriGroups(target):
             target = target.rsplit('/', 1)[0]
-        if TangoDeviceNameValidator().getUriGroups(target):
+        isdevice = bool(TangoDeviceNameValidator().getUriGroups(target))
+
+        if self._RE_SPECIAL.search(target) is None:
+            # fast path: exact look-up in the index of names
+            names = [target]
+            if isdevice and strict:
+                names.append(target + '/state')
+            elif isdevice:
+                alnum = self._getPattern(self._ALNUM + '$')
+                names.extend(n for n in self._itemchildren.get(target, ())
+                             if alnum.match(n.rsplit('/', 1)[1]))
+            result = []
+            for n in names:
+                result.extend(self._itemnames.get(n, ()))
+            return result
+
+        if isdevice:
             if strict:
                 target += '(/state)?'
             else:
-                target += '(/' + alnum + ')?'
+                target += '(/' + self._ALNUM + ')?'
         if not target.endswith('$'):
             target += '$'
+        pattern = self._getPattern(target)
         result = []
-        for k in list(self._itemnames.keys()):
-            if re.match(target.lower(), k.lower()):
+        for k, v in self._itemnames.items():
+            if pattern.match(k):
                 #self.debug('getItemByName(%s): _itemnames[%s]: %s'%(target,k,self._itemnames[k]))
-                result.extend(self._itemnames[k])
+                result.extend(v)
         return result
 
     def getItemByPosition(self, x, y):
@@ -1159,19 +1232,21 @@ class TaurusGraphicsAttributeItem(TaurusGraphicsItem):
                     self._name, self._currText))
                 self.warning(traceback.format_exc())
 
+        # attributes in raw numeric mode have plain numbers as rvalue (and
+        # provide the Quantity as rquantity)
+        raw = (getattr(v, 'units', None) is not None
+               and not isinstance(v.rvalue, Quantity))
         if v and self._userFormat:
             # TODO: consider extending this to use newer pyhon formatting syntax
-            if hasattr(v.rvalue, 'magnitude'):
-                text = self._userFormat % v.rvalue.magnitude
-            else:
-                text = self._userFormat % v.rvalue
+            text = self._userFormat % magnitude(v.rvalue)
             if self._unitVisible:
-                text = "{0} {1.rvalue.units:~s}".format(text, v)
+                q = v.rquantity if raw else v.rvalue
+                text = "{0} {1.units:~s}".format(text, q)
         else:
             if self._unitVisible:
-                _frName = None
+                _frName = 'rquantity' if raw else None
             else:
-                _frName = 'rvalue.magnitude'
+                _frName = 'rvalue' if raw else 'rvalue.magnitude'
             text = self.getDisplayValue(fragmentName=_frName)
 
         self._currText = text
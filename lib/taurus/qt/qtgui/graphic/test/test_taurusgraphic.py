@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+
+"""Unit tests for the index of item names of TaurusGraphicsScene"""
+
+import unittest
+
+from taurus.external.qt import Qt
+from taurus.qt.qtgui.test import BaseWidgetTestCase
+from taurus.qt.qtgui.graphic.taurusgraphic import TaurusGraphicsScene
+
+
+def _item(name, klass=Qt.QGraphicsRectItem):
+    item = klass()
+    item._name = name
+    return item
+
+
+class TaurusGraphicsSceneTestCase(BaseWidgetTestCase, unittest.TestCase):
+    """Tests for TaurusGraphicsScene.getItemByName"""
+
+    def setUp(self):
+        BaseWidgetTestCase.setUp(self)
+        self.scene = TaurusGraphicsScene()
+        self.dev = _item('sys/tg_test/1')
+        self.state = _item('sys/tg_test/1/State')
+        self.attr = _item('sys/tg_test/1/double_scalar')
+        self.other = _item('sys/tg_test/2/double_scalar')
+        for item in (self.dev, self.state, self.attr, self.other):
+            self.scene.addItem(item)
+
+    def _get(self, name, strict=None):
+        return set(self.scene.getItemByName(name, strict=strict))
+
+    def test_exact(self):
+        """check the look-up of exact (case insensitive) names"""
+        self.assertEqual(self._get('sys/tg_test/1/double_scalar', True),
+                         {self.attr})
+        self.assertEqual(self._get('SYS/TG_TEST/2/Double_Scalar', True),
+                         {self.other})
+        self.assertEqual(self._get('sys/tg_test/3', True), set())
+
+    def test_device(self):
+        """check that a device name matches its attributes (unless strict)"""
+        self.assertEqual(self._get('sys/tg_test/1', True),
+                         {self.dev, self.state})
+        self.assertEqual(self._get('sys/tg_test/1', False),
+                         {self.dev, self.state, self.attr})
+
+    def test_pattern(self):
+        """check the names given as regular expressions"""
+        self.assertEqual(self._get('sys/tg_test/.*/double_scalar', True),
+                         {self.attr, self.other})
+
+    def test_group(self):
+        """check that the children of the groups are indexed"""
+        group = Qt.QGraphicsItemGroup()
+        child = _item('sys/tg_test/3/ampli')
+        group.addToGroup(child)
+        self.scene.addItem(group)
+        self.assertEqual(self._get('sys/tg_test/3/ampli', True), {child})
+        self.scene.removeItem(group)
+        self.assertEqual(self._get('sys/tg_test/3/ampli', True), set())
+
+    def test_remove(self):
+        """check that removed items are no longer found"""
+        self.scene.removeItem(self.attr)
+        self.assertEqual(self._get('sys/tg_test/1', False),
+                         {self.dev, self.state})
+        self.scene.clear()
+        self.assertEqual(self._get('sys/tg_test/.*', False), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,8 @@ provide a way to browse through the application help system"""
 
 __docformat__ = 'restructuredtext'
 
-from .assistant import *
-from .aboutdialog import *
-from .helppanel import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, ['assistant', 'aboutdialog', 'helppanel'])
+
+del __lazyExports
@@ -28,10 +28,10 @@ with the user. Examples are line edits, comboboxes and checkboxes"""
 
 __docformat__ = 'restructuredtext'
 
-from .qwheel import *
-from .tauruscheckbox import *
-from .tauruscombobox import *
-from .tauruslineedit import *
-from .taurusspinbox import *
-from .tauruswheel import *
-from .choicedlg import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, [
+    'qwheel', 'tauruscheckbox', 'tauruscombobox', 'tauruslineedit',
+    'taurusspinbox', 'tauruswheel', 'choicedlg'])
+
+del __lazyExports
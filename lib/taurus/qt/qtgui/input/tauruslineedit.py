@@ -89,7 +89,9 @@ class TaurusValueLineEdit(Qt.QLineEdit, TaurusBaseWritableWidget):
     def _updateValidator(self, value):
         """This method sets a validator depending on the data type"""
         val = None
-        if value is not None and isinstance(value.wvalue, Quantity):
+        # the wvalue as a Quantity, also for attributes in raw numeric mode
+        wvalue = getattr(value, 'wquantity', getattr(value, 'wvalue', None))
+        if isinstance(wvalue, Quantity):
             val = self.validator()
             if not isinstance(val, PintValidator):
                 val = PintValidator(self)
@@ -100,7 +102,7 @@ class TaurusValueLineEdit(Qt.QLineEdit, TaurusBaseWritableWidget):
                 val.setBottom(bottom)
             if top != val.top:
                 val.setTop(top)
-            units = value.wvalue.units
+            units = wvalue.units
             if units != val.units:
                 val.setUnits(units)
 
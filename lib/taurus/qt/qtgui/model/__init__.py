@@ -27,4 +27,8 @@
 
 __docformat__ = 'restructuredtext'
 
-from .qbasemodel import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, ['qbasemodel'])
+
+del __lazyExports
@@ -28,15 +28,12 @@ panels like forms or panels to be inserted in dialogs"""
 
 __docformat__ = 'restructuredtext'
 
-from .qrawdatachooser import *
-from .qdataexportdialog import *
-from .taurusmessagepanel import *
-from .taurusinputpanel import *
-from .taurusmodelchooser import *
-from .taurusvalue import *
-from .taurusform import *
-from .taurusmodellist import *
-from .taurusconfigeditor import *
-from .qdoublelist import *
-from .taurusdevicepanel import *
-from .taurusconfigurationpanel import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, [
+    'qrawdatachooser', 'qdataexportdialog', 'taurusmessagepanel',
+    'taurusinputpanel', 'taurusmodelchooser', 'taurusvalue', 'taurusform',
+    'taurusmodellist', 'taurusconfigeditor', 'qdoublelist',
+    'taurusdevicepanel', 'taurusconfigurationpanel'])
+
+del __lazyExports
@@ -36,7 +36,8 @@ import os
 import shutil
 import tempfile
 import click
-from taurus.qt.qtcore.configuration import BaseConfigurableClass
+from taurus.qt.qtcore.configuration import (BaseConfigurableClass,
+                                            decodeConfig)
 from taurus.qt.qtgui.container import TaurusWidget
 
 
@@ -337,7 +338,8 @@ class QConfigEditorModel(Qt.QStandardItemModel):
     def getTaurusConfigFromSettings(self, key='TaurusConfig'):
         '''
         Loads and returns the configuration dictionary from the settings file
-        using pickle module.
+        (pickled or in the binary format of
+        :func:`~taurus.qt.qtcore.configuration.decodeConfig`).
 
         :param key: (str)
 
@@ -347,7 +349,7 @@ class QConfigEditorModel(Qt.QStandardItemModel):
         qstate = self._settings.value(key)
         if qstate is not None:
             try:
-                result = pickle.loads(qstate.data())
+                result = decodeConfig(qstate.data())
             except Exception as e:
                 msg = 'problems loading TaurusConfig: \n%s' % repr(e)
                 Qt.QMessageBox.critical(None, 'Error loading settings', msg)
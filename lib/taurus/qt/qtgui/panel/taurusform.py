@@ -28,6 +28,7 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
+import bisect
 import click
 from datetime import datetime
 from functools import partial
@@ -38,6 +39,7 @@ from taurus.external.qt import Qt
 
 import taurus.core
 from taurus.core import TaurusDevState, DisplayLevel
+from taurus.core.taurusbasetypes import TaurusSerializationMode
 
 from taurus.qt.qtcore.mimetypes import (TAURUS_ATTR_MIME_TYPE, TAURUS_DEV_MIME_TYPE,
                                         TAURUS_MODEL_LIST_MIME_TYPE, TAURUS_MODEL_MIME_TYPE)
@@ -61,6 +63,23 @@ def _normalize_model_name_case(modelname):
         return modelname.lower()
 
 
+def _prefetchModels(models, cache):
+    """Creates the taurus objects for the given model names (and reads their
+    values) so that the form items do not need to wait for them when they
+    are created in the GUI thread. The objects are kept in the cache dict
+    (the factories only keep weak references to them)"""
+    for model in models:
+        try:
+            obj = taurus.Attribute(model)
+            obj.read()
+        except Exception:
+            try:
+                obj = taurus.Device(model)
+            except Exception:
+                continue
+        cache[model] = obj
+
+
 class ParameterCB(Qt.QComboBox):
     '''A custom combobox'''
 
@@ -98,9 +117,18 @@ class TaurusForm(TaurusWidget):
 
     By default, the form provides global Apply and Cancel buttons.
 
+    The items can also be created progressively (see :meth:`setProgressive`)
+    to keep the GUI responsive when the form has many models.
+
     You can also see some code that exemplifies the use of TaurusForm in :ref:`Taurus
     coding examples <examples>` '''
 
+    #: maximum number of items created per event loop iteration in
+    #: progressive mode
+    PROGRESSIVE_BATCH_SIZE = 10
+    #: number of concurrent jobs resolving the models in progressive mode
+    PROGRESSIVE_PREFETCH_JOBS = 4
+
     def __init__(self, parent=None,
                  formWidget=None,
                  buttons=None,
@@ -108,6 +136,10 @@ class TaurusForm(TaurusWidget):
                  designMode=False):
 
         self._children = []
+        self._childrenIndexes = []
+        self._pendingChildren = []
+        self._prefetched = {}
+        self._progressive = False
         TaurusWidget.__init__(self, parent, designMode)
 
         if buttons is None:
@@ -165,6 +197,7 @@ class TaurusForm(TaurusWidget):
                                     TAURUS_ATTR_MIME_TYPE, TAURUS_MODEL_MIME_TYPE, 'text/plain'])
 
         self.resetCompact()
+        self.resetProgressive()
 
         # properties
         self.registerConfigProperty(
@@ -422,6 +455,26 @@ class TaurusForm(TaurusWidget):
         from taurus import tauruscustomsettings
         self.setCompact(getattr(tauruscustomsettings, 'T_FORM_COMPACT', {}))
 
+    def setProgressive(self, progressive):
+        '''Sets the progressive mode. In progressive mode, setting the model
+        does not create all the items at once. Instead, the models are
+        resolved in a background thread and the items are created in small
+        batches (the visible ones first), showing a placeholder meanwhile.
+        Accessing the items (e.g. with :meth:`getItems`) creates the
+        pending ones immediately.
+
+        :param progressive: (bool)
+        '''
+        self._progressive = progressive
+
+    def isProgressive(self):
+        return self._progressive
+
+    def resetProgressive(self):
+        from taurus import tauruscustomsettings
+        self.setProgressive(
+            getattr(tauruscustomsettings, 'T_FORM_PROGRESSIVE', False))
+
     def dropEvent(self, event):
         '''reimplemented to support dropping of modelnames in forms'''
         mtype = self.handleMimeData(event.mimeData(), self.addModels)
@@ -458,12 +511,15 @@ class TaurusForm(TaurusWidget):
         pass
 
     def destroyChildren(self):
+        self._pendingChildren = []
+        self._prefetched = {}
         for child in self._children:
             self.unregisterConfigurableItem(child)
             # child.destroy()
             child.setModel(None)
             child.deleteLater()
         self._children = []
+        self._childrenIndexes = []
 
     def fillWithChildren(self):
         frame = TaurusWidget()
@@ -477,38 +533,36 @@ class TaurusForm(TaurusWidget):
             if parent_model:
                 parent_name = parent_model.getFullName()
 
+        models = []
         for i, model in enumerate(self.getModel()):
             if not model:
                 continue
             if parent_name:
                 # @todo: Change this (it assumes tango model naming!)
                 model = "%s/%s" % (parent_name, model)
-            klass, args, kwargs = self.getFormWidget(model=model)
-            widget = klass(frame, *args, **kwargs)
-            # @todo UGLY... See if this can be done in other ways... (this causes trouble with widget that need more vertical space , like PoolMotorTV)
-            widget.setMinimumHeight(20)
-
-            try:
-                widget.setCompact(self.isCompact())
-                widget.setModel(model)
-                widget.setParent(frame)
-            except:
-                # raise
-                self.warning(
-                    'an error occurred while adding the child "%s". Skipping' % model)
-                self.traceback(level=taurus.Debug)
-            try:
-                widget.setModifiableByUser(self.isModifiableByUser())
-            except:
-                pass
-            try:
-                widget.setFormat(self.getFormat())
-            except Exception:
-                self.debug('Cannot set format %s to child %s',
-                           self.getFormat(), model)
-            widget.setObjectName("__item%i" % i)
-            self.registerConfigDelegate(widget)
-            self._children.append(widget)
+            models.append((i, model))
+
+        if self.isProgressive():
+            # resolve the models in background (interleaved among several
+            # jobs, so that the first rows are resolved first) and show
+            # placeholders
+            self._prefetched = {}
+            names = [m for _, m in models]
+            njobs = min(self.PROGRESSIVE_PREFETCH_JOBS, len(names))
+            for k in range(njobs):
+                taurus.Manager().enqueueJob(
+                    _prefetchModels, job_args=(names[k::njobs],
+                                               self._prefetched),
+                    serialization_mode=TaurusSerializationMode.Concurrent)
+            for i, model in models:
+                row = frame.layout().rowCount()
+                placeholder = Qt.QLabel('Loading %s...' % model, frame)
+                placeholder.setEnabled(False)
+                frame.layout().addWidget(placeholder, row, 1, 1, -1)
+                self._pendingChildren.append((i, model, row, placeholder))
+        else:
+            for i, model in models:
+                self._createChild(frame, i, model)
 
         frame.layout().addItem(Qt.QSpacerItem(
             0, 0, Qt.QSizePolicy.Minimum, Qt.QSizePolicy.MinimumExpanding))
@@ -516,11 +570,84 @@ class TaurusForm(TaurusWidget):
 #        self.scrollArea.setWidgetResizable(True)
         self.scrollArea.setMinimumWidth(frame.layout().sizeHint().width() + 20)
 
+        if self._pendingChildren:
+            Qt.QTimer.singleShot(0, self._createPendingChildren)
+
+    def _createChild(self, frame, i, model, row=None):
+        '''Creates the item of the form for the i-th model. If row is given,
+        the item is inserted in that row of the frame layout'''
+        klass, args, kwargs = self.getFormWidget(model=model)
+        if row is None:
+            widget = klass(frame, *args, **kwargs)
+        else:
+            widget = klass(None, *args, **kwargs)
+            if hasattr(widget, 'setPreferredRow'):
+                widget.setPreferredRow(row)
+        # @todo UGLY... See if this can be done in other ways... (this causes trouble with widget that need more vertical space , like PoolMotorTV)
+        widget.setMinimumHeight(20)
+
+        try:
+            widget.setCompact(self.isCompact())
+            widget.setModel(model)
+            widget.setParent(frame)
+        except:
+            # raise
+            self.warning(
+                'an error occurred while adding the child "%s". Skipping' % model)
+            self.traceback(level=taurus.Debug)
+        try:
+            widget.setModifiableByUser(self.isModifiableByUser())
+        except:
+            pass
+        try:
+            widget.setFormat(self.getFormat())
+        except Exception:
+            self.debug('Cannot set format %s to child %s',
+                       self.getFormat(), model)
+        widget.setObjectName("__item%i" % i)
+        self.registerConfigDelegate(widget)
+        # keep the items sorted by model index
+        pos = bisect.bisect(self._childrenIndexes, i)
+        self._childrenIndexes.insert(pos, i)
+        self._children.insert(pos, widget)
+        return widget
+
+    def _createPendingChildren(self, force=False):
+        '''Creates (a batch of) the items pending in progressive mode. The
+        items whose placeholder is visible are created first.
+
+        :param force: (bool) if True, all the pending items are created
+        '''
+        pending = self._pendingChildren
+        if not pending:
+            return
+        if force:
+            batch = pending[:]
+        else:
+            # sort is stable: visible ones first, keeping the model order
+            batch = sorted(pending,
+                           key=lambda p: p[3].visibleRegion().isEmpty())
+            batch = batch[:self.PROGRESSIVE_BATCH_SIZE]
+        frame = self.scrollArea.widget()
+        for item in batch:
+            pending.remove(item)
+            i, model, row, placeholder = item
+            frame.layout().removeWidget(placeholder)
+            placeholder.deleteLater()
+            self._createChild(frame, i, model, row=row)
+            self._prefetched.pop(model, None)
+        if pending:
+            Qt.QTimer.singleShot(0, self._createPendingChildren)
+        else:
+            self._prefetched = {}
+            self.scrollArea.setMinimumWidth(
+                frame.layout().sizeHint().width() + 20)
+
     def getItemByModel(self, model, index=0):
         '''returns the child item with given model. If there is more than one item
         with the same model, the index parameter can be used to distinguish among them
         Please note that his index is only relative to same-model items!'''
-        for child in self._children:
+        for child in self.getItems():
             if (_normalize_model_name_case(child.getModel()) ==
                     _normalize_model_name_case(model)):
                 if index <= 0:
@@ -534,6 +661,8 @@ class TaurusForm(TaurusWidget):
 
     def getItems(self):
         '''returns a list of the objects that have been created as childs of the form'''
+        # make sure that the items pending in progressive mode exist
+        self._createPendingChildren(force=True)
         return self._children
 
 #    def _manageButtonBox(self):
@@ -185,6 +185,13 @@ class ExpandingLabel(TaurusLabel):
         self.setSizePolicy(Qt.QSizePolicy.Expanding, Qt.QSizePolicy.Preferred)
 
 
+def _isRawNumeric(model_obj):
+    """Returns True if the values of model_obj are plain numbers instead of
+    Quantity objects (see :meth:`TangoAttribute.setRawNumeric`)"""
+    is_raw = getattr(model_obj, 'isRawNumeric', None)
+    return is_raw is not None and is_raw()
+
+
 class DefaultReadWidgetLabel(ExpandingLabel):
     """A customised label for the read widget"""
 
@@ -194,7 +201,8 @@ class DefaultReadWidgetLabel(ExpandingLabel):
         model_obj = self.getModelObj()
         if model_obj is None:
             return
-        if model_obj.getType() in (DataType.Integer, DataType.Float):
+        if (model_obj.getType() in (DataType.Integer, DataType.Float)
+                and not _isRawNumeric(model_obj)):
             fgrole += '.magnitude'
         self.setFgRole(fgrole)
 
@@ -209,7 +217,10 @@ class UnitLessLineEdit(TaurusValueLineEdit):
     def setModel(self, model):
         if model is None or model == '':
             return TaurusValueLineEdit.setModel(self, None)
-        return TaurusValueLineEdit.setModel(self, model + "#wvalue.magnitude")
+        TaurusValueLineEdit.setModel(self, model + "#wvalue.magnitude")
+        if _isRawNumeric(self.getModelObj()):
+            # the wvalue is already a magnitude
+            TaurusValueLineEdit.setModel(self, model + "#wvalue")
 
 
 
@@ -229,6 +240,9 @@ class DefaultUnitsWidget(TaurusLabel):
         if model is None or model == '':
             return TaurusLabel.setModel(self, None)
         TaurusLabel.setModel(self, model + "#rvalue.units")
+        if _isRawNumeric(self.getModelObj()):
+            # the rvalue has no units
+            TaurusLabel.setModel(self, model + "#rquantity.units")
 
     def sizeHint(self):
         # print "UNITSSIZEHINT:",Qt.QLabel.sizeHint(self).width(),
@@ -307,6 +321,95 @@ class TaurusStatusLabel(TaurusLabel):
         return None
 
 
+_IMPORT_PROBES = {}
+
+
+def _canImport(modname, name=None):
+    """Returns True if the given module (and name from it) can be imported.
+    The import is tried only once per process"""
+    key = (modname, name)
+    try:
+        return _IMPORT_PROBES[key]
+    except KeyError:
+        pass
+    try:
+        mod = __import__(modname, fromlist=[name or ''])
+        if name is not None:
+            getattr(mod, name)
+        ret = True
+    except Exception:
+        ret = False
+    _IMPORT_PROBES[key] = ret
+    return ret
+
+
+_READ_WIDGET_CLASSES = {}
+_WRITE_WIDGET_CLASSES = {}
+
+
+def _defaultReadWidgetClasses(data_format, data_type, is_status=False):
+    """Returns a tuple of the classes that can be used as read widgets for an
+    attribute of the given data format and type (or None if not supported).
+    The result is memoised"""
+    key = (data_format, data_type, is_status)
+    try:
+        return _READ_WIDGET_CLASSES[key]
+    except KeyError:
+        pass
+    if data_format == DataFormat._0D:
+        if data_type in (DataType.Boolean, DataType.DevState):
+            result = (CenteredLed, DefaultReadWidgetLabel)
+        elif is_status:
+            result = (TaurusStatusLabel, DefaultReadWidgetLabel)
+        else:
+            result = (DefaultReadWidgetLabel,)
+    elif data_format == DataFormat._1D:
+        if data_type in (DataType.Float, DataType.Integer):
+            result = (TaurusPlotButton, TaurusValuesTableButton,
+                      DefaultReadWidgetLabel)
+        else:
+            result = (TaurusValuesTableButton, DefaultReadWidgetLabel)
+    elif data_format == DataFormat._2D:
+        if (data_type in (DataType.Float, DataType.Integer)
+                and _canImport('taurus.qt.qtgui.extra_guiqwt',
+                               'TaurusImageDialog')):
+            result = (TaurusImageButton, TaurusValuesTableButton,
+                      DefaultReadWidgetLabel)
+        else:
+            result = (TaurusValuesTableButton, DefaultReadWidgetLabel)
+    else:
+        result = None
+    _READ_WIDGET_CLASSES[key] = result
+    return result
+
+
+def _defaultWriteWidgetClasses(data_format, data_type):
+    """Returns a tuple of the classes that can be used as write widgets for
+    an attribute of the given data format and type ((None,) if not
+    supported). The result is memoised"""
+    key = (data_format, data_type)
+    try:
+        return _WRITE_WIDGET_CLASSES[key]
+    except KeyError:
+        pass
+    if data_format == DataFormat._0D:
+        if data_type == DataType.Boolean:
+            result = (DefaultTaurusValueCheckBox, TaurusValueLineEdit)
+        else:
+            result = (UnitLessLineEdit, TaurusValueSpinBox, TaurusWheelEdit)
+    elif data_format == DataFormat._1D:
+        result = (TaurusValuesTableButton_W, TaurusValueLineEdit)
+        if (data_type in (DataType.Float, DataType.Integer)
+                and _canImport('PyQt4.Qwt5')):
+            result = (TaurusArrayEditorButton,) + result
+    elif data_format == DataFormat._2D:
+        result = (TaurusValuesTableButton_W,)
+    else:
+        result = (None,)
+    _WRITE_WIDGET_CLASSES[key] = result
+    return result
+
+
 class TaurusValue(Qt.QWidget, TaurusBaseWidget):
     '''
     Internal TaurusValue class
@@ -523,43 +626,16 @@ class TaurusValue(Qt.QWidget, TaurusBaseWidget):
         modeltype = self.getModelType()
         if modeltype == TaurusElementType.Attribute:
             # The model is an attribute
-            # print "---------ATTRIBUTE OBJECT:----------\n",modelobj.read()
-            try:
-                if modelobj.isBoolean():
-                    result = [CenteredLed, DefaultReadWidgetLabel]
-            except:
-                pass
-            if modelobj.data_format == DataFormat._0D:
-                if modelobj.type == DataType.Boolean:
-                    result = [CenteredLed, DefaultReadWidgetLabel]
-                elif modelobj.type == DataType.DevState:
-                    result = [CenteredLed, DefaultReadWidgetLabel]
-                elif str(self.getModel()).lower().endswith('/status'):  # @todo: tango-centric!!
-                    result = [TaurusStatusLabel, DefaultReadWidgetLabel]
-                else:
-                    result = [DefaultReadWidgetLabel]
-            elif modelobj.data_format == DataFormat._1D:
-                if modelobj.type in (DataType.Float, DataType.Integer):
-                    result = [TaurusPlotButton,
-                              TaurusValuesTableButton, DefaultReadWidgetLabel]
-                else:
-                    result = [TaurusValuesTableButton, DefaultReadWidgetLabel]
-            elif modelobj.data_format == DataFormat._2D:
-                if modelobj.type in (DataType.Float, DataType.Integer):
-                    try:
-                        # unused import but useful to determine if
-                        # TaurusImageButton should be added
-                        from taurus.qt.qtgui.extra_guiqwt import TaurusImageDialog
-                        result = [TaurusImageButton,
-                                  TaurusValuesTableButton, DefaultReadWidgetLabel]
-                    except ImportError:
-                        result = [TaurusValuesTableButton,
-                                  DefaultReadWidgetLabel]
-                else:
-                    result = [TaurusValuesTableButton, DefaultReadWidgetLabel]
-            else:
+            data_format = modelobj.data_format
+            # @todo: tango-centric!!
+            is_status = (data_format == DataFormat._0D and
+                         str(self.getModel()).lower().endswith('/status'))
+            result = _defaultReadWidgetClasses(data_format, modelobj.type,
+                                               is_status)
+            if result is None:
                 self.warning('Unsupported attribute type %s' % modelobj.type)
-                result = None
+            else:
+                result = list(result)
 
         elif modeltype == TaurusElementType.Device:
             result = [TaurusDevButton]
@@ -600,26 +676,11 @@ class TaurusValue(Qt.QWidget, TaurusBaseWidget):
             else:
                 return UnitLessLineEdit
         modelType = modelobj.getType()
-        if modelobj.data_format == DataFormat._0D:
-            if modelType == DataType.Boolean:
-                result = [DefaultTaurusValueCheckBox, TaurusValueLineEdit]
-            else:
-                result = [UnitLessLineEdit,
-                          TaurusValueSpinBox, TaurusWheelEdit]
-        elif modelobj.data_format == DataFormat._1D:
-            result = [TaurusValuesTableButton_W, TaurusValueLineEdit]
-            if modelType in (DataType.Float, DataType.Integer):
-                try:
-                    import PyQt4.Qwt5  # noqa
-                    result.insert(0, TaurusArrayEditorButton)
-                except:
-                    pass
-        elif modelobj.data_format == DataFormat._2D:
-            result = [TaurusValuesTableButton_W]
-        else:
+        result = list(_defaultWriteWidgetClasses(modelobj.data_format,
+                                                 modelType))
+        if result == [None]:
             self.debug('Unsupported attribute type for writing: %s' %
                        str(DataType.whatis(modelType)))
-            result = [None]
 
         if returnAll:
             return result
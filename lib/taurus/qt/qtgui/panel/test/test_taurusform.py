@@ -25,7 +25,7 @@
 """Unit tests for Taurus Forms"""
 
 import unittest
-from taurus.qt.qtgui.test import GenericWidgetTestCase
+from taurus.qt.qtgui.test import BaseWidgetTestCase, GenericWidgetTestCase
 from taurus.qt.qtgui.panel import TaurusForm, TaurusAttrForm
 
 
@@ -65,6 +65,41 @@ class TaurusAttrFormTest(GenericWidgetTestCase, unittest.TestCase):
     modelnames = ['sys/tg_test/1', None]
 
 
+class TaurusFormProgressiveTest(BaseWidgetTestCase, unittest.TestCase):
+
+    '''
+    Tests for the progressive population of TaurusForm
+    '''
+    _klass = TaurusForm
+    models = ['eval:%d' % i for i in range(25)]
+
+    def setUp(self):
+        BaseWidgetTestCase.setUp(self)
+        self._widget.setProgressive(True)
+        self._widget.setModel(self.models)
+
+    def test_batches(self):
+        """check that the items are created in batches, in model order"""
+        self.assertEqual(len(self._widget._children), 0)
+        self.assertEqual(len(self._widget._pendingChildren),
+                         len(self.models))
+        self.processEvents(repetitions=10)
+        self.assertEqual([w.getModel() for w in self._widget._children],
+                         self.models)
+
+    def test_getItems(self):
+        """check that getItems creates the pending items"""
+        items = self._widget.getItems()
+        self.assertEqual([w.getModel() for w in items], self.models)
+        self.assertEqual(self._widget._pendingChildren, [])
+
+    def test_getItemByModel(self):
+        """check that getItemByModel finds pending items"""
+        item = self._widget.getItemByModel('eval:24')
+        self.assertIsNotNone(item)
+        self.assertEqual(item.getModel(), 'eval:24')
+        self.assertIs(self._widget[24], item)
+
 # if __name__ == "__main__":
 #     unittest.main()
 #    suite = unittest.defaultTestLoader.loadTestsFromTestCase(TaurusFormTest)
@@ -27,9 +27,15 @@
 
 import unittest
 import pytest
+import taurus
+from taurus.core.units import Quantity
 from taurus.test import insertTest
 from taurus.qt.qtgui.test import BaseWidgetTestCase
 from taurus.qt.qtgui.panel import TaurusValue
+from taurus.qt.qtgui.panel.taurusvalue import (CenteredLed,
+                                               DefaultReadWidgetLabel,
+                                               TaurusPlotButton,
+                                               _defaultReadWidgetClasses)
 from taurus.core.tango.test import TangoSchemeTestLauncher
 
 
@@ -78,6 +84,21 @@ class TaurusValueTest(TangoSchemeTestLauncher, BaseWidgetTestCase,
         self.assertEqual(got, expected, msg)
         self.assertMaxDeprecations(maxdepr)
 
+    def test_rawNumeric(self):
+        """Checks the texts of a numeric attribute in raw numeric mode"""
+        model = "tango:" + DEV_NAME + "/double_scalar"
+        attr = taurus.Attribute(model)
+        attr.setRawNumeric(True)
+        try:
+            self.texts(model=model,
+                       expected=("double_scalar", "1.23", "0.00", "mm"))
+            self.assertEqual(self._widget.readWidget().fgRole, 'rvalue')
+            self.assertEqual(self._widget.writeWidget().modelFragmentName,
+                             'wvalue')
+            self.assertNotIsInstance(attr.read().rvalue, Quantity)
+        finally:
+            attr.setRawNumeric(None)
+
     @pytest.mark.flaky
     def test_labelCaseSensitivity(self):
         """Verify that case is respected of in the label widget"""
@@ -97,5 +118,33 @@ class TaurusValueTest(TangoSchemeTestLauncher, BaseWidgetTestCase,
         TangoSchemeTestLauncher.tearDown(self)
         unittest.TestCase.tearDown(self)
 
+@insertTest(helper_name="defaultReadWidgetClass", model="eval:1",
+            expected=DefaultReadWidgetLabel)
+@insertTest(helper_name="defaultReadWidgetClass", model="eval:True",
+            expected=CenteredLed)
+@insertTest(helper_name="defaultReadWidgetClass", model="eval:[1.,2.]",
+            expected=TaurusPlotButton)
+class TaurusValueWidgetClassTest(BaseWidgetTestCase, unittest.TestCase):
+    """
+    Tests for the selection of the default subwidget classes of TaurusValue
+    """
+    _klass = TaurusValue
+
+    def defaultReadWidgetClass(self, model=None, expected=None):
+        """Checks the default read widget class (also when memoised)"""
+        self._widget.setModel(model)
+        for _ in range(2):
+            got = self._widget.getDefaultReadWidgetClass()
+            self.assertIs(got, expected)
+        obj = self._widget.getModelObj()
+        self.assertIs(_defaultReadWidgetClasses(obj.data_format, obj.type),
+                      _defaultReadWidgetClasses(obj.data_format, obj.type))
+
+    def tearDown(self):
+        """Set Model to None"""
+        self._widget.setModel(None)
+        unittest.TestCase.tearDown(self)
+
+
 if __name__ == "__main__":
     pass
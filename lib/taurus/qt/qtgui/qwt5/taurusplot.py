@@ -49,6 +49,7 @@ import taurus
 import taurus.core
 from taurus.core.taurusmanager import getSchemeFromName
 from taurus.core.taurusbasetypes import DataFormat
+from taurus.core.units import magnitude
 # TODO: Tango-centric
 from taurus.core.util.containers import LoopList, CaselessDict, CaselessList
 from taurus.core.util.safeeval import SafeEvaluator
@@ -669,7 +670,7 @@ class TaurusCurve(Qwt5.QwtPlotCurve, TaurusBaseComponent):
             # TODO: Adapt all values to be plotted to the same Unit
             if value:
                 if attr.isNumeric():
-                    self._yValues = numpy.array(value.rvalue.magnitude)
+                    self._yValues = numpy.array(magnitude(value.rvalue))
                 else:
                     self._yValues = numpy.array(value.rvalue)
             else:
@@ -41,6 +41,7 @@ from taurus.external.qt import Qt, Qwt5
 
 import taurus.core
 from taurus.core.taurusattribute import TaurusAttribute
+from taurus.core.units import magnitude
 from taurus.core.util.containers import CaselessDict, CaselessList, ArrayBuffer
 from taurus.qt.qtgui.base import TaurusBaseComponent
 from taurus.qt.qtgui.qwt5 import TaurusPlot
@@ -311,7 +312,7 @@ class TaurusTrendsSet(Qt.QObject, TaurusBaseComponent):
         attr = self.getModelObj()
         if value is not None:
             if attr.isNumeric():
-                v = value.rvalue.magnitude  # TODO: check unit consistency
+                v = magnitude(value.rvalue)  # TODO: check unit consistency
             else:
                 v = value.rvalue
             if numpy.isscalar(v):
@@ -339,7 +340,7 @@ class TaurusTrendsSet(Qt.QObject, TaurusBaseComponent):
                 (min(128, self._maxBufferSize), ntrends), dtype='d'), maxSize=self._maxBufferSize)
         if value is not None:
             if attr.isNumeric():
-                v = value.rvalue.magnitude
+                v = magnitude(value.rvalue)
             else:
                 v = value.rvalue
             try:
@@ -432,11 +433,13 @@ class TaurusTrendsSet(Qt.QObject, TaurusBaseComponent):
                     if not self.parent().getUseArchiving():
                         return
                 elif model.isNumeric():
-                    if not hasattr(value.rvalue, 'magnitude'):
+                    if not (hasattr(value.rvalue, 'magnitude') or
+                            getattr(value, 'units', None) is not None):
+                        # neither a Quantity nor a raw numeric value
                         self._onDroppedEvent(reason='rvalue has no .magnitude')
                         return
                     else:
-                        self._checkDataDimensions(value.rvalue.magnitude)
+                        self._checkDataDimensions(magnitude(value.rvalue))
                 else:
                     self._checkDataDimensions(value.rvalue)
 
@@ -27,11 +27,10 @@
 
 __docformat__ = 'restructuredtext'
 
-from .qtable import *
-from .qlogtable import *
-from .taurustable import *
-from .taurusdbtable import *
-from .taurusvaluestable import *
-from .taurusdevicepropertytable import *
-from .taurusgrid import *
-from .qdictionary import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, [
+    'qtable', 'qlogtable', 'taurustable', 'taurusdbtable', 'taurusvaluestable',
+    'taurusdevicepropertytable', 'taurusgrid', 'qdictionary'])
+
+del __lazyExports
@@ -28,9 +28,12 @@ python :mod:`logging` module"""
 
 from __future__ import absolute_import
 
-from operator import attrgetter
 from builtins import range
 
+import re
+import bisect
+import heapq
+import collections
 import logging
 import logging.handlers
 import datetime
@@ -41,7 +44,8 @@ import click
 import taurus
 from taurus.core.util.log import Logger
 from taurus.core.util.remotelogmonitor import LogRecordStreamHandler, \
-    LogRecordSocketReceiver
+    LogRecordSocketReceiver, LogRecordSelectorReceiver, LogReceiverStats, \
+    selectors
 from taurus.core.util.decorator.memoize import memoized
 
 from taurus.external.qt import Qt
@@ -68,6 +72,8 @@ __LEVEL_BRUSH = {
     taurus.Critical: (Qt.QColor(160, 32, 240), Qt.Qt.white),
 }
 
+__LEVEL_BRUSH_CACHE = {}
+
 
 def getBrushForLevel(level):
     elevel = taurus.Trace
@@ -83,8 +89,11 @@ def getBrushForLevel(level):
         elevel = taurus.Error
     elif level <= taurus.Critical:
         elevel = taurus.Critical
-    f, g = list(map(Qt.QBrush, __LEVEL_BRUSH[elevel]))
-    return f, g
+    brushes = __LEVEL_BRUSH_CACHE.get(elevel)
+    if brushes is None:
+        brushes = tuple(map(Qt.QBrush, __LEVEL_BRUSH[elevel]))
+        __LEVEL_BRUSH_CACHE[elevel] = brushes
+    return brushes
 
 
 gethostname = memoized(socket.gethostname)
@@ -143,6 +152,17 @@ def _get_record_origin_tooltip(rec):
 
 
 class QLoggingTableModel(Qt.QAbstractTableModel, logging.Handler):
+    """A Qt table model (and logging handler) of log records.
+
+    The records are kept in a ring of fixed capacity (the oldest records are
+    discarded) and their formatted columns are cached. The records are
+    indexed by name and level, so that filtering (see :meth:`setFilterLevel`
+    and :meth:`setFilterName`) only visits the matching records and new
+    records are filtered and sorted incrementally.
+
+    Sorting by time in ascending (descending) order is done by arrival
+    order (reverse arrival order).
+    """
 
     DftFont = Qt.QFont("Mono", 8)
     DftColSize = Qt.QSize(80, 20), Qt.QSize(200, 20), \
@@ -152,52 +172,163 @@ class QLoggingTableModel(Qt.QAbstractTableModel, logging.Handler):
         super(Qt.QAbstractTableModel, self).__init__()
         logging.Handler.__init__(self)
         self._capacity = capacity
-        self._records = []
         self._accumulated_records = []
+        self._clear()
+        self._filterLevel = 0
+        self._filterName = None
+        self._nameMatches = {}
+        self._sortKey = None
+        self._reverse = False
         Logger.addRootLogHandler(self)
         self.startTimer(freq * 1000)
 
+    def _clear(self):
+        # ring of [record, time, message, origin] entries. The record with
+        # sequence number seq is in self._ring[seq % capacity] and the
+        # stored records are those with first <= seq < total
+        self._ring = []
+        self._first = 0
+        self._total = 0
+        # (name, levelno) -> deque of the sequence numbers of the records
+        self._byKey = {}
+        # visible rows (in ascending order, see self._reverse): None (all
+        # the records, by arrival order), list of sequence numbers (arrival
+        # order) or sorted list of sort keys (whose last item is the
+        # sequence number) if self._sortKey is set
+        self._rows = None
+
+    def _entry(self, seq):
+        return self._ring[seq % self._capacity]
+
+    # ---------------------------------
+    # filtering and sorting
+    # ---------------------------------
+
+    def setFilterLevel(self, level):
+        """Shows only the records with the given level or above"""
+        if level == self._filterLevel:
+            return
+        self._filterLevel = level
+        self._rebuildRows()
+
+    def setFilterName(self, pattern):
+        """Shows only the records whose name matches (case insensitively)
+        the given regular expression (None or empty string for all)"""
+        if pattern:
+            try:
+                pattern = re.compile(pattern, re.IGNORECASE)
+            except re.error:
+                return
+        else:
+            pattern = None
+        self._filterName = pattern
+        self._nameMatches = {}
+        self._rebuildRows()
+
+    def _isFiltered(self):
+        return self._filterName is not None or self._filterLevel > 0
+
+    def _acceptsKey(self, key):
+        name, levelno = key
+        if levelno < self._filterLevel:
+            return False
+        if self._filterName is None:
+            return True
+        match = self._nameMatches.get(name)
+        if match is None:
+            match = self._filterName.search(name) is not None
+            self._nameMatches[name] = match
+        return match
+
+    def _sortKeyFunc(self, column):
+        def key(seq):
+            entry = self._entry(seq)
+            record = entry[0]
+            if column == LEVEL:
+                return record.levelno, seq
+            elif column == MSG:
+                return self._getMessage(entry), seq
+            elif column == NAME:
+                return record.name, seq
+            return record.process or 0, record.thread or 0, record.name, seq
+        return key
+
+    def _filteredSeqs(self):
+        if not self._isFiltered():
+            return range(self._first, self._total)
+        seqs = [q for k, q in self._byKey.items() if self._acceptsKey(k)]
+        return heapq.merge(*seqs)
+
+    def _rebuildRows(self):
+        self.beginResetModel()
+        if self._sortKey is not None:
+            self._rows = sorted(map(self._sortKey, self._filteredSeqs()))
+        elif self._isFiltered():
+            self._rows = list(self._filteredSeqs())
+        else:
+            self._rows = None
+        self.endResetModel()
+
+    def _rowToSeq(self, row):
+        if self._reverse:
+            row = self.rowCount() - 1 - row
+        if self._rows is None:
+            return self._first + row
+        if self._sortKey is not None:
+            return self._rows[row][-1]
+        return self._rows[row]
+
     # ---------------------------------
     # Qt.QAbstractTableModel overwrite
     # ---------------------------------
 
     def sort(self, column, order=Qt.Qt.AscendingOrder):
-        column2key_map = {LEVEL: attrgetter('levelno'),
-                          TIME: attrgetter('created'),
-                          MSG: attrgetter('msg'),
-                          NAME: attrgetter('name'),
-                          ORIGIN: attrgetter('process', 'thread', 'name'),
-        }
-        self._records = sorted(self._records, key=column2key_map[column],
-                               reverse=order == Qt.Qt.DescendingOrder)
+        self._reverse = order == Qt.Qt.DescendingOrder
+        if column == TIME:
+            self._sortKey = None
+        else:
+            self._sortKey = self._sortKeyFunc(column)
+        self._rebuildRows()
 
     def rowCount(self, index=Qt.QModelIndex()):
-        return len(self._records)
+        if self._rows is None:
+            return self._total - self._first
+        return len(self._rows)
 
     def columnCount(self, index=Qt.QModelIndex()):
         return len(HORIZ_HEADER)
 
     def getRecord(self, index):
-        return self._records[index.row()]
+        return self._entry(self._rowToSeq(index.row()))[0]
+
+    @staticmethod
+    def _getMessage(entry):
+        if entry[2] is None:
+            entry[2] = entry[0].getMessage()
+        return entry[2]
 
     def data(self, index, role=Qt.Qt.DisplayRole):
-        if not index.isValid() or not (0 <= index.row() < len(self._records)):
+        if not index.isValid() or not (0 <= index.row() < self.rowCount()):
             return None
-        record = self.getRecord(index)
+        entry = self._entry(self._rowToSeq(index.row()))
+        record = entry[0]
         column = index.column()
         if role == Qt.Qt.DisplayRole:
             if column == LEVEL:
                 return record.levelname
             elif column == TIME:
-                dt = datetime.datetime.fromtimestamp(record.created)
-                return str(dt)
-                # return dt.strftime("%Y-%m-%d %H:%m:%S.%f")
+                if entry[1] is None:
+                    dt = datetime.datetime.fromtimestamp(record.created)
+                    entry[1] = str(dt)
+                return entry[1]
             elif column == MSG:
-                return record.getMessage()
+                return self._getMessage(entry)
             elif column == NAME:
                 return record.name
             elif column == ORIGIN:
-                return _get_record_origin_str(record)
+                if entry[3] is None:
+                    entry[3] = _get_record_origin_str(record)
+                return entry[3]
         elif role == Qt.Qt.TextAlignmentRole:
             if column in (LEVEL, MSG):
                 return Qt.Qt.AlignLeft | Qt.Qt.AlignVCenter
@@ -281,15 +412,104 @@ class QLoggingTableModel(Qt.QAbstractTableModel, logging.Handler):
     def updatePendingRecords(self):
         if not self._accumulated_records:
             return
-        row_nb = self.rowCount()
         records = self._accumulated_records
         self._accumulated_records = []
-        self._records.extend(records)
-        self.insertRows(row_nb, len(records))
-        if len(self._records) > self._capacity:
-            start = len(self._records) - self._capacity
-            self._records = self._records[start:]
-            self.removeRows(0, start)
+        capacity = self._capacity
+        if len(records) > capacity:
+            records = records[-capacity:]
+        sorted_rows = self._sortKey is not None
+        if sorted_rows:
+            self.layoutAboutToBeChanged.emit()
+            persistent = self.persistentIndexList()
+            persistent_seqs = [self._rowToSeq(i.row()) for i in persistent]
+
+        # discard the oldest records to make room for the new ones
+        first = max(self._first, self._total + len(records) - capacity)
+        if first > self._first:
+            self._discardRecords(first, sorted_rows)
+
+        # store the new records
+        seqs = []
+        total = self._total
+        for record in records:
+            seq = total
+            entry = [record, None, None, None]
+            if len(self._ring) < capacity:
+                self._ring.append(entry)
+            else:
+                self._ring[seq % capacity] = entry
+            key = record.name, record.levelno
+            queue = self._byKey.get(key)
+            if queue is None:
+                queue = self._byKey[key] = collections.deque()
+            queue.append(seq)
+            total += 1
+            if self._acceptsKey(key):
+                seqs.append(seq)
+
+        if sorted_rows:
+            self._total = total
+            for seq in seqs:
+                bisect.insort(self._rows, self._sortKey(seq))
+            self._changePersistentRows(persistent, persistent_seqs)
+            self.layoutChanged.emit()
+        elif seqs:
+            position = 0 if self._reverse else self.rowCount()
+            self.beginInsertRows(Qt.QModelIndex(), position,
+                                 position + len(seqs) - 1)
+            self._total = total
+            if self._rows is not None:
+                self._rows.extend(seqs)
+            self.endInsertRows()
+        else:
+            self._total = total
+
+    def _changePersistentRows(self, indexes, seqs):
+        """Moves the given persistent indexes to the current (sorted) rows
+        of the records with the given sequence numbers (or invalidates them
+        if the records were discarded)"""
+        new_indexes = []
+        for index, seq in zip(indexes, seqs):
+            new_index = Qt.QModelIndex()
+            if seq >= self._first:
+                i = bisect.bisect_left(self._rows, self._sortKey(seq))
+                if i < len(self._rows) and self._rows[i][-1] == seq:
+                    if self._reverse:
+                        i = len(self._rows) - 1 - i
+                    new_index = self.index(i, index.column())
+            new_indexes.append(new_index)
+        self.changePersistentIndexList(indexes, new_indexes)
+
+    def _discardRecords(self, first, sorted_rows):
+        """Discards the records with sequence number below first"""
+        old_first = self._first
+        count = 0
+        if sorted_rows:
+            for seq in range(old_first, first):
+                i = bisect.bisect_left(self._rows, self._sortKey(seq))
+                if i < len(self._rows) and self._rows[i][-1] == seq:
+                    del self._rows[i]
+        else:
+            if self._rows is None:
+                count = first - old_first
+            else:
+                count = bisect.bisect_left(self._rows, first)
+            if count:
+                position = self.rowCount() - count if self._reverse else 0
+                self.beginRemoveRows(Qt.QModelIndex(), position,
+                                     position + count - 1)
+            if self._rows is not None:
+                del self._rows[:count]
+        for seq in range(old_first, first):
+            record = self._entry(seq)[0]
+            key = record.name, record.levelno
+            queue = self._byKey[key]
+            queue.popleft()
+            if not queue:
+                del self._byKey[key]
+        self._first = first
+        if count:
+            self.endRemoveRows()
 
     def emit(self, record):
         self._accumulated_records.append(record)
@@ -299,7 +519,7 @@ class QLoggingTableModel(Qt.QAbstractTableModel, logging.Handler):
 
     def close(self):
         self.flush()
-        del self._records[:]
+        self._clear()
         logging.Handler.close(self)
 
 
@@ -309,26 +529,78 @@ class _LogRecordStreamHandler(LogRecordStreamHandler):
         self.server.data.get('model').emit(record)
 
 
+class _LogRecordSelectorReceiver(LogRecordSelectorReceiver):
+
+    def handleLogRecords(self, records):
+        self.data.get('model').emitRecords(records)
+
+
 class QRemoteLoggingTableModel(QLoggingTableModel):
-    """A remote Qt table that displays the taurus logging messages"""
+    """A remote Qt table that displays the taurus logging messages.
+
+    Unless a (socketserver) handler is given in :meth:`connect_logging`, the
+    records are received with a
+    :class:`~taurus.core.util.remotelogmonitor.LogRecordSelectorReceiver`,
+    and the level and name filters are forwarded to the clients that
+    support it (so that the discarded records are not even sent)"""
+
+    log_receiver = None
 
     def connect_logging(self, host='localhost',
                         port=logging.handlers.DEFAULT_TCP_LOGGING_PORT,
-                        handler=_LogRecordStreamHandler):
-        self.log_receiver = LogRecordSocketReceiver(host=host, port=port,
-                                                    handler=handler, model=self)
+                        handler=None):
+        if handler is None and selectors is not None:
+            self.log_receiver = _LogRecordSelectorReceiver(
+                host=host, port=port, model=self, **self._remoteFilter())
+        else:
+            self.log_receiver = LogRecordSocketReceiver(
+                host=host, port=port,
+                handler=handler or _LogRecordStreamHandler, model=self)
         self.log_thread = threading.Thread(
             target=self.log_receiver.serve_until_stopped)
         self.log_thread.daemon = False
         self.log_thread.start()
 
     def disconnect_logging(self):
-        if not hasattr(self, 'log_receiver') or self.log_receiver is None:
+        if self.log_receiver is None:
             return
         self.log_receiver.stop()
         self.log_thread.join()
         del self.log_receiver
 
+    def emitRecords(self, records):
+        self._accumulated_records.extend(records)
+
+    def _remoteFilter(self):
+        name = self._filterName
+        return dict(level=self._filterLevel or None,
+                    name=None if name is None else name.pattern)
+
+    def _updateRemoteFilter(self):
+        setFilter = getattr(self.log_receiver, 'setFilter', None)
+        if setFilter is not None:
+            setFilter(**self._remoteFilter())
+
+    def setFilterLevel(self, level):
+        QLoggingTableModel.setFilterLevel(self, level)
+        self._updateRemoteFilter()
+
+    def setFilterName(self, pattern):
+        QLoggingTableModel.setFilterName(self, pattern)
+        self._updateRemoteFilter()
+
+    def getStats(self):
+        """Returns the throughput and lag statistics of the receiver since
+        the previous call (or None if not available)
+
+        :return: (dict or None) see
+                 :meth:`~taurus.core.util.remotelogmonitor.LogReceiverStats.snapshot`
+        """
+        stats = getattr(self.log_receiver, 'stats', None)
+        if stats is None:
+            return None
+        return stats.snapshot()
+
 
 class QLoggingTable(Qt.QTableView):
     """A Qt table that displays the taurus logging messages"""
@@ -409,41 +681,30 @@ class LoggingToolBar(FilterToolBar):
 
 
 class QLoggingFilterProxyModel(Qt.QSortFilterProxyModel):
-    """A filter by log record object name"""
+    """A filter by log record object name.
+
+    The filtering and sorting are delegated to the source
+    :class:`QLoggingTableModel`, which does them incrementally using its
+    indexes, so this proxy does not filter nor sort rows by itself.
+    """
 
     def __init__(self, parent=None):
         Qt.QSortFilterProxyModel.__init__(self, parent)
         self._logLevel = taurus.Trace
 
-        # filter configuration
-        self.setFilterCaseSensitivity(Qt.Qt.CaseInsensitive)
-        self.setFilterKeyColumn(0)
-        self.setFilterRole(Qt.Qt.DisplayRole)
-
-        # sort configuration
-        # self.setSortCaseSensitivity(Qt.Qt.CaseInsensitive)
-        # self.setSortRole(Qt.Qt.DisplayRole)
-
-        # general configuration
-
     def setFilterLogLevel(self, level):
         self._logLevel = level
+        self.sourceModel().setFilterLevel(level)
+
+    def setFilterRegExp(self, regexp):
+        self.sourceModel().setFilterName(str(regexp))
+
+    def sort(self, column, order=Qt.Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
 
     def __getattr__(self, name):
         return getattr(self.sourceModel(), name)
 
-    def filterAcceptsRow(self, sourceRow, sourceParent):
-        sourceModel = self.sourceModel()
-        idx = sourceModel.index(sourceRow, NAME, sourceParent)
-        record = self.getRecord(idx)
-        if record.levelno < self._logLevel:
-            return False
-        name = str(sourceModel.data(idx))
-        regexp = self.filterRegExp()
-        if regexp.indexIn(name) != -1:
-            return True
-        return False
-
 
 _W = "Warning: Switching log perspective will erase previous log messages " \
      "from current perspective!"
@@ -629,6 +890,18 @@ def qlogmon_cmd(port, log_name, log_level):
         filterbar.setFilterText(log_name)
     w.getPerspectiveBar().setEnabled(False)
     w.getQModel().connect_logging(host, port)
+
+    stats_label = Qt.QLabel()
+    filterbar.addWidget(stats_label)
+
+    def update_stats():
+        stats = w.getBaseQModel().getStats()
+        if stats is not None:
+            stats_label.setText(LogReceiverStats.format(stats))
+
+    stats_timer = Qt.QTimer(w)
+    stats_timer.timeout.connect(update_stats)
+    stats_timer.start(1000)
     w.show()
     app.exec_()
     w.getQModel().disconnect_logging()
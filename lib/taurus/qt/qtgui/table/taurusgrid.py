@@ -72,74 +72,24 @@ def get_all_models(expressions, limit=1000):
     All devices matching expressions must be obtained.
     For each device only the good attributes are read.
 
-    It practically equals to fandango.get_matching_attributes; check which is better!
-    Move this method to taurus.core.tango.search
+    The expressions are resolved with the (shared)
+    :class:`taurus.core.tango.util.TangoModelResolver`, which caches the
+    device and attribute lists.
     '''
-    # print( 'In TaurusGrid.get_all_models(%s:"%s") ...' % (type(expressions),expressions))
     if isinstance(expressions, string_types):
-        # if any(re.match(s,expressions) for s in ('\{.*\}','\(.*\)','\[.*\]')):
-        ##self.debug( 'evaluating expressions ....')
-        # expressions = list(eval(expressions))
-        # else:
-        ##self.debug( 'expressions as string separated by commas ...')
         expressions = expressions.split(',')
 
     elif isinstance(expressions, (list, tuple, dict)):
-        # self.debug( 'expressions converted from list ...')
         expressions = list(str(e) for e in expressions)
 
-    # self.debug( 'In TaurusGrid.get_all_models(%s:"%s") ...' % (type(expressions),expressions))
     taurus_db = taurus.Authority()
-    # taurus_db = taurus.Authority(os.environ['TANGO_HOST'])
     # WHAAAAAAT????? Someone should get beaten for this line
     if 'SimulationAuthority' in str(type(taurus_db)):
-        # self.trace( 'Using a simulated database ...')
         models = expressions
     else:
-        all_devs = taurus_db.get_device_exported('*')
-        models = []
-        for exp in expressions:
-            # self.trace( 'evaluating exp = "%s"' % exp)
-            exp = str(exp)
-            devs = []
-            targets = []
-            if exp.count('/') == 3:
-                device, attribute = exp.rsplit('/', 1)
-            else:
-                device, attribute = exp, 'State'
-
-            if any(c in device for c in '.*[]()+?'):
-                if '*' in device and '.*' not in device:
-                    device = device.replace('*', '.*')
-                devs = [s for s in all_devs if re_match_low(device, s)]
-            else:
-                devs = [device]
-
-            # self.trace( 'TaurusGrid.get_all_models(): devices matched by %s / %s are %d:' % (device,attribute,len(devs)))
-            # self.debug( '%s' % (devs))
-            for dev in devs:
-                if any(c in attribute for c in '.*[]()+?'):
-                    if '*' in attribute and '.*' not in attribute:
-                        attribute = attribute.replace('*', '.*')
-                    try:
-                        # taurus_dp = taurus.core.taurusdevice.TaurusDevice(dev)
-                        taurus_dp = taurus.core.taurusmanager.TaurusManager().getFactory()().getDevice(
-                            dev)
-                        # self.debug( "taurus_dp = %s"%taurus_dp.getFullName())
-                        attrs = [att.name for att in
-                                 taurus_dp.attribute_list_query(
-                                 ) if re_match_low(attribute, att.name)]
-                        targets.extend(dev + '/' + att for att in attrs)
-                    except Exception as e:
-                        # self.warning( 'ERROR! TaurusGrid.get_all_models(): Unable to get attributes for device %s: %s' % (dev,str(e)))
-                        pass
-                else:
-                    targets.append(dev + '/' + attribute)
-            # print 'TaurusGrid.get_all_models(): targets added by %s are: %s'
-            # % (exp,targets)
-            models.extend(targets)
+        from taurus.core.tango.util import TangoModelResolver
+        models = TangoModelResolver().resolve(expressions)
     models = models[:limit]
-    # print( 'Out of TaurusGrid.get_all_models(...)')
     return models
 
 
@@ -148,14 +98,11 @@ def get_readwrite_models(expressions, limit=1000):
     All devices matching expressions must be obtained.
     For each device only the good attributes are read.
     '''
-    # self.debug( 'In TaurusGrid.get_all_models(%s:"%s") ...' % (type(expressions),expressions))
     if isinstance(expressions, string_types):
         if any(re.match(s, expressions) for s in
                ('\{.*\}', '\(.*\)', '\[.*\]')):
-            # self.trace( 'evaluating expressions ....')
             expressions = list(eval(expressions))
         else:
-            # self.trace( 'expressions as string separated by commas ...')
             expressions = expressions.split(',')
 
     elif isinstance(expressions, (list, tuple, dict)):
@@ -166,41 +113,9 @@ def get_readwrite_models(expressions, limit=1000):
     if 'SimulationAuthority' in str(type(taurus_db)):
         models = expressions
     else:
-        all_devs = taurus_db.get_device_exported('*')
-        models = []
-        for exp in expressions:
-            exp = str(exp)
-            devs = []
-            targets = []
-            if exp.count('/') == 3:
-                device, attribute = exp.rsplit('/', 1)
-            else:
-                device, attribute = exp, 'State'
-
-            if any(c in device for c in '.*[]()+?'):
-                if '*' in device and '.*' not in device:
-                    device = device.replace('*', '.*')
-                devs = [s for s in all_devs if re_match_low(device, s)]
-            else:
-                devs = [device]
-
-            for dev in devs:
-                if any(c in attribute for c in '.*[]()+?'):
-                    if '*' in attribute and '.*' not in attribute:
-                        attribute = attribute.replace('*', '.*')
-                    try:
-                        taurus_dp = taurus.core.taurusmanager.TaurusManager().getFactory()().getDevice(
-                            dev)
-                        attrs = [att.name for att in
-                                 taurus_dp.attribute_list_query(
-                                 ) if re_match_low(attribute,
-                                                   att.name) and att.isReadOnly()]
-                        targets.extend(dev + '/' + att for att in attrs)
-                    except Exception as e:
-                        pass
-                else:
-                    targets.append(dev + '/' + attribute)
-            models.extend(targets)
+        from taurus.core.tango.util import TangoModelResolver
+        models = TangoModelResolver().resolve(
+            expressions, attr_filter=lambda att: att.isReadOnly())
     models = models[:limit]
     return models
 
@@ -273,6 +188,9 @@ class TaurusGrid(QtGui.QFrame, TaurusBaseWidget):
         self._show_attr_labels = True
         self._show_attr_units = True
         self.hideLabels = False
+        self.delayed = False
+        self._cell_values = []
+        self._built_cells = set()
 
         self.defineStyle()
         self.modelsQueue = Queue()
@@ -284,9 +202,12 @@ class TaurusGrid(QtGui.QFrame, TaurusBaseWidget):
     def modelsThread(self):
         modelsThread = self.__modelsThread
         if modelsThread is None:
+            # only the visible cells are loaded, so there is no need for
+            # delaying the start of the models thread
             modelsThread = SingletonWorker(parent=self, name='TaurusGrid',
                                            queue=self.modelsQueue,
-                                           method=modelSetter, cursor=True)
+                                           method=modelSetter, cursor=True,
+                                           sleep=0)
             self.__modelsThread = modelsThread
         return modelsThread
 
@@ -853,6 +774,7 @@ class TaurusGrid(QtGui.QFrame, TaurusBaseWidget):
                     self.table.showRow(table_row)
                 else:
                     self.table.hideRow(table_row)
+        self.materializeVisibleCells()
 
     def show_hide_columns(self):
         """
@@ -870,6 +792,7 @@ class TaurusGrid(QtGui.QFrame, TaurusBaseWidget):
                     self.table.showColumn(table_col)
                 else:
                     self.table.hideColumn(table_col)
+        self.materializeVisibleCells()
 
     def showOthers(self, boolean):
         self._show_others = boolean
@@ -902,13 +825,16 @@ class TaurusGrid(QtGui.QFrame, TaurusBaseWidget):
 
     def build_table(self, values):
         """
-        This is a builder. For all the elements in widgets matrix,
-        just set the corresponding cells of the QTableWidget.
+        This is a builder. It creates a QTableWidget with as many cells as
+        elements in the values matrix. The cell widgets are not created here
+        but only when the cell becomes visible (see
+        :meth:`materializeVisibleCells`)
         """
         self.trace('In TaurusGrid.build_table(%s)' % values)
-        widgets_matrix = self.build_widgets(values, self.showLabels)
-        rows = len(widgets_matrix)
-        cols = rows and len(widgets_matrix[0]) or 0
+        rows = len(values)
+        cols = rows and len(values[0]) or 0
+        self._cell_values = values
+        self._built_cells = set()
 
         table = QtGui.QTableWidget()
         table.setItemDelegate(Delegate(table))
@@ -920,9 +846,6 @@ class TaurusGrid(QtGui.QFrame, TaurusBaseWidget):
 
         table.setRowCount(rows)
         table.setColumnCount(cols)
-        for row in range(len(widgets_matrix)):
-            for col in range(len(widgets_matrix[row])):
-                table.setCellWidget(row, col, widgets_matrix[row][col])
 
         # table.resizeColumnsToContents()
         # table.resizeRowsToContents()
@@ -941,37 +864,116 @@ class TaurusGrid(QtGui.QFrame, TaurusBaseWidget):
             except AttributeError:  # PyQt4
                 hh.setResizeMode(vh.ResizeToContents)
 
+        # cells are created when they are scrolled into view
+        table.verticalScrollBar().valueChanged.connect(
+            self.materializeVisibleCells)
+        table.horizontalScrollBar().valueChanged.connect(
+            self.materializeVisibleCells)
+        table.viewport().installEventFilter(self)
+        Qt.QTimer.singleShot(0, self.materializeVisibleCells)
+
         return table
 
+    def eventFilter(self, obj, event):
+        """Reimplemented to create the cells that become visible when the
+        table viewport is shown or resized"""
+        if (getattr(self, 'table', None) is not None
+                and obj is self.table.viewport()
+                and event.type() in (Qt.QEvent.Show, Qt.QEvent.Resize)):
+            Qt.QTimer.singleShot(0, self.materializeVisibleCells)
+        return QtGui.QFrame.eventFilter(self, obj, event)
+
+    def materializeVisibleCells(self, *args):
+        """Creates the widgets of the cells that are currently visible in
+        the table (and which were not created yet) and schedules the setting
+        of their models"""
+        table = getattr(self, 'table', None)
+        if table is None or not self._cell_values:
+            return
+        viewport = table.viewport()
+        rows, cols = table.rowCount(), table.columnCount()
+        if not rows or not cols:
+            return
+        r0 = max(table.rowAt(0), 0)
+        r1 = table.rowAt(viewport.height() - 1)
+        r1 = rows - 1 if r1 < 0 else r1
+        c0 = max(table.columnAt(0), 0)
+        c1 = table.columnAt(viewport.width() - 1)
+        c1 = cols - 1 if c1 < 0 else c1
+
+        built = 0
+        for row in range(r0, r1 + 1):
+            if table.isRowHidden(row):
+                continue
+            for col in range(c0, c1 + 1):
+                if (row, col) in self._built_cells or table.isColumnHidden(col):
+                    continue
+                self._built_cells.add((row, col))
+                cell_frame = self.build_cell(self._cell_values[row][col])
+                table.setCellWidget(row, col, cell_frame)
+                built += 1
+
+        if built:
+            self.debug('%d cells created in TaurusGrid' % built)
+            if not self.delayed and self.modelsThread.isRunning():
+                self.modelsThread.next()
+
+    def build_cell(self, cell, show_labels=False):
+        """Creates the widget for a cell of the grid: a frame containing a
+        TaurusValue for each model in cell. The models of all the TaurusValues
+        of the cell are set in one go by the models thread.
+
+        :param cell: (list<str>) models of the cell
+
+        :return: (QFrame)
+        """
+        cell_frame = self.create_frame_with_gridlayout()
+        cell_frame.itemClicked.connect(self.onItemClicked)
+        count = 0
+        pending = []
+        for synoptic in sorted(cell):
+            self.debug("processing synoptic %s" % synoptic)
+            name = model = synoptic
+
+            self.debug('Creating TaurusValue with model =  %s' % model)
+            synoptic_value = TaurusValue(cell_frame)
+            pending.append((synoptic_value, model))
+
+            if self.hideLabels:
+                synoptic_value.setLabelWidgetClass(None)
+            else:
+                # DO NOT DELETE THIS LINE!!!
+                synoptic_value.setLabelConfig('label')
+            cell_frame.layout().addWidget(synoptic_value, count, 0)
+            self._widgets_list.append(synoptic_value)
+            count += 1
+        if pending:
+            self.modelsQueue.put((MethodModel(self._setCellModels), pending))
+        return cell_frame
+
+    def _setCellModels(self, pending):
+        """sets the models of a batch of TaurusValues (executed by the models
+        thread) and applies the current labels/units visibility to them"""
+        for synoptic_value, model in pending:
+            try:
+                synoptic_value.setModel(model)
+                if not self._show_attr_labels and synoptic_value.labelWidget():
+                    synoptic_value.labelWidget().hide()
+                if not self._show_attr_units and synoptic_value.unitsWidget():
+                    synoptic_value.unitsWidget().hide()
+            except Exception:
+                self.warning('Cannot set model %s' % model)
+                self.traceback()
+
     def build_widgets(self, values, show_labels=False, width=240, height=20,
                       value_width=120):
-        widgets_matrix = []
-        for row in values:
-            widgets_row = []
-            for cell in row:
-                cell_frame = self.create_frame_with_gridlayout()
-                cell_frame.itemClicked.connect(self.onItemClicked)
-                count = 0
-                for synoptic in sorted(cell):
-                    self.debug("processing synoptic %s" % synoptic)
-                    name = model = synoptic
-
-                    self.debug('Creating TaurusValue with model =  %s' % model)
-                    synoptic_value = TaurusValue(cell_frame)
-                    self.modelsQueue.put((synoptic_value, model))
-
-                    if self.hideLabels:
-                        synoptic_value.setLabelWidgetClass(None)
-                    else:
-                        # DO NOT DELETE THIS LINE!!!
-                        synoptic_value.setLabelConfig('label')
-                    cell_frame.layout().addWidget(synoptic_value, count, 0)
-                    self._widgets_list.append(synoptic_value)
-                    count += 1
-
-                widgets_row.append(cell_frame)
-            widgets_matrix.append(widgets_row)
-        return widgets_matrix
+        """Returns a matrix with the widgets of all the cells of values.
+
+        .. note:: The grid does not use this method anymore (the cells are
+                  created on demand with :meth:`build_cell`)
+        """
+        return [[self.build_cell(cell, show_labels) for cell in row]
+                for row in values]
 
     def onItemClicked(self, item_name):
         self.trace('In TaurusGrid.itemClicked(%s)' % item_name)
@@ -24,9 +24,10 @@
 #############################################################################
 
 from builtins import str
+from future.utils import string_types
 
 from taurus.external.qt import Qt
-from taurus.core.units import Quantity
+from taurus.core.units import Quantity, magnitude
 
 import numpy
 
@@ -34,6 +35,7 @@ import taurus.core
 from taurus.core.taurusbasetypes import (DataFormat, DataType, TaurusEventType,
                                          TaurusElementType)
 from taurus.qt.qtgui.util import PintValidator
+from taurus.qt.qtgui.base import formatArray
 from taurus.qt.qtgui.display import TaurusLabel
 from taurus.qt.qtgui.container import TaurusWidget
 from taurus.core.util.enumeration import Enumeration
@@ -59,11 +61,39 @@ def _value2Quantity(value, units):
     return q
 
 
+def _magnitudeIn(value, units):
+    '''
+    Returns the magnitude of value expressed in the given units, avoiding
+    copies when possible.
+
+    :param value: (Quantity or array) the value. Values that are not
+                  Quantities (e.g. values of attributes in raw numeric mode)
+                  are assumed to be in the units of the attribute
+    :param units: (str or Pint units) the units
+    :return: (numpy.ndarray)
+    '''
+    if isinstance(value, Quantity) and value.units != Quantity(1, units).units:
+        value = value.to(units)
+    return numpy.asarray(magnitude(value))
+
+
 class TaurusValuesIOTableModel(Qt.QAbstractTableModel):
+    '''
+    The model of :class:`TaurusValuesIOTable`.
+
+    The read values are kept as a plain numpy array (a view of the attribute
+    value when no unit conversion is needed), and the cells are fetched
+    in blocks of BLOCK_SIZE x BLOCK_SIZE, so that only the blocks of the
+    visible part of the table are converted (and formatted, see
+    :meth:`setFormat`). The alarm and range masks used for colouring are
+    computed once per value update.
+    '''
     typeCastingMap = {'f': float, 'b': bool,
                       'u': int, 'i': int, 'S': str, 'U': str}
     # Need to have an array
 
+    BLOCK_SIZE = 64
+
     dataChanged = Qt.pyqtSignal('QModelIndex', 'QModelIndex')
 
     def __init__(self, size, parent=None):
@@ -78,6 +108,65 @@ class TaurusValuesIOTableModel(Qt.QAbstractTableModel):
         self.editedIndex = None
         self._editable = False
         self._writeMode = False
+        self._blocks = {}
+        self._masks = None
+        self._format = None
+        self._formatBc = None
+
+    def setFormat(self, format, bc=None):
+        '''
+        Sets the format string used for displaying the numeric read values
+        (see :func:`taurus.qt.qtgui.base.formatArray`). If None (default),
+        the values are not formatted by the model.
+
+        :param format: (str or None) a python format string
+        :param bc: (object) object referred by the ``bc`` fields of the format
+        '''
+        self._format = format
+        self._formatBc = bc
+        self._blocks = {}
+
+    def _getBlockValue(self, row, column):
+        '''Returns the display value of a read cell, converting (and
+        formatting) the whole block of cells that contains it'''
+        size = self.BLOCK_SIZE
+        key = (row // size, column // size)
+        block = self._blocks.get(key)
+        if block is None:
+            r0, c0 = key[0] * size, key[1] * size
+            data = self._rtabledata[r0:r0 + size, c0:c0 + size]
+            if self._format is not None and data.dtype.kind in 'fiu':
+                block = formatArray(self._format, data, self._formatBc)
+            elif data.dtype.kind in 'fbiu':
+                block = data.tolist()
+            else:
+                cast = self.typeCastingMap[data.dtype.kind]
+                block = [[cast(v) for v in r] for r in data]
+            self._blocks[key] = block
+        return block[row % size][column % size]
+
+    def _getMasks(self):
+        '''Returns a tuple of boolean arrays (alarm, invalid) for the read
+        values, computed once per update'''
+        if self._masks is None:
+            data = self._rtabledata
+            alarm = invalid = None
+            if data.dtype.kind in 'fiu':
+                units = self._parent.getCurrentUnits()
+                try:
+                    low, high = [_magnitudeIn(q, units)
+                                 for q in self._attr.alarms]
+                    alarm = (data <= low) | (data >= high)
+                except Exception:
+                    pass
+                try:
+                    low, high = [_magnitudeIn(q, units)
+                                 for q in self._attr.range]
+                    invalid = (data < low) | (data > high)
+                except Exception:
+                    pass
+            self._masks = alarm, invalid
+        return self._masks
 
     def isDirty(self):
         '''returns True if there are user changes. False Otherwise'''
@@ -112,10 +201,10 @@ class TaurusValuesIOTableModel(Qt.QAbstractTableModel):
                     return str(self._modifiedDict[rc])
                 else:
                     return self._modifiedDict[rc]
+            elif not self._writeMode:
+                return self._getBlockValue(*rc)
             else:
                 value = tabledata[rc]
-                if isinstance(value, Quantity):
-                    value = value.magnitude
             # cast the value to a standard python type
             value = self.typeCastingMap[tabledata.dtype.kind](value)
             return value
@@ -157,6 +246,13 @@ class TaurusValuesIOTableModel(Qt.QAbstractTableModel):
                         return Qt.QColor('orange')
                 else:
                     return Qt.QColor('blue')
+            if not self._writeMode:
+                rc = index.row(), index.column()
+                alarm, invalid = self._getMasks()
+                if invalid is not None and invalid[rc]:
+                    return Qt.QColor('gray')
+                if alarm is not None and alarm[rc]:
+                    return Qt.QColor('orange')
             return Qt.QColor('black')
         elif role == Qt.Qt.FontRole:
             if ((index.row(), index.column()) in self._modifiedDict
@@ -199,11 +295,13 @@ class TaurusValuesIOTableModel(Qt.QAbstractTableModel):
 
         self._rowCount = rows
         self._columnCount = columns
-        rvalue = rvalue.reshape(rows, columns)
         if attr.type in [DataType.Integer, DataType.Float]:
             units = self._parent.getCurrentUnits()
-            rvalue = rvalue.to(units)
-        self._rtabledata = rvalue
+            rvalue = _magnitudeIn(rvalue, units)
+        # reshape returns a view (no copy) of the value
+        self._rtabledata = rvalue.reshape(rows, columns)
+        self._blocks = {}
+        self._masks = None
         self._editable = False
         self.dataChanged.emit(self.createIndex(0, 0), self.createIndex(rows - 1, columns - 1))
 
@@ -233,7 +331,7 @@ class TaurusValuesIOTableModel(Qt.QAbstractTableModel):
         if self._attr.getType() in [DataType.Float, DataType.Integer]:
             units = self._parent.getCurrentUnits()
             value = _value2Quantity(value, units)
-            equals = numpy.allclose(rtable_value, value.to(units))
+            equals = numpy.allclose(rtable_value, value.to(units).magnitude)
         else:
             equals = bool(rtable_value == value)
         if not equals:
@@ -267,6 +365,9 @@ class TaurusValuesIOTableModel(Qt.QAbstractTableModel):
         '''
         table = self._wtabledata
         kind = table.dtype.kind
+        units = None
+        if kind in 'fiu':
+            units = self._parent.getCurrentUnits()
         if kind in 'SU':
             table = table.tolist()  # we want to allow the strings to be larger than the original ones
             for (r, c), v in self._modifiedDict.items():
@@ -275,9 +376,8 @@ class TaurusValuesIOTableModel(Qt.QAbstractTableModel):
         else:
             for k, v in self._modifiedDict.items():
                 if kind in ['f', 'i', 'u']:
-                    units = self._parent.getCurrentUnits()
                     q = _value2Quantity(v, units)
-                    table[k] = q
+                    table[k] = q.to(units).magnitude
                 elif kind == 'b':
                     if str(v) == "true":
                         table[k] = True
@@ -288,6 +388,8 @@ class TaurusValuesIOTableModel(Qt.QAbstractTableModel):
         # reshape if needed
         if self._attr.data_format == DataFormat._1D:
             table = table.flatten()
+        if units is not None:
+            table = Quantity(table, units)
         return table
 
     def clearChanges(self):
@@ -345,7 +447,8 @@ class TaurusValuesIOTableModel(Qt.QAbstractTableModel):
                 wvalue = numpy.array(wvalue)
             elif self._attr.type in [DataType.Integer, DataType.Float]:
                 units = self._parent.getCurrentUnits()
-                wvalue = wvalue.to(units)
+                # the write table is modified in place: copy the value
+                wvalue = numpy.array(_magnitudeIn(wvalue, units))
             if self._attr.data_format == DataFormat._1D:
                 rows, columns = numpy.shape(wvalue)[0], 1
                 if rows == 0:
@@ -717,9 +820,26 @@ class TaurusValuesTable(TaurusWidget):
             if raiseException:
                 raise Exception('rvalue is invalid')
             self._tableView.setModel([dim_x, dim_y])
+            self._updateTableFormat()
         self.setWriteMode(self._writeMode)
         self._label.setModel(model)
 
+    def setFormat(self, format):
+        '''Reimplemented from :meth:`TaurusWidget.setFormat` to use the
+        format for the numeric values shown in the table (only if it is a
+        format string)'''
+        TaurusWidget.setFormat(self, format)
+        self._updateTableFormat()
+
+    def _updateTableFormat(self):
+        model = self._tableView.model()
+        if model is None:
+            return
+        if isinstance(self.FORMAT, string_types):
+            model.setFormat(self.FORMAT, bc=self)
+        else:
+            model.setFormat(None)
+
     def handleEvent(self, evt_src, evt_type, evt_value):
         '''see :meth:`TaurusWidget.handleEvent`'''
         #@fixme: in some situations, we may miss some config event because of the qmodel not being set. The whole handleEvent Method and setModel method should be re-thought
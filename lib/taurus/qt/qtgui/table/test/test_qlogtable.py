@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+
+"""Unit tests for the QLoggingTableModel"""
+
+import logging
+import unittest
+
+from taurus.external.qt import Qt
+from taurus.core.util.log import Logger
+from taurus.qt.qtgui.test import BaseWidgetTestCase
+from taurus.qt.qtgui.table.qlogtable import QLoggingTableModel, MSG, TIME
+
+
+def _record(msg, level=logging.INFO, name='test'):
+    return logging.LogRecord(name, level, __file__, 0, msg, None, None)
+
+
+class QLoggingTableModelTestCase(BaseWidgetTestCase, unittest.TestCase):
+    """Tests for the ring, filtering and sorting of QLoggingTableModel"""
+
+    def setUp(self):
+        BaseWidgetTestCase.setUp(self)
+        self.model = QLoggingTableModel(capacity=5)
+        # only the records added by the tests
+        Logger.removeRootLogHandler(self.model)
+
+    def _add(self, *records):
+        for r in records:
+            self.model.emit(r)
+        self.model.updatePendingRecords()
+
+    def _msgs(self):
+        m = self.model
+        return [m.getRecord(m.index(row, 0)).msg
+                for row in range(m.rowCount())]
+
+    def test_eviction(self):
+        """check that the oldest records are discarded"""
+        self._add(*[_record('m%d' % i) for i in range(3)])
+        self.assertEqual(self._msgs(), ['m0', 'm1', 'm2'])
+        self._add(*[_record('m%d' % i) for i in range(3, 8)])
+        self.assertEqual(self._msgs(), ['m3', 'm4', 'm5', 'm6', 'm7'])
+        self._add(*[_record('n%d' % i) for i in range(12)])
+        self.assertEqual(self._msgs(), ['n7', 'n8', 'n9', 'n10', 'n11'])
+
+    def test_filteredReversed(self):
+        """check the inserts with filtered rows in reverse order"""
+        self.model.setFilterLevel(logging.WARNING)
+        self.model.sort(TIME, Qt.Qt.DescendingOrder)
+        self._add(_record('w0', logging.WARNING), _record('i0'),
+                  _record('e0', logging.ERROR))
+        self.assertEqual(self._msgs(), ['e0', 'w0'])
+        self._add(_record('i1'), _record('w1', logging.WARNING),
+                  _record('i2'), _record('i3'))
+        # w0 and i0 are discarded
+        self.assertEqual(self._msgs(), ['w1', 'e0'])
+        self.model.setFilterLevel(0)
+        self.assertEqual(self._msgs(), ['i3', 'i2', 'w1', 'i1', 'e0'])
+
+    def test_sorted(self):
+        """check the inserts with rows sorted by message"""
+        self.model.sort(MSG, Qt.Qt.AscendingOrder)
+        self._add(_record('c'), _record('a'))
+        self._add(_record('b'), _record('e'))
+        self.assertEqual(self._msgs(), ['a', 'b', 'c', 'e'])
+        self._add(_record('d'), _record('a2'))
+        # c is discarded
+        self.assertEqual(self._msgs(), ['a', 'a2', 'b', 'd', 'e'])
+        self.model.sort(MSG, Qt.Qt.DescendingOrder)
+        self._add(_record('f'))
+        self.assertEqual(self._msgs(), ['f', 'e', 'd', 'b', 'a2'])
+
+    def test_persistentIndexes(self):
+        """check that the persistent indexes follow their records when
+        sorted rows are inserted and are invalidated when discarded"""
+        self.model.sort(MSG, Qt.Qt.AscendingOrder)
+        self._add(_record('b'), _record('d'))
+        m = self.model
+        b = Qt.QPersistentModelIndex(m.index(0, MSG))
+        d = Qt.QPersistentModelIndex(m.index(1, MSG))
+        self._add(_record('a'), _record('c'))
+        self.assertEqual((b.row(), d.row()), (1, 3))
+        self.assertEqual(m.getRecord(m.index(d.row(), 0)).msg, 'd')
+        self._add(_record('e'), _record('f'))
+        # b is discarded
+        self.assertFalse(b.isValid())
+        self.assertEqual(d.row(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
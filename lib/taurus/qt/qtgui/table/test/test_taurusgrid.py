@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Unit tests for the on-demand creation of the TaurusGrid cells"""
+
+import unittest
+
+from taurus.qt.qtgui.test import BaseWidgetTestCase
+from taurus.qt.qtgui.table.taurusgrid import TaurusGrid
+
+
+class TaurusGridCellsTestCase(BaseWidgetTestCase, unittest.TestCase):
+    """Tests for the creation of the TaurusGrid cells when they become
+    visible and for the setting of their models in batches"""
+
+    _klass = TaurusGrid
+    ROWS = 50
+    COLS = 3
+
+    def setUp(self):
+        BaseWidgetTestCase.setUp(self)
+        grid = self._widget
+        # the batches are checked in the queue instead of by the thread
+        grid.delayed = True
+        values = [[['eval:%d' % (r * self.COLS + c), 'eval:-1']
+                   for c in range(self.COLS)] for r in range(self.ROWS)]
+        grid.table = grid.build_table(values)
+        grid.layout().addWidget(grid.table, 1, 0)
+        grid.resize(400, 200)
+        grid.show()
+        self.processEvents(repetitions=10)
+        self.table = grid.table
+
+    def tearDown(self):
+        self._widget.close()
+        BaseWidgetTestCase.tearDown(self)
+
+    def _queued(self):
+        items = []
+        while not self._widget.modelsQueue.empty():
+            items.append(self._widget.modelsQueue.get_nowait())
+        return items
+
+    def test_visibleOnly(self):
+        """check that only the visible cells are created"""
+        built = self._widget._built_cells
+        self.assertIn((0, 0), built)
+        self.assertLess(len(built), self.ROWS * self.COLS)
+        self.assertIsNotNone(self.table.cellWidget(0, 0))
+        self.assertIsNone(self.table.cellWidget(self.ROWS - 1, 0))
+
+    def test_scroll(self):
+        """check that the cells are created when scrolled into view"""
+        n = len(self._widget._built_cells)
+        self.table.scrollToBottom()
+        self.processEvents(repetitions=10)
+        self.assertIsNotNone(self.table.cellWidget(self.ROWS - 1, 0))
+        self.assertGreater(len(self._widget._built_cells), n)
+        # the cells already created are not created again
+        w = self.table.cellWidget(self.ROWS - 1, 0)
+        self._widget.materializeVisibleCells()
+        self.assertIs(self.table.cellWidget(self.ROWS - 1, 0), w)
+
+    def test_hidden(self):
+        """check that the cells of hidden rows are not created"""
+        self.table.hideRow(self.ROWS - 1)
+        self.table.scrollToBottom()
+        self.processEvents(repetitions=10)
+        self.assertNotIn((self.ROWS - 1, 0), self._widget._built_cells)
+        self.assertIsNone(self.table.cellWidget(self.ROWS - 1, 0))
+
+    def test_batches(self):
+        """check that one batch is queued per cell and that it sets the
+        models of all the TaurusValues of the cell"""
+        items = self._queued()
+        self.assertEqual(len(items), len(self._widget._built_cells))
+        method_model, pending = items[0]
+        self.assertEqual(len(pending), 2)
+        method_model.setModel(pending)
+        for value, model in pending:
+            self.assertEqual(value.getModelName(), model)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Unit tests for the TaurusValuesIOTableModel"""
+
+import unittest
+
+import numpy
+
+from taurus.external.qt import Qt
+from taurus.core.units import Quantity
+from taurus.core.taurusbasetypes import DataFormat, DataType
+from taurus.qt.qtgui.test import BaseWidgetTestCase
+from taurus.qt.qtgui.table.taurusvaluestable import (TaurusValuesIOTableModel,
+                                                     _magnitudeIn)
+
+
+class _Parent(Qt.QObject):
+    """Stand-in for the TaurusValuesTable that owns the model"""
+
+    def __init__(self, units):
+        Qt.QObject.__init__(self)
+        self.units = units
+
+    def getCurrentUnits(self):
+        return self.units
+
+
+class _AttrValue(object):
+    """Stand-in for the attribute (value) given to the model"""
+
+    def __init__(self, rvalue, wvalue=None, type=DataType.Float,
+                 data_format=DataFormat._1D, alarms=None, range=None):
+        self.rvalue = rvalue
+        self.wvalue = wvalue
+        self.type = type
+        self.data_format = data_format
+        self.alarms = alarms
+        self.range = range
+        self.quality = None
+
+    def getType(self):
+        return self.type
+
+
+class MagnitudeInTestCase(unittest.TestCase):
+    """Tests for _magnitudeIn"""
+
+    def test_conversion(self):
+        m = _magnitudeIn(Quantity([1., 2.], 'm'), 'mm')
+        self.assertEqual(m.tolist(), [1000., 2000.])
+
+    def test_sameUnits(self):
+        """check that no copy is done if the units are the same"""
+        value = Quantity(numpy.arange(3.), 'm')
+        m = _magnitudeIn(value, 'm')
+        self.assertIs(m, value.magnitude)
+
+    def test_raw(self):
+        """check that values that are not Quantities are not converted"""
+        value = numpy.arange(3)
+        self.assertIs(_magnitudeIn(value, 'mm'), value)
+
+
+class TaurusValuesIOTableModelTestCase(BaseWidgetTestCase, unittest.TestCase):
+    """Tests for the block cache, colours and write data of the
+    TaurusValuesIOTableModel"""
+
+    def setUp(self):
+        BaseWidgetTestCase.setUp(self)
+        self.parent = _Parent('mm')
+        self.model = TaurusValuesIOTableModel((0, 0), parent=self.parent)
+        self.model.BLOCK_SIZE = 2
+
+    def _data(self, row, role=Qt.Qt.DisplayRole):
+        return self.model.data(self.model.index(row, 0), role)
+
+    def test_blocks(self):
+        """check that only the blocks of the requested cells are fetched
+        and that they are discarded when a new value is set"""
+        self.model.setAttr(_AttrValue(Quantity(numpy.arange(5.), 'm')))
+        self.assertEqual(self.model.rowCount(), 5)
+        self.assertEqual(self._data(3), 3000.)
+        self.assertEqual(list(self.model._blocks), [(1, 0)])
+        self.assertEqual(self._data(2), 2000.)
+        self.assertEqual(list(self.model._blocks), [(1, 0)])
+        self.model.setAttr(_AttrValue(Quantity(numpy.arange(5.) + 1, 'm')))
+        self.assertEqual(self.model._blocks, {})
+        self.assertEqual(self._data(3), 4000.)
+
+    def test_view(self):
+        """check that the read table is a view of the value if no units
+        conversion is needed"""
+        self.parent.units = 'm'
+        value = Quantity(numpy.arange(4.), 'm')
+        self.model.setAttr(_AttrValue(value))
+        self.assertTrue(numpy.shares_memory(self.model._rtabledata,
+                                            value.magnitude))
+        self.assertEqual([self._data(i) for i in range(4)],
+                         [0., 1., 2., 3.])
+
+    def test_format(self):
+        self.model.setFormat('{:.1f}')
+        self.model.setAttr(_AttrValue(Quantity([1.25, 2.5], 'm')))
+        self.assertEqual([self._data(0), self._data(1)],
+                         ['1250.0', '2500.0'])
+
+    def test_colours(self):
+        """check the colours of the read cells in alarm or out of range
+        (in display units different from the attribute units)"""
+        attr = _AttrValue(Quantity([-1., 2., 3., 5.], 'm'),
+                          alarms=(Quantity(1, 'm'), Quantity(3, 'm')),
+                          range=(Quantity(0, 'm'), Quantity(4, 'm')))
+        self.model.setAttr(attr)
+        colours = [self._data(i, Qt.Qt.ForegroundRole) for i in range(4)]
+        self.assertEqual(colours, [Qt.QColor('gray'), Qt.QColor('black'),
+                                   Qt.QColor('orange'), Qt.QColor('gray')])
+        # the masks are recomputed for new values
+        attr = _AttrValue(Quantity([2., 2., 2., 2.], 'm'),
+                          alarms=attr.alarms, range=attr.range)
+        self.model.setAttr(attr)
+        colours = [self._data(i, Qt.Qt.ForegroundRole) for i in range(4)]
+        self.assertEqual(colours, [Qt.QColor('black')] * 4)
+
+    def test_modifiedWriteData(self):
+        """check that the write data includes the modifications and is
+        given in the display units (as it was when the write table was a
+        Quantity array)"""
+        wvalue = Quantity([1., 2., 3.], 'm')
+        self.model.setAttr(_AttrValue(wvalue, wvalue=wvalue))
+        self.model.setWriteMode(True)
+        self.model.addValue(self.model.index(1, 0), '5 m')
+        self.model.addValue(self.model.index(2, 0), '7')
+        data = self.model.getModifiedWriteData()
+        self.assertIsInstance(data, Quantity)
+        self.assertEqual(data.units, Quantity(1, 'mm').units)
+        self.assertEqual(data.magnitude.tolist(), [1000., 5000., 7.])
+        # the attribute value is not modified
+        self.assertEqual(wvalue.magnitude.tolist(), [1., 2., 3.])
+
+    def test_modifiedWriteDataStr(self):
+        attr = _AttrValue(['a', 'b'], wvalue=['a', 'b'],
+                          type=DataType.String)
+        self.model.setAttr(attr)
+        self.model.setWriteMode(True)
+        self.model.addValue(self.model.index(1, 0), 'longer')
+        data = self.model.getModifiedWriteData()
+        self.assertEqual(data.tolist(), ['a', 'longer'])
+
+
+if __name__ == '__main__':
+    unittest.main()
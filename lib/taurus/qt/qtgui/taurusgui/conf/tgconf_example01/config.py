@@ -72,6 +72,14 @@ SYNOPTIC = ['images/example01.jdw', 'images/syn2.jdw']
 #=========================================================================
 INSTRUMENTS_FROM_POOL = False
 
+#=========================================================================
+# Set LAZY_PANELS to True for creating the widgets of the panels when they
+# are shown for the first time instead of when the GUI starts (the panels
+# given by a widget instance, i.e. with widgetname, are always created at
+# start). If commented out, the T_GUI_LAZY_PANELS custom setting is used
+#=========================================================================
+# LAZY_PANELS = True
+
 #=========================================================================
 # Define panels to be shown.
 # To define a panel, instantiate a PanelDescription object
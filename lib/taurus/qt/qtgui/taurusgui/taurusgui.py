@@ -31,7 +31,9 @@ from builtins import str
 import os
 import sys
 import copy
+import time
 import click
+import functools
 import weakref
 import inspect
 
@@ -135,10 +137,14 @@ class DockWidgetPanel(Qt.QDockWidget, TaurusBaseWidget):
         self.setWindowTitle(name)
         self.setObjectName(name)
         self._custom = False
+        self._widgetFactory = None
+        self._pendingWidgetConfig = None
 
         # store a weakref of the main window
         self._mainwindow = weakref.proxy(mainwindow)
 
+        self.visibilityChanged.connect(self._onVisibilityChanged)
+
     def isCustom(self):
         return self._custom
 
@@ -151,6 +157,47 @@ class DockWidgetPanel(Qt.QDockWidget, TaurusBaseWidget):
     def setPermanent(self, permanent):
         self._permanent = permanent
 
+    def setWidgetFactory(self, factory, classname=None, modulename=None):
+        '''Defers the creation of the widget of this panel until the panel is
+        shown for the first time (or :meth:`ensureWidget` is called).
+
+        Until then, the configuration given to :meth:`applyConfig` for the
+        widget is kept and returned by :meth:`createConfig`.
+
+        :param factory: (callable) called without arguments to create the
+                        widget
+        :param classname: (str) class name of the widget created by factory
+        :param modulename: (str) module name of the widget created by factory
+        '''
+        self._widgetFactory = factory, classname or '', modulename or ''
+        if self.isVisible():
+            self.ensureWidget()
+
+    def ensureWidget(self):
+        '''Creates the widget of this panel if its creation was deferred (see
+        :meth:`setWidgetFactory`)
+
+        :return: (QWidget) the widget of this panel
+        '''
+        if self._widgetFactory is not None:
+            factory = self._widgetFactory[0]
+            self._widgetFactory = None
+            cfg, self._pendingWidgetConfig = self._pendingWidgetConfig, None
+            try:
+                w = factory()
+                self.setWidget(w)
+                if cfg is not None and isinstance(w, BaseConfigurableClass):
+                    w.applyConfig(cfg)
+            except Exception as e:
+                self.error('Cannot create the widget for panel "%s": %r',
+                           self.objectName(), e)
+                self.traceback(level=taurus.Info)
+        return self.widget()
+
+    def _onVisibilityChanged(self, visible):
+        if visible:
+            self.ensureWidget()
+
     def setWidgetFromClassName(self, classname, modulename=None):
         if self.getWidgetClassName() != classname:
             try:
@@ -176,18 +223,30 @@ class DockWidgetPanel(Qt.QDockWidget, TaurusBaseWidget):
             w.setObjectName(wname)
 
     def getWidgetModuleName(self):
+        if self._widgetFactory is not None:
+            return self._widgetFactory[2]
         w = self.widget()
         if w is None:
             return ''
         return w.__module__
 
     def getWidgetClassName(self):
+        if self._widgetFactory is not None:
+            return self._widgetFactory[1]
         w = self.widget()
         if w is None:
             return ''
         return w.__class__.__name__
 
     def applyConfig(self, configdict, depth=-1):
+        if self._widgetFactory is not None:
+            classname = configdict.get('widgetClassName')
+            if classname in (None, self._widgetFactory[1]):
+                # keep the config of the widget until it is created
+                self._pendingWidgetConfig = configdict.get('widget')
+                TaurusBaseWidget.applyConfig(self, configdict, depth)
+                return
+            self._widgetFactory = None
         # create the widget
         try:
             self.setWidgetFromClassName(configdict.get(
@@ -205,7 +264,10 @@ class DockWidgetPanel(Qt.QDockWidget, TaurusBaseWidget):
         configdict = TaurusBaseWidget.createConfig(self, *args, **kwargs)
         configdict['widgetClassName'] = self.getWidgetClassName()
         configdict['widgetModuleName'] = self.getWidgetModuleName()
-        if isinstance(self.widget(), BaseConfigurableClass):
+        if self._widgetFactory is not None:
+            if self._pendingWidgetConfig is not None:
+                configdict['widget'] = self._pendingWidgetConfig
+        elif isinstance(self.widget(), BaseConfigurableClass):
             configdict['widget'] = self.widget().createConfig()
         return configdict
 
@@ -297,6 +359,7 @@ class TaurusGui(TaurusMainWindow):
             self.defaultConfigRecursionDepth = configRecursionDepth
 
         self.__panels = {}
+        self.__panelTimings = {}
         self.__external_app = {}
         self.__external_app_actions = {}
         self._external_app_names = []
@@ -376,7 +439,9 @@ class TaurusGui(TaurusMainWindow):
         TaurusMainWindow.closeEvent(self, event)
         for n, panel in self.__panels.items():
             panel.closeEvent(event)
-            panel.widget().closeEvent(event)
+            w = panel.widget()
+            if w is not None:  # None if the panel was never shown (lazy)
+                w.closeEvent(event)
             if not event.isAccepted():
                 result = Qt.QMessageBox.question(
                     self, 'Closing error',
@@ -618,7 +683,9 @@ class TaurusGui(TaurusMainWindow):
         try:
             # in case the widget is a Taurus one and does some cleaning when
             # setting model to None
-            panel.widget().setModel(None)
+            w = panel.widget()
+            if w is not None:
+                w.setModel(None)
         except:
             pass
 
@@ -718,6 +785,39 @@ class TaurusGui(TaurusMainWindow):
         '''
         return copy.deepcopy(list(self.__panels.keys()))
 
+    def getPanelTimings(self):
+        '''returns the time spent creating the widget of each panel described
+        in the configuration (only for the widgets already created)
+
+        :return: (dict<str,tuple<float,float>>) panel names and the times (in
+                 s) spent creating the widget and setting its model
+        '''
+        return dict(self.__panelTimings)
+
+    def _createPanelWidget(self, paneldesc):
+        '''creates the widget for the given panel description, recording the
+        time spent on it (see :meth:`getPanelTimings`)'''
+        t0 = time.time()
+        w = paneldesc.getWidget(sdm=Qt.qApp.SDM, setModel=False)
+        if hasattr(w, "setCustomWidgetMap"):
+            w.setCustomWidgetMap(self.getCustomWidgetMap())
+        t1 = time.time()
+        if paneldesc.model is not None:
+            w.setModel(paneldesc.model)
+        t2 = time.time()
+        self.__panelTimings[paneldesc.name] = t1 - t0, t2 - t1
+        self.debug('Panel "%s" created in %.3f s (+%.3f s setting the model)',
+                   paneldesc.name, t1 - t0, t2 - t1)
+        return w
+
+    def _logPanelTimings(self):
+        timings = sorted(self.__panelTimings.items(),
+                         key=lambda item: -sum(item[1]))
+        lines = ['%8.3f s %8.3f s  %s' % (create, setmodel, name)
+                 for name, (create, setmodel) in timings]
+        self.info('Panel creation times (widget, model):\n%s',
+                  '\n'.join(lines))
+
     def _setPermanentExternalApps(self, permExternalApps):
         '''creates empty panels for restoring custom panels.
 
@@ -1280,25 +1380,40 @@ class TaurusGui(TaurusMainWindow):
                     if pd is not None:
                         custom_panels.append(pd)
 
+        lazy = getattr(conf, 'LAZY_PANELS', (self.__getVarFromXML(
+            xmlroot, "LAZY_PANELS", str(getattr(
+                tauruscustomsettings, 'T_GUI_LAZY_PANELS', False))
+        ).lower() == 'true'))
+
         for p in custom_panels + poolinstruments:
             try:
                 try:
                     self.splashScreen().showMessage("Creating panel %s" % p.name)
                 except AttributeError:
                     pass
-                w = p.getWidget(sdm=Qt.qApp.SDM, setModel=False)
-                if hasattr(w, "setCustomWidgetMap"):
-                    w.setCustomWidgetMap(self.getCustomWidgetMap())
-                if p.model is not None:
-                    w.setModel(p.model)
+                # the panels of module-level widget instances (widgetname)
+                # are never deferred: their widget already exists
+                lazy_panel = lazy and p.classname is not None
+                if lazy_panel:
+                    w = None
+                else:
+                    w = self._createPanelWidget(p)
                 if p.instrumentkey is None:
                     instrumentkey = self.IMPLICIT_ASSOCIATION
                 # the pool instruments may change when the pool config changes,
                 # so we do not store their config
                 registerconfig = p not in poolinstruments
                 # create a panel
-                self.createPanel(w, p.name, floating=p.floating, registerconfig=registerconfig,
-                                 instrumentkey=instrumentkey, permanent=True)
+                panel = self.createPanel(w, p.name, floating=p.floating,
+                                         registerconfig=registerconfig,
+                                         instrumentkey=instrumentkey,
+                                         permanent=True)
+                if lazy_panel:
+                    # the widget is created when the panel is first shown
+                    panel.setWidgetFactory(
+                        functools.partial(self._createPanelWidget, p),
+                        classname=p.classname.rsplit('.', 1)[-1],
+                        modulename=p.modulename)
             except Exception as e:
                 msg = "Cannot create panel %s" % getattr(
                     p, "name", "__Unknown__")
@@ -1308,6 +1423,8 @@ class TaurusGui(TaurusMainWindow):
                     msg, repr(e)), Qt.QMessageBox.Abort | Qt.QMessageBox.Ignore)
                 if result == Qt.QMessageBox.Abort:
                     sys.exit()
+        if not lazy:
+            self._logPanelTimings()
 
     def _loadCustomToolBars(self, conf, xmlroot):
         """
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+
+"""Unit tests for the lazy creation of the widgets of DockWidgetPanel"""
+
+import unittest
+
+from taurus.external.qt import Qt
+from taurus.qt.qtgui.test import BaseWidgetTestCase
+from taurus.qt.qtgui.container import TaurusWidget
+from taurus.qt.qtgui.taurusgui.taurusgui import DockWidgetPanel
+
+
+class _ConfigWidget(TaurusWidget):
+
+    def __init__(self, parent=None):
+        TaurusWidget.__init__(self, parent)
+        self.value = None
+        self.registerConfigProperty(self.getValue, self.setValue, 'value')
+
+    def getValue(self):
+        return self.value
+
+    def setValue(self, value):
+        self.value = value
+
+
+class DockWidgetPanelTestCase(BaseWidgetTestCase, unittest.TestCase):
+    """Tests for the deferred widgets of DockWidgetPanel"""
+
+    def setUp(self):
+        BaseWidgetTestCase.setUp(self)
+        self.mainwindow = Qt.QMainWindow()
+        self.created = []
+
+    def _factory(self):
+        w = _ConfigWidget()
+        self.created.append(w)
+        return w
+
+    def _lazyPanel(self, name='lazy'):
+        panel = DockWidgetPanel(None, None, name, self.mainwindow)
+        panel.setWidgetFactory(self._factory, classname='_ConfigWidget',
+                               modulename=__name__)
+        return panel
+
+    def test_deferred(self):
+        """check that the widget is created once, when first shown"""
+        panel = self._lazyPanel()
+        self.assertIsNone(panel.widget())
+        self.assertEqual(panel.getWidgetClassName(), '_ConfigWidget')
+        self.assertEqual(panel.getWidgetModuleName(), __name__)
+        self.assertNotIn('widget', panel.createConfig())
+        panel.show()
+        self.processEvents(repetitions=2)
+        self.assertEqual(len(self.created), 1)
+        self.assertIs(panel.widget(), self.created[0])
+        self.assertIs(panel.ensureWidget(), self.created[0])
+        self.assertEqual(len(self.created), 1)
+
+    def test_configRoundTrip(self):
+        """check that the config of a deferred widget is kept until it is
+        created and then applied to it"""
+        eager = DockWidgetPanel(None, self._factory(), 'eager',
+                                self.mainwindow)
+        eager.widget().setValue(42)
+        cfg = eager.createConfig()
+        self.assertEqual(cfg['widgetClassName'], '_ConfigWidget')
+
+        panel = self._lazyPanel()
+        panel.applyConfig(cfg)
+        self.assertIsNone(panel.widget())
+        self.assertEqual(panel.createConfig()['widget'], cfg['widget'])
+        w = panel.ensureWidget()
+        self.assertEqual(w.getValue(), 42)
+        self.assertEqual(panel.createConfig()['widget'], cfg['widget'])
+
+    def test_classMismatch(self):
+        """check that a config for another widget class replaces the
+        factory"""
+        panel = self._lazyPanel()
+        cfg = panel.createConfig()
+        cfg['widgetClassName'] = 'TaurusWidget'
+        cfg['widgetModuleName'] = 'taurus.qt.qtgui.container'
+        panel.applyConfig(cfg)
+        self.assertIsInstance(panel.widget(), TaurusWidget)
+        self.assertNotIsInstance(panel.widget(), _ConfigWidget)
+        panel.ensureWidget()
+        self.assertEqual(self.created, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,482 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Benchmarks of taurus widgets under a synthetic event load.
+
+Each scenario creates a widget (TaurusLabel, TaurusLed, TaurusPlot,
+TaurusTrend, TaurusForm) for some eval attributes and a
+:class:`SyntheticEventGenerator` fires change events for these attributes
+from a python thread, so that they go through the real
+`eventReceived` -> `filterEvent` -> `handleEvent` chain of the widgets.
+The report of a scenario contains:
+
+  - the latency of the events (from the moment they are fired until
+    `handleEvent` returns)
+  - the number of dropped updates (events which did not reach `handleEvent`
+    of a listening component, e.g. because they were discarded by an event
+    filter, merged by the event buffer or not processed in time)
+  - the frame time (duration of the iterations of the event loop in which
+    the widgets were painted)
+  - the growth of the resident memory of the process (Linux only)
+
+Run them with ``taurus gui-benchmark`` (which uses the offscreen Qt platform
+unless QT_QPA_PLATFORM is set).
+"""
+
+from __future__ import print_function
+
+import os
+import gc
+import copy
+import time
+import threading
+import importlib
+import unittest
+
+import click
+import numpy
+
+import taurus
+from taurus import tauruscustomsettings
+from taurus.core.taurusbasetypes import TaurusEventType, TaurusTimeVal
+from taurus.core.units import Quantity
+from taurus.external.qt import Qt
+from taurus.qt.qtgui.base import TaurusBaseComponent
+from taurus.test.benchutil import (clock as _clock, BenchmarkRegistry,
+                                   compareWithBaseline, benchmarkOptions,
+                                   runBenchmarkCmd)
+
+
+__all__ = ["scenario", "getScenarioNames", "SyntheticEventGenerator",
+           "runScenario", "compareReports", "gui_benchmark_cmd"]
+
+__docformat__ = 'restructuredtext'
+
+_SCENARIOS = BenchmarkRegistry()
+
+
+def scenario(name):
+    """Decorator for registering a benchmark scenario.
+
+    The decorated function is called (with a TaurusApplication already
+    created) to prepare the scenario and it must return a (widget,
+    modelnames) tuple, where modelnames is the list of the attributes for
+    which events are generated. It may raise :class:`unittest.SkipTest` if
+    the scenario cannot run.
+
+    :param name: (str) name of the scenario
+    """
+    return _SCENARIOS.register(name)
+
+
+def getScenarioNames(patterns=None):
+    """Returns the names of the registered scenarios
+
+    :param patterns: (seq<str> or None) if given, only the names matching
+                     any of these (fnmatch) patterns are returned
+
+    :return: (list<str>)
+    """
+    return _SCENARIOS.getNames(patterns)
+
+
+def _syntheticValue(rvalue, n):
+    """Returns the n-th synthetic value derived from the given one"""
+    if isinstance(rvalue, (bool, numpy.bool_)):
+        return bool(n % 2)
+    units = getattr(rvalue, 'units', None)
+    magnitude = getattr(rvalue, 'magnitude', rvalue) + n
+    if units is None:
+        return magnitude
+    return Quantity(magnitude, units)
+
+
+class SyntheticEventGenerator(threading.Thread):
+    """Thread that fires change events with synthetic values for a list of
+    attributes at a given rate.
+
+    The values are copies of the current values of the attributes (with
+    their rvalue changed on each event) and they carry the time at which
+    they were fired in their `_benchPostTime` member.
+    """
+
+    def __init__(self, attrs, rate=100., duration=1.):
+        """
+        :param attrs: (seq<TaurusAttribute>) the attributes
+        :param rate: (float) events per second fired for each attribute
+                     (0 for firing them as fast as possible)
+        :param duration: (float) time (in s) during which events are fired
+        """
+        threading.Thread.__init__(self, name='SyntheticEventGenerator')
+        self.daemon = True
+        self._attrs = list(attrs)
+        self._templates = [a.read() for a in self._attrs]
+        self._rate = rate
+        self._duration = duration
+        self._stopEvent = threading.Event()
+        #: number of events fired for each attribute
+        self.posted = 0
+        #: time (in s) spent firing the events
+        self.elapsed = 0.
+
+    def stop(self):
+        """Stops firing events"""
+        self._stopEvent.set()
+
+    def run(self):
+        period = 1. / self._rate if self._rate else 0
+        t = t0 = _clock()
+        t_end = t0 + self._duration
+        while t < t_end and not self._stopEvent.is_set():
+            for attr, template in zip(self._attrs, self._templates):
+                value = copy.copy(template)
+                value.rvalue = _syntheticValue(template.rvalue,
+                                               self.posted + 1)
+                value.time = TaurusTimeVal.now()
+                value._benchPostTime = _clock()
+                attr.fireEvent(TaurusEventType.Change, value)
+            self.posted += 1
+            t_next = t0 + self.posted * period
+            t = _clock()
+            if t_next > t:
+                self._stopEvent.wait(t_next - t)
+                t = _clock()
+        self.elapsed = t - t0
+
+
+class _Probe(Qt.QObject):
+    """Measures the events handled by the taurus components listening to
+    some attributes (by wrapping their `handleEvent`) and counts the paint
+    events of the application (as an application event filter)"""
+
+    def __init__(self, parent=None):
+        Qt.QObject.__init__(self, parent)
+        self.handled = 0
+        self.paints = 0
+        self.latencies = []
+        self.listeners = {}
+        self._components = {}
+
+    def attach(self, attr):
+        """Wraps the `handleEvent` of the components listening to attr"""
+        count = 0
+        for ref in attr._listeners.snapshot():
+            listener = ref()
+            component = getattr(listener, '__self__', listener)
+            if not isinstance(component, TaurusBaseComponent):
+                continue
+            count += 1
+            if id(component) not in self._components:
+                self._components[id(component)] = component
+                self._wrap(component)
+        self.listeners[attr] = count
+        return count
+
+    def detach(self):
+        """Restores the `handleEvent` of the components"""
+        for component in self._components.values():
+            try:
+                del component.handleEvent
+            except Exception:
+                pass  # e.g. the underlying C++ object has been deleted
+        self._components = {}
+
+    def _wrap(self, component):
+        handleEvent = component.handleEvent
+
+        def _handleEvent(evt_src, evt_type, evt_value):
+            try:
+                return handleEvent(evt_src, evt_type, evt_value)
+            finally:
+                t = getattr(evt_value, '_benchPostTime', None)
+                if t is not None:
+                    self.handled += 1
+                    self.latencies.append(_clock() - t)
+
+        component.handleEvent = _handleEvent
+
+    def eventFilter(self, obj, event):
+        if event.type() == Qt.QEvent.Paint:
+            self.paints += 1
+        return False
+
+
+def _getRss():
+    """Returns the resident memory (in bytes) of the process or None if it
+    cannot be determined"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, AttributeError):
+        return None
+
+
+def _percentiles(values, scale=1e3):
+    """Returns the 50, 90, 99 percentiles and the maximum of values (in ms
+    by default), or Nones if there are no values"""
+    if not values:
+        return None, None, None, None
+    values = numpy.array(values) * scale
+    p50, p90, p99 = numpy.percentile(values, (50, 90, 99))
+    return p50, p90, p99, values.max()
+
+
+def _processEvents(app, duration):
+    t_end = _clock() + duration
+    while _clock() < t_end:
+        app.processEvents()
+        time.sleep(.001)
+
+
+def _getApplication():
+    from taurus.qt.qtgui.application import TaurusApplication
+    app = TaurusApplication.instance()
+    if app is None:
+        app = TaurusApplication([], cmd_line_parser=None)
+    return app
+
+
+def runScenario(name, duration=1., rate=100., drain=1.):
+    """Runs a scenario and returns its report
+
+    :param name: (str) name of the scenario
+    :param duration: (float) time (in s) during which events are generated
+    :param rate: (float) events per second for each attribute (0 for
+                 generating them as fast as possible)
+    :param drain: (float) maximum time (in s) waiting for the pending events
+                  to be handled after the generation. The events which are
+                  not handled by then are counted as dropped
+
+    :return: (dict) with the number of generated events (`events`) and
+             their rate (`rate`), the number of updates expected, handled
+             and dropped by the listening components (`expected`,
+             `handled`, `dropped`), the 50, 90, 99 percentiles and maximum
+             of the latency and of the frame time in ms (`latency_p50`, ...,
+             `latency_max`, `frame_p50`, ..., `frame_max`), the number of
+             frames (`frames`), the growth of the resident memory in MiB
+             (`rss_growth`, None if unknown) and the batches delivered by
+             the event dispatcher (`batches`, None if it is not enabled)
+    """
+    app = _getApplication()
+    widget, modelnames = _SCENARIOS[name]()
+    probe = _Probe()
+    try:
+        widget.show()
+        _processEvents(app, .2)
+        attrs = [taurus.Attribute(n) for n in modelnames]
+        if not sum(probe.attach(a) for a in attrs):
+            raise RuntimeError('No taurus component listens to %s'
+                               % ', '.join(modelnames))
+        dispatcher = None
+        if getattr(tauruscustomsettings, 'T_EVENT_DISPATCHER', False):
+            from taurus.qt.qtgui.base.dispatcher import getEventDispatcher
+            dispatcher = getEventDispatcher()
+            batches = dispatcher.dispatchedBatches
+        generator = SyntheticEventGenerator(attrs, rate=rate,
+                                            duration=duration)
+        gc.collect()
+        rss = _getRss()
+        frames = []
+        app.installEventFilter(probe)
+        generator.start()
+        deadline = None
+        while True:
+            if not generator.is_alive():
+                if deadline is None:
+                    deadline = _clock() + drain
+                    expected = generator.posted * sum(probe.listeners.values())
+                if probe.handled >= expected or _clock() > deadline:
+                    break
+            paints, handled = probe.paints, probe.handled
+            t = _clock()
+            app.processEvents()
+            dt = _clock() - t
+            if probe.paints != paints:
+                frames.append(dt)
+            elif probe.handled == handled:
+                time.sleep(.0002)  # idle
+        app.removeEventFilter(probe)
+        gc.collect()
+        rss_growth = None
+        if rss is not None:
+            rss_growth = (_getRss() - rss) / 2. ** 20
+        if dispatcher is not None:
+            batches = dispatcher.dispatchedBatches - batches
+        else:
+            batches = None
+    finally:
+        probe.detach()
+        widget.close()
+        widget.deleteLater()
+        _processEvents(app, .1)
+
+    events = generator.posted * len(attrs)
+    report = dict(events=events,
+                  rate=events / generator.elapsed if generator.elapsed else 0,
+                  expected=expected, handled=probe.handled,
+                  dropped=max(expected - probe.handled, 0),
+                  frames=len(frames), rss_growth=rss_growth, batches=batches)
+    for prefix, values in (('latency', probe.latencies), ('frame', frames)):
+        for suffix, value in zip(('p50', 'p90', 'p99', 'max'),
+                                 _percentiles(values)):
+            report['%s_%s' % (prefix, suffix)] = value
+    return report
+
+
+def compareReports(reports, baseline, tolerance=.2):
+    """Compares the 99 percentiles of the latency and the frame time of
+    scenario reports with a baseline
+
+    :param reports: (dict) scenario names and reports (see
+                    :func:`runScenario`)
+    :param baseline: (dict) scenario names and baseline reports
+    :param tolerance: (float) relative increase of the latency or frame time
+                      which is considered a regression
+
+    :return: (dict) scenario names and (ratio, regression) tuples, where
+             ratio is the largest ratio of the reported to the baseline
+             percentiles (None if the scenario is not in the baseline) and
+             regression is a bool
+    """
+    return compareWithBaseline(reports, baseline, _getReportRatio,
+                               tolerance, increase=True)
+
+
+def _getReportRatio(report, base):
+    ratios = [report[k] / base[k] for k in ('latency_p99', 'frame_p99')
+              if report[k] is not None and base[k]]
+    return max(ratios) if ratios else None
+
+
+# ---------------------------------------------------------------------------
+# scenarios
+# ---------------------------------------------------------------------------
+
+def _plotClass(name):
+    """Returns the TaurusPlot or TaurusTrend class of the available plot
+    module"""
+    for modname in ('taurus.qt.qtgui.qwt5', 'taurus.qt.qtgui.tpg'):
+        try:
+            return getattr(importlib.import_module(modname), name)
+        except Exception:
+            pass
+    raise unittest.SkipTest('%s is not available' % name)
+
+
+@scenario('label')
+def _label():
+    from taurus.qt.qtgui.display import TaurusLabel
+    w = TaurusLabel()
+    w.setModel('eval:Q("0mm")')
+    return w, ['eval:Q("0mm")']
+
+
+@scenario('led')
+def _led():
+    from taurus.qt.qtgui.display import TaurusLed
+    w = TaurusLed()
+    w.setModel('eval:False')
+    return w, ['eval:False']
+
+
+@scenario('plot')
+def _plot():
+    w = _plotClass('TaurusPlot')()
+    w.setModel(['eval:zeros(1024)'])
+    return w, ['eval:zeros(1024)']
+
+
+@scenario('trend')
+def _trend():
+    w = _plotClass('TaurusTrend')()
+    w.setModel(['eval:Q("0s")'])
+    return w, ['eval:Q("0s")']
+
+
+@scenario('form')
+def _form():
+    from taurus.qt.qtgui.panel import TaurusForm
+    modelnames = ['eval:Q("%dV")' % i for i in range(20)]
+    w = TaurusForm()
+    w.setModel(modelnames)
+    return w, modelnames
+
+
+# ---------------------------------------------------------------------------
+# command line interface
+# ---------------------------------------------------------------------------
+
+def _fmt(value, fmt='%9.2f'):
+    return '%9s' % '-' if value is None else fmt % value
+
+
+def _formatReport(name, report):
+    return '%-10s %9.0f %9d %9d %s %s %9d %s %s' % (
+        name, report['rate'], report['handled'], report['dropped'],
+        _fmt(report['latency_p50']), _fmt(report['latency_p99']),
+        report['frames'], _fmt(report['frame_p99']),
+        _fmt(report['rss_growth']))
+
+
+@click.command('gui-benchmark')
+@benchmarkOptions('reports', 'relative increase of the p99 latency or frame '
+                             + 'time considered a regression')
+@click.option('--duration', type=float, default=2., show_default=True,
+              help='time (in s) during which events are generated')
+@click.option('--rate', type=float, default=100., show_default=True,
+              help='events per second for each model (0 for as fast as '
+                   + 'possible)')
+@click.option('--dispatcher', is_flag=True, default=False,
+              help='enable the T_EVENT_DISPATCHER custom setting')
+def gui_benchmark_cmd(patterns, list_only, save_file, baseline_file,
+                      tolerance, duration, rate, dispatcher):
+    """Run the benchmarks of taurus widgets under synthetic event load (or
+    those whose scenario matches PATTERNS)
+
+    Exits with status 1 if there are regressions compared to the baseline.
+    """
+    def _prepare():
+        if dispatcher:
+            tauruscustomsettings.T_EVENT_DISPATCHER = True
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        _getApplication()
+
+    header = '%-10s %9s %9s %9s %9s %9s %9s %9s %9s' % (
+        'scenario', 'events/s', 'handled', 'dropped', 'lat50[ms]',
+        'lat99[ms]', 'frames', 'frm99[ms]', 'mem[MiB]')
+    runBenchmarkCmd(_SCENARIOS, patterns, list_only,
+                    lambda name: runScenario(name, duration=duration,
+                                             rate=rate),
+                    compareReports, header, _formatReport,
+                    save_file=save_file, baseline_file=baseline_file,
+                    tolerance=tolerance, key='reports',
+                    metadata=dict(qt=Qt.qVersion(), duration=duration,
+                                  rate=rate, dispatcher=dispatcher),
+                    prepare=_prepare, width=10)
+
+
+if __name__ == '__main__':
+    gui_benchmark_cmd()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+
+"""Test for taurus.qt.qtgui.test.benchmark"""
+
+__docformat__ = 'restructuredtext'
+
+import unittest
+
+from taurus.qt.qtgui.test import BaseWidgetTestCase
+from taurus.qt.qtgui.test.benchmark import (getScenarioNames, runScenario,
+                                            compareReports)
+
+
+class GuiBenchmarkTestCase(BaseWidgetTestCase, unittest.TestCase):
+
+    def test_names(self):
+        """Check the selection of scenarios by pattern"""
+        self.assertEqual(getScenarioNames(['l*']), ['label', 'led'])
+
+    def test_label(self):
+        """Check that the events reach the widget and are reported"""
+        report = runScenario('label', duration=.2, rate=50., drain=2.)
+        self.assertGreater(report['events'], 0)
+        self.assertEqual(report['handled'] + report['dropped'],
+                         report['expected'])
+        self.assertGreater(report['handled'], 0)
+        self.assertLessEqual(report['latency_p50'], report['latency_max'])
+        self.assertIsNone(report['batches'])
+
+    def test_compare(self):
+        """Check the detection of regressions"""
+        baseline = {'a': dict(latency_p99=1., frame_p99=1.),
+                    'b': dict(latency_p99=1., frame_p99=1.)}
+        reports = {'a': dict(latency_p99=1.1, frame_p99=.5),
+                   'b': dict(latency_p99=1., frame_p99=2.),
+                   'c': dict(latency_p99=1., frame_p99=1.)}
+        self.assertEqual(compareReports(reports, baseline, tolerance=.2),
+                         {'a': (1.1, False), 'b': (2., True),
+                          'c': (None, False)})
+
+
+if __name__ == '__main__':
+    unittest.main()
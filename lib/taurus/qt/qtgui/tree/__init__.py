@@ -27,6 +27,8 @@
 
 __docformat__ = 'restructuredtext'
 
-from .qtree import *
-from .taurustree import *
-from .taurusdbtree import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, ['qtree', 'taurustree', 'taurusdbtree'])
+
+del __lazyExports
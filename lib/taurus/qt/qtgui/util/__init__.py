@@ -28,11 +28,11 @@ configuration, actions."""
 
 __docformat__ = 'restructuredtext'
 
-from .taurusactionfactory import *
-from .taurusaction import *
-from .tauruscolor import *
-from .tauruswidgetfactory import *
-from .taurusscreenshot import *
-from .qdraganddropdebug import *
-from .ui import *
-from .validator import *
+from taurus.core.util.lazyimport import lazyExports as __lazyExports
+
+__lazyExports(__name__, [
+    'taurusactionfactory', 'taurusaction', 'tauruscolor',
+    'tauruswidgetfactory', 'taurusscreenshot', 'qdraganddropdebug', 'ui',
+    'validator'])
+
+del __lazyExports
@@ -50,6 +50,22 @@ T_FORM_CUSTOM_WIDGET_MAP = \
 #: True sets the preferred mode of TaurusForms to use "compact" widgets
 T_FORM_COMPACT = False
 
+#: Progressive population of TaurusForms: if True, the items of the forms
+#: are created in small batches (visible rows first) while the models are
+#: resolved in background, instead of all at once when the model is set
+T_FORM_PROGRESSIVE = False
+
+#: If True, the taurus events of the widgets are delivered to the Qt thread
+#: by a central dispatcher (one cross-thread notification per batch of
+#: events instead of one queued signal per widget and event)
+T_EVENT_DISPATCHER = False
+
+#: If True, the widgets of the panels described in a TaurusGui configuration
+#: are created (and their models set) when the panel is shown for the first
+#: time instead of when the GUI starts. It can be overridden by the
+#: LAZY_PANELS option of the GUI configuration
+T_GUI_LAZY_PANELS = False
+
 #: Strict RFC3986 URI names in models.
 #: True makes Taurus only use the strict URI names
 #: False enables a backwards-compatibility mode for pre-sep3 model names
@@ -57,7 +73,9 @@ STRICT_MODEL_NAMES = False
 
 
 #: Lightweight imports:
-#: True enables delayed imports (may break older code).
+#: True enables delayed imports (may break older code). This includes the
+#: packages of taurus.qt.qtgui, whose modules are then imported when their
+#: names are first accessed (with python >= 3.7)
 #: False (or commented out) for backwards compatibility
 LIGHTWEIGHT_IMPORTS = False
 
@@ -96,11 +114,33 @@ pass
 #: 'Serial', 'Concurrent', or 'TangoSerial' (default)
 TANGO_SERIALIZATION_MODE = 'TangoSerial'
 
+#: If True, the event subscriptions of the attributes of a Tango device are
+#: not done when the attributes are created or listened, but in batches per
+#: device by a worker thread (the attributes are polled until subscribed)
+TANGO_BATCH_SUBSCRIPTION = False
+
+#: If True, the read and write values of numerical Tango attributes are
+#: plain numbers or numpy arrays instead of Quantity objects (the units are
+#: available in the `units` member of the values). It can also be set per
+#: attribute with `TangoAttribute.setRawNumeric`
+TANGO_RAW_NUMERIC = False
+
+#: Time (in s) that the lists of exported devices and of device attributes
+#: are cached by the TangoModelResolver (used e.g. by TaurusGrid)
+TANGO_MODEL_RESOLVER_TTL = 60
+
 #: PLY (lex/yacc) optimization: 1=Active (default) , 0=disabled.
 #: Set PLY_OPTIMIZE = 0 if you are getting yacc exceptions while loading
 #: synoptics
 PLY_OPTIMIZE = 1
 
+#: Cache the result of parsing JDraw synoptic files (keyed by the hash of
+#: the file contents) to speed up subsequent loads of the same file.
+JDRAW_PARSE_CACHE = True
+
+#: Directory for the JDraw parse cache. If None, ~/.taurus/jdraw_cache is used
+JDRAW_CACHE_DIR = None
+
 # Taurus namespace  # TODO: NAMESPACE setting seems to be unused. remove?
 NAMESPACE = 'taurus'
 
@@ -114,6 +154,18 @@ DEFAULT_QT_API = 'pyqt'
 #: Auto initialize Qt logging to python logging
 QT_AUTO_INIT_LOG = True
 
+#: If True, taurus objects (models, widgets, ...) share the logger of their
+#: class instead of registering a logger per object in the logging module
+#: (the log records are then named after the class instead of the object)
+LOG_PER_CLASS = False
+
+#: If True, the configuration of the configurable widgets (e.g. the
+#: TaurusConfig settings of TaurusMainWindow and the files written by
+#: saveConfigFile) is stored in the compact binary format of
+#: taurus.qt.qtcore.configuration instead of as a pickled dict. Both formats
+#: are always readable, but older taurus versions cannot read the binary one
+CONFIG_BINARY_FORMAT = False
+
 #: Remove input hook (only valid for PyQt4)
 QT_AUTO_REMOVE_INPUTHOOK = True
 
@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Benchmarks of the core taurus paths: creation of models by the factories,
+name validation, reading of eval attributes, event dispatching and polling.
+
+They use the eval and res schemes and (if PyTango is installed) a stand-in of
+a Tango attribute (see :mod:`taurus.core.tango.test.bench_decode`), so no
+control system is needed. Run them with ``taurus benchmark``.
+"""
+
+from __future__ import print_function
+
+import itertools
+import unittest
+
+import click
+import numpy
+
+import taurus
+from taurus.core.taurusbasetypes import TaurusEventType
+from taurus.test.benchutil import (clock as _clock, BenchmarkRegistry,
+                                   compareWithBaseline, benchmarkOptions,
+                                   runBenchmarkCmd)
+
+
+__all__ = ["benchmark", "getBenchmarkNames", "runBenchmark",
+           "compareResults", "benchmark_cmd"]
+
+__docformat__ = 'restructuredtext'
+
+_BENCHMARKS = BenchmarkRegistry()
+
+
+def benchmark(name):
+    """Decorator for registering a benchmark.
+
+    The decorated function is called once to prepare the benchmark and it
+    must return the operation to be measured (a callable without
+    arguments). It may raise :class:`unittest.SkipTest` if the benchmark
+    cannot run.
+
+    :param name: (str) name of the benchmark
+    """
+    return _BENCHMARKS.register(name)
+
+
+def getBenchmarkNames(patterns=None):
+    """Returns the names of the registered benchmarks
+
+    :param patterns: (seq<str> or None) if given, only the names matching
+                     any of these (fnmatch) patterns are returned
+
+    :return: (list<str>)
+    """
+    return _BENCHMARKS.getNames(patterns)
+
+
+def runBenchmark(name, duration=1., warmup=.1):
+    """Runs a benchmark and returns its throughput and latencies
+
+    :param name: (str) name of the benchmark
+    :param duration: (float) time (in s) spent running the operation
+    :param warmup: (float) time (in s) running the operation before the
+                   measurement
+
+    :return: (dict) with the number of operations (`ops`), operations per
+             second (`ops_per_s`) and the 50, 90 and 99 percentiles and
+             maximum of the latency in microseconds (`p50`, `p90`, `p99`
+             and `max`)
+    """
+    op = _BENCHMARKS[name]()
+    t_end = _clock() + warmup
+    while _clock() < t_end:
+        op()
+    latencies = []
+    t0 = t = _clock()
+    t_end = t0 + duration
+    while t < t_end:
+        op()
+        t1 = _clock()
+        latencies.append(t1 - t)
+        t = t1
+    latencies = numpy.array(latencies) * 1e6
+    p50, p90, p99 = numpy.percentile(latencies, (50, 90, 99))
+    return dict(ops=len(latencies), ops_per_s=len(latencies) / (t - t0),
+                p50=p50, p90=p90, p99=p99, max=latencies.max())
+
+
+def compareResults(results, baseline, tolerance=.2):
+    """Compares the throughput of benchmark results with a baseline
+
+    :param results: (dict) benchmark names and results (see
+                    :func:`runBenchmark`)
+    :param baseline: (dict) benchmark names and baseline results
+    :param tolerance: (float) relative decrease of the throughput which is
+                      considered a regression
+
+    :return: (dict) benchmark names and (ratio, regression) tuples, where
+             ratio is the throughput relative to the baseline (None if the
+             benchmark is not in the baseline) and regression is a bool
+    """
+    return compareWithBaseline(
+        results, baseline, lambda r, b: r['ops_per_s'] / b['ops_per_s'],
+        tolerance)
+
+
+# ---------------------------------------------------------------------------
+# benchmarks
+# ---------------------------------------------------------------------------
+
+class _Listener(object):
+
+    def eventReceived(self, src, evt_type, evt_value):
+        pass
+
+
+@benchmark('validator.eval')
+def _validateEval():
+    v = taurus.Factory('eval').getAttributeNameValidator()
+    return lambda: v.getUriGroups('eval:a=2;a*{eval:1}')
+
+
+@benchmark('factory.eval.create')
+def _createEval():
+    counter = itertools.count()
+    return lambda: taurus.Attribute('eval:%d' % next(counter))
+
+
+def _getCached(name):
+    attr = taurus.Attribute(name)
+
+    def op():
+        # attr is referenced here to keep it in the factory cache
+        return attr is taurus.Attribute(name)
+    return op
+
+
+@benchmark('factory.eval.cached')
+def _getCachedEval():
+    return _getCached('eval:1')
+
+
+@benchmark('factory.res')
+def _getRes():
+    taurus.Factory('res').reloadResource(obj={'taurus_bench': 'eval:2'},
+                                         name='taurus_bench')
+    return _getCached('res:taurus_bench')
+
+
+@benchmark('eval.read.scalar')
+def _readScalar():
+    attr = taurus.Attribute('eval:2*3')
+    return lambda: attr.read(cache=False)
+
+
+@benchmark('eval.read.spectrum')
+def _readSpectrum():
+    attr = taurus.Attribute('eval:rand(1024)')
+    return lambda: attr.read(cache=False)
+
+
+@benchmark('eval.read.references')
+def _readReferences():
+    attr = taurus.Attribute('eval:{eval:1}+{eval:2}')
+    return lambda: attr.read(cache=False)
+
+
+def _withListeners(name, n=10):
+    attr = taurus.Attribute(name)
+    listeners = [_Listener() for _ in range(n)]
+    for listener in listeners:
+        attr.addListener(listener)
+    attr._bench_listeners = listeners  # keep them alive
+    return attr
+
+
+@benchmark('event.dispatch')
+def _dispatchEvent():
+    attr = _withListeners('eval:1')
+    value = attr.read()
+    return lambda: attr.fireEvent(TaurusEventType.Change, value)
+
+
+@benchmark('event.poll')
+def _poll():
+    return _withListeners('eval:rand()').poll
+
+
+def _tangoDecode(value, **kwargs):
+    try:
+        from taurus.core.tango.test.bench_decode import (FakeAttribute,
+                                                         deviceAttribute)
+        from taurus.core.tango.tangoattribute import TangoAttrValue
+    except ImportError as e:
+        raise unittest.SkipTest('PyTango not available (%s)' % e)
+    attr = FakeAttribute(**kwargs)
+    p = deviceAttribute(value)
+    return lambda: TangoAttrValue(attr=attr, pytango_dev_attr=p)
+
+
+@benchmark('tango.decode.scalar')
+def _decodeScalar():
+    return _tangoDecode(1.)
+
+
+@benchmark('tango.decode.spectrum')
+def _decodeSpectrum():
+    from taurus.core.taurusbasetypes import DataFormat
+    return _tangoDecode(numpy.arange(1024.), data_format=DataFormat._1D)
+
+
+# ---------------------------------------------------------------------------
+# command line interface
+# ---------------------------------------------------------------------------
+
+def _formatResult(name, result):
+    return ('%-24s %12.0f %9.1f %9.1f %9.1f %9.1f'
+            % (name, result['ops_per_s'], result['p50'], result['p90'],
+               result['p99'], result['max']))
+
+
+@click.command('benchmark')
+@benchmarkOptions('results',
+                  'relative decrease of ops/s considered a regression')
+@click.option('--duration', type=float, default=1., show_default=True,
+              help='time (in s) spent on each benchmark')
+def benchmark_cmd(patterns, list_only, save_file, baseline_file, tolerance,
+                  duration):
+    """Run the benchmarks of the core taurus paths (or those matching
+    PATTERNS)
+
+    Exits with status 1 if there are regressions compared to the baseline.
+    """
+    header = ('benchmark', 'ops/s', 'p50[us]', 'p90[us]', 'p99[us]', 'max[us]')
+    runBenchmarkCmd(_BENCHMARKS, patterns, list_only,
+                    lambda name: runBenchmark(name, duration=duration),
+                    compareResults, '%-24s %12s %9s %9s %9s %9s' % header,
+                    _formatResult, save_file=save_file,
+                    baseline_file=baseline_file, tolerance=tolerance,
+                    key='results', metadata=dict(duration=duration))
+
+
+if __name__ == '__main__':
+    benchmark_cmd()
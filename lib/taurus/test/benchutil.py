@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+"""Utilities shared by the benchmark commands of taurus (see
+:mod:`taurus.test.benchmark` and :mod:`taurus.qt.qtgui.test.benchmark`):
+a registry of named benchmarks, the comparison of their results with a
+baseline and the handling of the common command line options.
+"""
+
+import sys
+import json
+import time
+import fnmatch
+import platform
+import unittest
+from collections import OrderedDict
+
+import click
+
+import taurus
+
+
+__all__ = ["clock", "BenchmarkRegistry", "compareWithBaseline",
+           "benchmarkOptions", "runBenchmarkCmd"]
+
+__docformat__ = 'restructuredtext'
+
+try:
+    clock = time.perf_counter
+except AttributeError:  # python 2
+    clock = time.time
+
+
+class BenchmarkRegistry(object):
+    """Ordered collection of benchmark setup functions, indexed by name"""
+
+    def __init__(self):
+        self._setups = OrderedDict()
+
+    def __getitem__(self, name):
+        return self._setups[name]
+
+    def register(self, name):
+        """Returns a decorator which registers a setup function with the
+        given name
+
+        :param name: (str) name of the benchmark
+        """
+        def _register(setup):
+            self._setups[name] = setup
+            return setup
+        return _register
+
+    def getNames(self, patterns=None):
+        """Returns the names of the registered benchmarks
+
+        :param patterns: (seq<str> or None) if given, only the names
+                         matching any of these (fnmatch) patterns are
+                         returned
+
+        :return: (list<str>)
+        """
+        names = list(self._setups)
+        if patterns:
+            names = [n for n in names
+                     if any(fnmatch.fnmatchcase(n, p) for p in patterns)]
+        return names
+
+
+def compareWithBaseline(results, baseline, getRatio, tolerance=.2,
+                        increase=False):
+    """Compares benchmark results with a baseline
+
+    :param results: (dict) benchmark names and results
+    :param baseline: (dict) benchmark names and baseline results
+    :param getRatio: (callable) called with a result and its baseline
+                     result, it returns their ratio (or None if they cannot
+                     be compared)
+    :param tolerance: (float) relative change of the ratio which is
+                      considered a regression
+    :param increase: (bool) if True, an increase of the ratio is a
+                     regression (e.g. for latencies). Otherwise a decrease
+                     is (e.g. for throughputs)
+
+    :return: (dict) benchmark names and (ratio, regression) tuples, where
+             ratio is None if the benchmark cannot be compared with the
+             baseline and regression is a bool
+    """
+    ret = {}
+    for name, result in results.items():
+        base = baseline.get(name)
+        ratio = None if base is None else getRatio(result, base)
+        if ratio is None:
+            ret[name] = None, False
+        elif increase:
+            ret[name] = ratio, ratio > 1 + tolerance
+        else:
+            ret[name] = ratio, ratio < 1 - tolerance
+    return ret
+
+
+def benchmarkOptions(what, tolerance_help):
+    """Decorator adding to a click command the PATTERNS argument and the
+    --list, --save, --baseline and --tolerance options handled by
+    :func:`runBenchmarkCmd`
+
+    :param what: (str) name of the benchmarked items in the help texts
+                 (e.g. "results")
+    :param tolerance_help: (str) help text of the --tolerance option
+    """
+    decorators = [
+        click.argument('patterns', nargs=-1),
+        click.option('--list', 'list_only', is_flag=True, default=False,
+                     help='list the benchmarks and exit'),
+        click.option('--save', 'save_file', default=None,
+                     type=click.Path(dir_okay=False, writable=True),
+                     help='store the %s in FILE (to be used as a baseline)'
+                          % what),
+        click.option('--baseline', 'baseline_file', default=None,
+                     type=click.Path(exists=True, dir_okay=False),
+                     help='compare the %s with the ones stored in FILE'
+                          % what),
+        click.option('--tolerance', type=float, default=.2,
+                     show_default=True, help=tolerance_help),
+    ]
+
+    def _decorate(f):
+        for decorator in reversed(decorators):
+            f = decorator(f)
+        return f
+    return _decorate
+
+
+def runBenchmarkCmd(registry, patterns, list_only, run, compare, header,
+                    formatLine, save_file=None, baseline_file=None,
+                    tolerance=.2, key='results', metadata=None,
+                    prepare=None, width=24):
+    """Implements a benchmark command: runs the benchmarks of registry
+    matching patterns (or lists them), prints a line for each of them,
+    stores the results and compares them with a baseline.
+
+    Exits with status 1 if there are regressions compared to the baseline.
+
+    :param registry: (BenchmarkRegistry) the benchmarks
+    :param patterns: (seq<str>) fnmatch patterns selecting the benchmarks
+    :param list_only: (bool) if True, only list the selected benchmarks
+    :param run: (callable) called with a benchmark name, it returns its
+                result (a dict). It may raise :class:`unittest.SkipTest`
+    :param compare: (callable) called with results, baseline and
+                    tolerance, it returns the output of
+                    :func:`compareWithBaseline`
+    :param header: (str) header of the table of results
+    :param formatLine: (callable) called with a benchmark name and its
+                       result, it returns its line in the table of results
+    :param save_file: (str or None) file where the results are stored
+    :param baseline_file: (str or None) file with the baseline results
+    :param tolerance: (float) tolerance passed to compare
+    :param key: (str) key of the results in the stored files
+    :param metadata: (dict or None) extra information to be stored with
+                     the results
+    :param prepare: (callable or None) called before running the benchmarks
+    :param width: (int) width of the column of the names in the table
+
+    :return: (OrderedDict) benchmark names and results
+    """
+    names = registry.getNames(patterns)
+    if list_only:
+        for name in names:
+            click.echo(name)
+        return OrderedDict()
+    baseline = {}
+    if baseline_file is not None:
+        with open(baseline_file) as f:
+            baseline = json.load(f)[key]
+    if prepare is not None:
+        prepare()
+
+    results = OrderedDict()
+    click.echo(header)
+    for name in names:
+        try:
+            result = run(name)
+        except unittest.SkipTest as e:
+            click.echo('%-*s skipped: %s' % (width, name, e))
+            continue
+        results[name] = result
+        line = formatLine(name, result)
+        if baseline:
+            ratio, regression = compare({name: result}, baseline,
+                                        tolerance)[name]
+            if ratio is not None:
+                line += '  %5.2fx' % ratio
+                if regression:
+                    line += ' REGRESSION'
+        click.echo(line)
+
+    if save_file is not None:
+        data = dict(taurus=taurus.Release.version,
+                    python=platform.python_version())
+        data.update(metadata or {})
+        data[key] = results
+        with open(save_file, 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+    comparison = compare(results, baseline, tolerance)
+    regressions = [n for n, (_, r) in comparison.items() if r]
+    if regressions:
+        click.echo('Regressions: %s' % ', '.join(regressions))
+        sys.exit(1)
+    return results
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Test for taurus.test.benchmark"""
+
+__docformat__ = 'restructuredtext'
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from click.testing import CliRunner
+
+from taurus.test import insertTest
+from taurus.test.benchmark import (getBenchmarkNames, runBenchmark,
+                                   compareResults, benchmark_cmd)
+
+
+@insertTest(helper_name='check', name='validator.eval')
+@insertTest(helper_name='check', name='factory.res')
+@insertTest(helper_name='check', name='eval.read.references')
+@insertTest(helper_name='check', name='event.poll')
+class BenchmarkTestCase(unittest.TestCase):
+
+    def check(self, name):
+        """Check that a benchmark runs and reports its results"""
+        result = runBenchmark(name, duration=.05, warmup=0)
+        self.assertGreater(result['ops'], 0)
+        self.assertGreater(result['ops_per_s'], 0)
+        self.assertLessEqual(result['p50'], result['p99'])
+        self.assertLessEqual(result['p99'], result['max'])
+
+    def test_names(self):
+        """Check the selection of benchmarks by pattern"""
+        self.assertEqual(getBenchmarkNames(['eval.read.s*']),
+                         ['eval.read.scalar', 'eval.read.spectrum'])
+
+    def test_compare(self):
+        """Check the detection of regressions"""
+        baseline = {'a': {'ops_per_s': 100.}, 'b': {'ops_per_s': 100.}}
+        results = {'a': {'ops_per_s': 90.}, 'b': {'ops_per_s': 70.},
+                   'c': {'ops_per_s': 1.}}
+        self.assertEqual(compareResults(results, baseline, tolerance=.2),
+                         {'a': (.9, False), 'b': (.7, True),
+                          'c': (None, False)})
+
+    def test_cmd_baseline(self):
+        """Check that the results are stored and compared"""
+        dirname = tempfile.mkdtemp()
+        try:
+            fname = os.path.join(dirname, 'baseline.json')
+            runner = CliRunner()
+            result = runner.invoke(benchmark_cmd, ['event.dispatch',
+                                                   '--duration', '0.05',
+                                                   '--save', fname])
+            self.assertEqual(result.exit_code, 0, result.output)
+            with open(fname) as f:
+                data = json.load(f)
+            self.assertEqual(list(data['results']), ['event.dispatch'])
+            # an unreachable baseline must be reported as a regression
+            data['results']['event.dispatch']['ops_per_s'] *= 1e6
+            with open(fname, 'w') as f:
+                json.dump(data, f)
+            result = runner.invoke(benchmark_cmd, ['event.dispatch',
+                                                   '--duration', '0.05',
+                                                   '--baseline', fname])
+            self.assertEqual(result.exit_code, 1, result.output)
+            self.assertIn('REGRESSION', result.output)
+        finally:
+            shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':
+    unittest.main()
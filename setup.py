@@ -69,8 +69,11 @@ install_requires = [
 if LooseVersion(__version__) < LooseVersion('20.2'):
     if sys.version_info < (3, 4):
         install_requires.append('enum34')
+    if sys.version_info < (3, 2):
+        install_requires.append('futures')
 else:
     install_requires.append('enum34;python_version<"3.4"')
+    install_requires.append('futures;python_version<"3.2"')
 
 
 extras_require = {
@@ -111,7 +114,10 @@ taurus_subcommands = [
     'demo = taurus.qt.qtgui.panel.taurusdemo:demo_cmd',
     'logmon = taurus.core.util.remotelogmonitor:logmon_cmd',
     'qlogmon = taurus.qt.qtgui.table.qlogtable:qlogmon_cmd',
-    'check-deps = taurus.core.taurushelper:check_dependencies_cmd'
+    'check-deps = taurus.core.taurushelper:check_dependencies_cmd',
+    'importtime = taurus.cli.importtime:importtime_cmd',
+    'benchmark = taurus.test.benchmark:benchmark_cmd',
+    'gui-benchmark = taurus.qt.qtgui.test.benchmark:gui_benchmark_cmd',
 ]
 
 model_selectors = [